@@ -5,10 +5,20 @@ Algorithmes de recherche et évaluation
 
 from .evaluators import MaterialEvaluator, MobilityEvaluator, AdvancedEvaluator
 from .search import SearchStats, minimax, alphabeta
+from .transposition import TranspositionTable, Bound
+from .parallel import ParallelSearcher, parallel_choose_move
+from .book import OpeningBook, build_book
+from .tablebase import Tablebase, Outcome, build_tablebase
+from .batch import BatchEvaluator
 from .ai_player import AIPlayer, Difficulty
 
 __all__ = [
     'MaterialEvaluator', 'MobilityEvaluator', 'AdvancedEvaluator',
     'SearchStats', 'minimax', 'alphabeta',
+    'TranspositionTable', 'Bound',
+    'ParallelSearcher', 'parallel_choose_move',
+    'OpeningBook', 'build_book',
+    'Tablebase', 'Outcome', 'build_tablebase',
+    'BatchEvaluator',
     'AIPlayer', 'Difficulty'
 ]
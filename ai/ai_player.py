@@ -1,12 +1,17 @@
 """
 Joueur IA avec trois niveaux de difficulté
 """
+import random
 from enum import Enum
 from interfaces.player import IPlayer
 from models.board import Board
 from models.move import Move
 from .evaluators import MaterialEvaluator, MobilityEvaluator, AdvancedEvaluator
 from .search import choose_move, SearchStats
+from .transposition import TranspositionTable
+from .parallel import ParallelSearcher
+from .book import OpeningBook
+from .tablebase import Tablebase
 
 
 class Difficulty(Enum):
@@ -19,35 +24,124 @@ class Difficulty(Enum):
 class AIPlayer(IPlayer):
     """Joueur contrôlé par l'IA"""
     
-    def __init__(self, difficulty: Difficulty):
+    def __init__(
+        self,
+        difficulty: Difficulty,
+        tt_size_mb: float = 16,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+        workers: int = 1,
+        deterministic: bool = False,
+        profile: bool = False,
+        book_path: str | None = None,
+        book_random: bool = False,
+        book_seed: int | None = None,
+        tablebase_path: str | None = None
+    ):
+        """
+        Args:
+            difficulty: Niveau de l'IA
+            tt_size_mb: Taille de la table de transposition (0 pour la désactiver)
+            time_limit: Budget de temps par coup en secondes (approfondissement itératif)
+            node_limit: Budget de nœuds par coup (approfondissement itératif)
+            workers: Nombre de processus pour la recherche parallèle à la racine
+            deterministic: Recherche parallèle reproductible (sans alpha partagé)
+            profile: Mesurer le temps par phase de chaque recherche séquentielle
+                     (voir get_stats().to_json())
+            book_path: Bibliothèque d'ouvertures consultée avant toute recherche
+            book_random: Tirer les coups de la bibliothèque au hasard selon leurs poids
+                         (sinon: le coup de plus fort poids)
+            book_seed: Graine du tirage (parties reproductibles)
+            tablebase_path: Répertoire des tables de finales (voir ai.tablebase)
+                            consultées pendant la recherche
+        """
+        if workers > 1 and (time_limit is not None or node_limit is not None):
+            raise ValueError("La recherche parallèle ne supporte pas de budget (time_limit/node_limit)")
         self.difficulty = difficulty
         self.last_stats: SearchStats | None = None
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.workers = workers
+        self.deterministic = deterministic
+        self.profile = profile
+        self.book = OpeningBook(book_path) if book_path else None
+        self._book_rng = random.Random(book_seed) if book_random else None
+        self.tablebase_path = tablebase_path
+        self.tablebase = Tablebase(tablebase_path) if tablebase_path else None
+        self._parallel: ParallelSearcher | None = None
+        self._tt_size_mb = tt_size_mb
         
         # Configuration selon la difficulté
         if difficulty == Difficulty.EASY:
             self.depth = 2
             self.evaluator = MaterialEvaluator()
             self.use_alphabeta = False  # Minimax simple
+            self.quiescence = False
         elif difficulty == Difficulty.MEDIUM:
             self.depth = 4
             self.evaluator = MobilityEvaluator()
             self.use_alphabeta = True  # Alpha-Beta
+            self.quiescence = True  # captures en attente résolues aux feuilles
         else:  # HARD
             self.depth = 7
             self.evaluator = AdvancedEvaluator()
             self.use_alphabeta = True  # Alpha-Beta
+            self.quiescence = True
+        
+        # Table conservée d'un coup à l'autre: le travail précédent est réutilisé
+        self.transposition_table: TranspositionTable | None = None
+        if self.use_alphabeta and tt_size_mb > 0:
+            self.transposition_table = TranspositionTable(tt_size_mb)
     
     def choose_move(self, board: Board) -> Move:
-        """Choisit le meilleur coup"""
+        """Choisit le meilleur coup (bibliothèque d'ouvertures, puis recherche)"""
+        if self.book is not None:
+            move = self.book.choose(board, self._book_rng)
+            if move is not None:
+                self.last_stats = SearchStats()
+                return move
+        
+        if self.workers > 1:
+            return self._choose_move_parallel(board)
+        
         move, stats = choose_move(
             board, 
             self.depth, 
             self.evaluator, 
-            self.use_alphabeta
+            self.use_alphabeta,
+            self.transposition_table,
+            self.time_limit,
+            self.node_limit,
+            self.quiescence,
+            self.profile,
+            self.tablebase
+        )
+        self.last_stats = stats
+        return move
+    
+    def _choose_move_parallel(self, board: Board) -> Move:
+        """Recherche répartie sur un pool de processus (créé au premier appel)"""
+        if self._parallel is None:
+            self._parallel = ParallelSearcher(self.workers, self.deterministic, self._tt_size_mb,
+                                              self.tablebase_path)
+        move, stats = self._parallel.choose_move(
+            board, self.depth, self.evaluator, self.use_alphabeta, self.quiescence
         )
         self.last_stats = stats
         return move
     
+    def close(self) -> None:
+        """Libère les processus de la recherche parallèle, la bibliothèque et les tables"""
+        if self._parallel is not None:
+            self._parallel.close()
+            self._parallel = None
+        if self.book is not None:
+            self.book.close()
+            self.book = None
+        if self.tablebase is not None:
+            self.tablebase.close()
+            self.tablebase = None
+    
     def get_name(self) -> str:
         """Nom du joueur IA"""
         return f"IA {self.difficulty.name.capitalize()}"
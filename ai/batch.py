@@ -0,0 +1,190 @@
+"""
+Évaluation par lots avec NumPy (dépendance optionnelle)
+
+Les positions sont empilées dans un tableau d'entiers (K, 4): masques des
+pièces blanches, des pièces noires, des dames, puis la valeur du joueur au
+trait (voir models.bitboard et models.types.Player). Les termes des
+évaluateurs sont calculés par opérations sur les masques de toutes les
+positions à la fois, dans le même ordre que les évaluateurs d'origine: les
+scores sont identiques. La table pièce-case de l'évaluateur (matériel,
+position) est lue octet par octet des masques dans des tables de 256 sommes.
+
+La mobilité compte par masques les coups simples et les prises de pions en
+un seul saut. Les positions où une dame peut capturer ou une rafle
+continuer (le compte demande de suivre les rafles) sont évaluées une à une
+par l'évaluateur d'origine.
+
+Chaque appel coûte un temps fixe (une centaine d'opérations NumPy): le
+gain est net pour de grands lots (étiquetage de parties d'auto-jeu), pas
+pour les quelques enfants d'un nœud frontière. La recherche n'évalue par
+lots que si on lui passe un BatchEvaluator.
+"""
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy n'est nécessaire que pour ce module
+    np = None
+
+_bitwise_count = getattr(np, 'bitwise_count', None)  # NumPy >= 2.0
+
+from interfaces.evaluator import IBatchEvaluator, PositionTuple
+from models.bitboard import FULL_MASK, ROW_MASKS, shift
+from models.board import Board
+from models.game_state import get_king_directions, get_pawn_directions
+from models.piece_square import PieceSquareTable
+from models.types import Player
+from .evaluators import SCORE_SCALE, AdvancedEvaluator, BaseEvaluator, MaterialEvaluator, MobilityEvaluator
+
+WHITE, BLACK, KINGS, SIDE = range(4)  # colonnes du tableau de positions
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("L'évaluation par lots nécessite NumPy (pip install numpy)")
+
+
+def positions_to_array(positions: Sequence[PositionTuple]) -> "np.ndarray":
+    """Empile des positions (blancs, noirs, dames, trait) en tableau (K, 4)"""
+    _require_numpy()
+    return np.array(positions, dtype=np.int64).reshape(-1, 4)
+
+
+def boards_to_array(boards: Sequence[Board]) -> "np.ndarray":
+    """Empile des plateaux en tableau (K, 4)"""
+    return positions_to_array([
+        (board.white, board.black, board.kings, board.current_player.value) for board in boards
+    ])
+
+
+def board_from_row(row) -> Board:
+    """Plateau d'une ligne du tableau de positions"""
+    return Board(int(row[WHITE]), int(row[BLACK]), int(row[KINGS]), Player(int(row[SIDE])))
+
+
+def popcount(masks: "np.ndarray") -> "np.ndarray":
+    """Nombre de bits à 1 de chaque masque 32 bits (tableau int64)"""
+    if _bitwise_count is not None:
+        return _bitwise_count(masks).astype(np.int64)
+    masks = masks - ((masks >> 1) & 0x55555555)
+    masks = (masks & 0x33333333) + ((masks >> 2) & 0x33333333)
+    masks = (masks + (masks >> 4)) & 0x0F0F0F0F
+    return ((masks * 0x01010101) & FULL_MASK) >> 24
+
+
+class BatchEvaluator(IBatchEvaluator):
+    """
+    Version vectorisée d'un évaluateur (MaterialEvaluator, MobilityEvaluator
+    ou AdvancedEvaluator, poids compris)
+
+    evaluate(board) délègue à l'évaluateur d'origine; evaluate_array note un
+    tableau de positions en un appel.
+    """
+
+    def __init__(self, evaluator: BaseEvaluator):
+        _require_numpy()
+        if not isinstance(evaluator, (MaterialEvaluator, MobilityEvaluator, AdvancedEvaluator)):
+            raise TypeError(f"Évaluateur non vectorisable: {evaluator.get_name()}")
+        self.evaluator = evaluator
+        # _byte_sums[type de pièce, octet, valeur]: somme de la table sur les
+        # cases des bits à 1 de cet octet du masque
+        values = np.array(evaluator.piece_square_table().values, dtype=np.int64).reshape(4, 4, 8)
+        bits = (np.arange(256)[:, None] >> np.arange(8)) & 1
+        self._byte_sums = np.einsum('kbi,vi->kbv', values, bits)
+
+    def evaluate(self, board: Board) -> float:
+        return self.evaluator.evaluate(board)
+
+    def piece_square_table(self) -> PieceSquareTable:
+        return self.evaluator.piece_square_table()
+
+    def evaluate_positions(self, positions: Sequence[PositionTuple]) -> List[float]:
+        return self.evaluate_array(positions_to_array(positions)).tolist()
+
+    def evaluate_boards(self, boards: Sequence[Board]) -> "np.ndarray":
+        """Scores d'une liste de plateaux"""
+        return self.evaluate_array(boards_to_array(boards))
+
+    def evaluate_array(self, positions: "np.ndarray") -> "np.ndarray":
+        """
+        Scores d'un tableau de positions (K, 4)
+
+        Returns:
+            Tableau de K scores (float64), du point de vue du joueur au trait
+        """
+        positions = np.asarray(positions, dtype=np.int64).reshape(-1, 4)
+        evaluator = self.evaluator
+        white_to_move = positions[:, SIDE] == Player.WHITE.value
+        kings = positions[:, KINGS]
+
+        # Termes incrémentaux (voir BaseEvaluator._calculate_incremental)
+        table_score = self._table_score(positions[:, WHITE], positions[:, BLACK], kings)
+        scores = np.where(white_to_move, table_score, -table_score) / SCORE_SCALE
+        if isinstance(evaluator, MaterialEvaluator):
+            return scores
+
+        # Mobilité par masques; les positions où le compte demande de suivre
+        # les rafles sont évaluées une à une
+        white_moves, white_exact = self._move_counts(
+            positions[:, WHITE], positions[:, BLACK], kings, Player.WHITE)
+        black_moves, black_exact = self._move_counts(
+            positions[:, BLACK], positions[:, WHITE], kings, Player.BLACK)
+        mobility = np.where(white_to_move, white_moves - black_moves, black_moves - white_moves)
+        scores = scores + mobility * evaluator.MOBILITY_WEIGHT
+
+        for index in np.flatnonzero(~(white_exact & black_exact)):
+            scores[index] = evaluator.evaluate(board_from_row(positions[index]))
+        return scores
+
+    def _table_score(self, white: "np.ndarray", black: "np.ndarray", kings: "np.ndarray") -> "np.ndarray":
+        """Somme de la table pièce-case (point de vue des Blancs, voir PieceSquareTable.score)"""
+        score = np.zeros(len(white), dtype=np.int64)
+        for kind, masks in enumerate((white & ~kings, white & kings, black & ~kings, black & kings)):
+            for byte in range(4):
+                score += self._byte_sums[kind, byte][(masks >> (8 * byte)) & 0xFF]
+        return score
+
+    @staticmethod
+    def _move_counts(pieces, enemies, kings, player: Player):
+        """
+        Nombre de coups légaux d'une couleur, et positions où ce compte est exact
+
+        Exact: coups simples (pions d'une case, dames sur toute la diagonale)
+        ou, la capture étant obligatoire, prises de pions en un seul saut.
+        Une capture par une dame, une rafle qui peut continuer ou une prise
+        qui promeut (la nouvelle dame peut continuer) n'est pas comptée
+        (voir GameState._find_capture_sequences).
+        """
+        empty = ~(pieces | enemies) & FULL_MASK
+        pawns = pieces & ~kings
+        promotion_row = ROW_MASKS[0] if player == Player.WHITE else ROW_MASKS[7]
+        simple = np.zeros(len(pieces), dtype=np.int64)
+        jumps = np.zeros(len(pieces), dtype=np.int64)
+        inexact = np.zeros(len(pieces), dtype=bool)
+
+        for direction in get_pawn_directions(player):
+            steps = shift(pawns, direction)
+            simple += popcount(steps & empty)
+            landings = shift(steps & enemies, direction) & empty
+            if not landings.any():
+                continue
+            jumps += popcount(landings)
+            inexact |= (landings & promotion_row) != 0
+            # Un pion ne capture que vers l'avant: la pièce prise et la case de
+            # départ sont derrière lui, seules les cases libres comptent
+            for follow in get_pawn_directions(player):
+                inexact |= (shift(shift(landings, follow) & enemies, follow) & empty) != 0
+
+        own_kings = pieces & kings
+        if own_kings.any():
+            for direction in get_king_directions():
+                frontier = shift(own_kings, direction)
+                while frontier.any():
+                    inexact |= (shift(frontier & enemies, direction) & empty) != 0
+                    simple += popcount(frontier & empty)
+                    frontier = shift(frontier & empty, direction)
+
+        return np.where(jumps > 0, jumps, simple), ~inexact
+
+    def get_name(self) -> str:
+        return self.evaluator.get_name()
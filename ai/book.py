@@ -0,0 +1,234 @@
+"""
+Bibliothèque d'ouvertures
+
+Fichier binaire trié (entiers petit-boutistes):
+    MAGIC (7 octets) + version (1 octet) + nombre d'entrées (uint32)
+    puis les entrées, triées par clé: clé de Zobrist de la position (uint64),
+    masque des captures (uint32), case de départ (uint8), case d'arrivée
+    (uint8), poids (uint16)
+
+Une position peut avoir plusieurs entrées consécutives (une par coup).
+La recherche est une dichotomie directement dans le fichier projeté en
+mémoire (mmap): O(log n), sans chargement. Les coups sont retrouvés parmi
+les coups légaux (départ, arrivée, captures), ce qui écarte les collisions.
+
+La construction cherche chaque coup des positions atteintes pendant les
+N premiers demi-coups, et garde ceux dont le score est proche du meilleur.
+"""
+import mmap
+import random
+import struct
+from typing import Dict, List, Tuple
+
+from interfaces.evaluator import IEvaluator
+from models.board import Board
+from models.game_state import GameState
+from models.move import Move
+from .ordering import MoveOrderer
+from .search import SearchContext, SearchStats, alphabeta
+from .transposition import TranspositionTable
+
+MAGIC = b'DAMBOOK'
+VERSION = 1
+
+_HEADER = struct.Struct('<7sBI')
+_ENTRY = struct.Struct('<QIBBH')
+_KEY = struct.Struct('<Q')
+
+MAX_WEIGHT = 0xFFFF
+
+
+class OpeningBook:
+    """
+    Lecture d'une bibliothèque d'ouvertures par mmap
+
+    À fermer avec close() (ou gestionnaire de contexte).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{path} n'est pas une bibliothèque d'ouvertures")
+        magic, version, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} n'est pas une bibliothèque d'ouvertures (version {VERSION})")
+        if len(self._map) != _HEADER.size + self._count * _ENTRY.size:
+            raise ValueError(f"{path}: bibliothèque tronquée")
+
+    def __len__(self) -> int:
+        """Nombre d'entrées (coups) de la bibliothèque"""
+        return self._count
+
+    def lookup(self, key: int) -> List[Tuple[int, int, int, int]]:
+        """
+        Entrées d'une position par dichotomie
+
+        Returns:
+            Liste de (départ, arrivée, captures, poids)
+        """
+        data = self._map
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (entry_key,) = _KEY.unpack_from(data, _HEADER.size + middle * _ENTRY.size)
+            if entry_key < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        entries = []
+        for index in range(low, self._count):
+            entry_key, captures, start, end, weight = _ENTRY.unpack_from(
+                data, _HEADER.size + index * _ENTRY.size
+            )
+            if entry_key != key:
+                break
+            entries.append((start, end, captures, weight))
+        return entries
+
+    def probe(self, board: Board) -> List[Tuple[Move, int]]:
+        """Coups de la bibliothèque pour cette position: liste de (coup légal, poids)"""
+        entries = self.lookup(board.zobrist_key)
+        if not entries:
+            return []
+        legal_moves = {
+            (move.from_square, move.to_square, move.captures): move
+            for move in GameState(board).generate_legal_moves()
+        }
+        return [
+            (legal_moves[(start, end, captures)], weight)
+            for start, end, captures, weight in entries
+            if (start, end, captures) in legal_moves
+        ]
+
+    def choose(self, board: Board, rng: random.Random | None = None) -> Move | None:
+        """
+        Choisit un coup de la bibliothèque (None si la position n'y est pas)
+
+        rng: Tirage au hasard pondéré par les poids; sans générateur, le coup
+             de plus fort poids est retenu
+        """
+        candidates = self.probe(board)
+        if not candidates:
+            return None
+        if rng is None:
+            return max(candidates, key=lambda candidate: candidate[1])[0]
+        moves, weights = zip(*candidates)
+        return rng.choices(moves, weights=weights)[0]
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "OpeningBook":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_book(path: str, positions: Dict[int, List[Tuple[Move, int]]]) -> int:
+    """
+    Écrit une bibliothèque triée
+
+    positions: clé de Zobrist -> liste de (coup, poids)
+
+    Returns:
+        Le nombre d'entrées écrites
+    """
+    entries = sorted(
+        (key, -weight, move.from_square, move.to_square, move.captures)
+        for key, moves in positions.items()
+        for move, weight in moves
+    )
+    with open(path, 'wb') as output:
+        output.write(_HEADER.pack(MAGIC, VERSION, len(entries)))
+        for key, negative_weight, start, end, captures in entries:
+            weight = min(-negative_weight, MAX_WEIGHT)
+            output.write(_ENTRY.pack(key, captures, start, end, weight))
+    return len(entries)
+
+
+def build_book(
+    path: str,
+    plies: int,
+    depth: int,
+    evaluator: IEvaluator,
+    margin: float = 0.5,
+    board: Board | None = None,
+    quiescence: bool = True
+) -> int:
+    """
+    Construit une bibliothèque d'ouvertures par recherche
+
+    Chaque coup de chaque position est cherché à `depth`; les coups dont le
+    score est à moins de `margin` du meilleur sont gardés, avec un poids
+    d'autant plus fort qu'ils en sont proches. Seules leurs suites sont
+    explorées, jusqu'à `plies` demi-coups.
+
+    Returns:
+        Le nombre d'entrées écrites
+    """
+    board = board.clone() if board is not None else Board.initial_board()
+    tt = TranspositionTable()
+    positions: Dict[int, List[Tuple[Move, int]]] = {}
+    _expand(board, plies, depth, evaluator, margin, quiescence, tt, positions, {})
+    return write_book(path, positions)
+
+
+def _expand(
+    board: Board,
+    plies: int,
+    depth: int,
+    evaluator: IEvaluator,
+    margin: float,
+    quiescence: bool,
+    tt: TranspositionTable,
+    positions: Dict[int, List[Tuple[Move, int]]],
+    budgets: Dict[int, int]
+) -> None:
+    """
+    Ajoute la position et ses suites (plateau modifié en place puis restauré)
+
+    budgets: Plus grand nombre de demi-coups restants avec lequel chaque
+    position a été développée. Une position atteinte par transposition avec
+    plus de demi-coups restants est développée de nouveau (ses coups déjà
+    notés sont repris tels quels).
+    """
+    key = board.zobrist_key
+    if plies <= 0 or budgets.get(key, 0) >= plies:
+        return
+    budgets[key] = plies
+    if key in positions:
+        for move, _ in positions[key]:
+            undo = board.apply_move(move)
+            _expand(board, plies - 1, depth, evaluator, margin, quiescence, tt, positions, budgets)
+            board.undo_move(undo)
+        return
+    legal_moves = GameState(board).generate_legal_moves()
+    if not legal_moves:
+        return
+
+    scored = []
+    for move in legal_moves:
+        undo = board.apply_move(move)
+        context = SearchContext(tt=tt, orderer=MoveOrderer(), quiescence=quiescence)
+        score, _ = alphabeta(board, depth - 1, float('-inf'), float('inf'), False, evaluator,
+                             SearchStats(), context=context, ply=1)
+        board.undo_move(undo)
+        scored.append((score, move))
+
+    best = max(score for score, _ in scored)
+    kept = [
+        (move, max(1, round(100 * (1 - (best - score) / margin))) if margin > 0 else 100)
+        for score, move in scored
+        if best - score <= margin
+    ]
+    positions[key] = kept
+
+    for move, _ in kept:
+        undo = board.apply_move(move)
+        _expand(board, plies - 1, depth, evaluator, margin, quiescence, tt, positions, budgets)
+        board.undo_move(undo)
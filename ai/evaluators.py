@@ -4,51 +4,76 @@ Architecture: Classe de base + classes dérivées (évite la duplication) car y
 """
 from interfaces.evaluator import IEvaluator
 from models.board import Board
-from models.types import Player, Piece
+from models.types import Piece, Player
 from models.game_state import GameState
+from models.bitboard import CENTER_MASK
+from models.piece_square import PieceSquareTable
+
+SCORE_SCALE = 100  # les termes incrémentaux sont comptés en centièmes de pion
+
+
+def _scaled(weight: float) -> int:
+    """Poids en centièmes de pion"""
+    return round(weight * SCORE_SCALE)
 
 
 class BaseEvaluator(IEvaluator):
-    """Classe de base avec fonctions communes"""
+    """
+    Classe de base avec fonctions communes
+    
+    Le matériel (et, pour AdvancedEvaluator, les bonus de position) est une
+    somme de valeurs par pièce et par case: l'évaluateur la déclare comme
+    table pièce-case, que le plateau de la recherche tient à jour coup après
+    coup (voir Board.track). Sur un plateau qui ne la suit pas, la somme est
+    recalculée. check_incremental: vérifier à chaque évaluation la somme
+    tenue à jour contre un recalcul complet (mode de débogage, lent).
+    
+    Cette somme est exacte (entiers) et divisée une seule fois: les scores
+    diffèrent de l'évaluation d'origine (somme flottante case par case) au
+    dernier bit près. Entre deux coups de scores égaux à l'arrondi près, le
+    départage (donc le nombre de nœuds explorés) peut en dépendre; les tests
+    TestAI.test_advanced_* fixent le comportement de référence.
+    """
     
     PAWN_VALUE = 1.0
     KING_VALUE = 5.0
     MOBILITY_WEIGHT = 0.1
     
-    def _calculate_material(self, board: Board) -> float:
-        """Calcule le score matériel 
+    def __init__(self, check_incremental: bool = False):
+        self.check_incremental = check_incremental
+        self._table = PieceSquareTable.from_function(self._piece_value)
+    
+    def piece_square_table(self) -> PieceSquareTable:
+        return self._table
+    
+    def _piece_value(self, player: Player, piece: Piece, square: int) -> int:
+        """Valeur d'une pièce sur une case pour son camp (centièmes de pion): matériel"""
+        return _scaled(self.KING_VALUE if piece == Piece.KING else self.PAWN_VALUE)
+    
+    def _calculate_incremental(self, board: Board) -> float:
+        """Calcule les termes incrémentaux
         Score = (valeur des pièces du joueur actuel) - (valeur des pièces de l'adversaire)"""
-        current = board.current_player
-        score = 0.0
-        
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece(row, col)
-                if piece is None:
-                    continue
-                
-                player, piece_type = piece
-                value = self.PAWN_VALUE if piece_type == Piece.PAWN else self.KING_VALUE
-                
-                if player == current:
-                    score += value
-                else:
-                    score -= value
-        
-        return score
+        table = self._table
+        if board.score_table is table:
+            score = board.table_score
+            if self.check_incremental:
+                expected = table.score(board.white, board.black, board.kings)
+                if score != expected:
+                    raise RuntimeError(
+                        f"Somme incrémentale incohérente: {score} au lieu de {expected}\n{board.pretty_print()}")
+        else:
+            score = table.score(board.white, board.black, board.kings)
+        if board.current_player == Player.BLACK:
+            score = -score
+        return score / SCORE_SCALE
     
     def _calculate_mobility(self, board: Board) -> float:
-        """Calcule le bonus de mobilité (une seule fois)"""
+        """Calcule le bonus de mobilité (coups comptés sans être générés)"""
         current = board.current_player
-        opponent = current.opponent()
         
         game_state = GameState(board)
-        current_moves = len(game_state.generate_legal_moves(current))
-        
-        board_copy = board.clone()
-        board_copy.current_player = opponent
-        opponent_game_state = GameState(board_copy)
-        opponent_moves = len(opponent_game_state.generate_legal_moves(opponent))
+        current_moves = game_state.count_legal_moves(current)
+        opponent_moves = game_state.count_legal_moves(current.opponent())
         
         return (current_moves - opponent_moves) * self.MOBILITY_WEIGHT
 
@@ -58,7 +83,7 @@ class MaterialEvaluator(BaseEvaluator):
     
     def evaluate(self, board: Board) -> float:
         """Score = matériel du joueur actuel - matériel de l'adversaire"""
-        return self._calculate_material(board)
+        return self._calculate_incremental(board)
     
     def get_name(self) -> str:
         return "Material"
@@ -69,7 +94,7 @@ class MobilityEvaluator(BaseEvaluator):
     
     def evaluate(self, board: Board) -> float:
         """Score = matériel + bonus mobilité"""
-        material = self._calculate_material(board)
+        material = self._calculate_incremental(board)
         mobility = self._calculate_mobility(board)
         return material + mobility
     
@@ -86,61 +111,30 @@ class AdvancedEvaluator(BaseEvaluator):
     
     def evaluate(self, board: Board) -> float:
         """Score = matériel + mobilité + position"""
-        current = board.current_player
-        
-        # Matériel
-        material = self._calculate_material(board)
-        
-        # Bonus position
-        position_bonus = self._calculate_position_bonus(board, current)
+        # Matériel et bonus de position (termes incrémentaux)
+        material_position = self._calculate_incremental(board)
         
         # Mobilité
         mobility = self._calculate_mobility(board)
         
-        return material + position_bonus + mobility
+        return material_position + mobility
     
-    def _calculate_position_bonus(self, board: Board, current: Player) -> float:
-        """Calcule les bonus de position (promotion threat, centre, défense)"""
-        bonus = 0.0
-        
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece(row, col)
-                if piece is None:
-                    continue
-                
-                player, piece_type = piece
-                if player != current:
-                    # Bonus pour l'adversaire (négatif)
-                    position_bonus = 0.0
-                else:
-                    position_bonus = 0.0
-                
-                # Menace de promotion (pions avancés)
-                if piece_type == Piece.PAWN:
-                    if player == Player.WHITE:
-                        distance_to_promotion = row
-                        if distance_to_promotion <= 2:
-                            position_bonus += (3 - distance_to_promotion) * self.PROMOTION_THREAT_WEIGHT
-                    else:  # BLACK
-                        distance_to_promotion = 7 - row
-                        if distance_to_promotion <= 2:
-                            position_bonus += (3 - distance_to_promotion) * self.PROMOTION_THREAT_WEIGHT
-                
-                # Contrôle du centre
-                if 2 <= row <= 5 and 2 <= col <= 5:
-                    position_bonus += self.CENTER_WEIGHT
-                
-                # Défense de la dernière rangée
-                if (player == Player.WHITE and row == 7) or (player == Player.BLACK and row == 0):
-                    position_bonus += self.BACK_ROW_WEIGHT
-                
-                if player == current:
-                    bonus += position_bonus
-                else:
-                    bonus -= position_bonus
+    def _piece_value(self, player: Player, piece: Piece, square: int) -> int:
+        """Matériel + bonus de position (promotion threat, centre, défense)"""
+        value = super()._piece_value(player, piece, square)
+        row = square // 4
         
-        return bonus
+        # Menace de promotion (pions à 2 rangées ou moins de la promotion)
+        promotion_distance = row if player == Player.WHITE else 7 - row
+        if piece == Piece.PAWN and promotion_distance <= 2:
+            value += (3 - promotion_distance) * _scaled(self.PROMOTION_THREAT_WEIGHT)
+        # Contrôle du centre
+        if CENTER_MASK >> square & 1:
+            value += _scaled(self.CENTER_WEIGHT)
+        # Défense de la dernière rangée
+        if row == (7 if player == Player.WHITE else 0):
+            value += _scaled(self.BACK_ROW_WEIGHT)
+        return value
     
     def get_name(self) -> str:
         return "Advanced"
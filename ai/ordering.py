@@ -0,0 +1,80 @@
+"""
+Tri des coups pour Alpha-Beta: heuristiques "killer" et historique
+"""
+from models.board import Board
+from models.move import Move
+
+
+def static_priority(board: Board, move: Move) -> int:
+    """
+    Priorité indépendante de la recherche
+    Ordre: captures (les plus longues d'abord) > promotions > autres
+    """
+    priority = 0
+
+    # Captures en priorité
+    if move.is_capture:
+        priority += 100 + move.capture_count * 10
+
+    # Promotions (un pion qui atteint la dernière rangée)
+    start_bit = 1 << move.from_square
+    if not board.kings & start_bit:
+        end = move.to_square
+        reaches_last_row = end < 4 if board.white & start_bit else end >= 28
+        if reaches_last_row:
+            priority += 50
+
+    return priority
+
+
+class MoveOrderer:
+    """
+    Mémoire de tri partagée par toute une recherche
+
+    killers: Deux coups calmes par ply ayant provoqué une coupure
+    history: Score par (case de départ, case d'arrivée), augmenté de depth²
+             à chaque coupure provoquée par un coup calme
+    """
+
+    KILLER_PRIORITIES = (40, 30)  # sous les promotions (50), au-dessus des autres coups
+
+    def __init__(self):
+        self.killers: list[list[Move | None]] = []
+        self.history = [[0] * 32 for _ in range(32)]
+
+    def _killers_at(self, ply: int) -> list[Move | None]:
+        while len(self.killers) <= ply:
+            self.killers.append([None, None])
+        return self.killers[ply]
+
+    def killer_moves(self, ply: int) -> list[Move]:
+        """Killers d'un ply, le plus récent d'abord (à vérifier dans la position)"""
+        return [move for move in self._killers_at(ply) if move is not None]
+
+    def order(self, board: Board, moves: list[Move], ply: int) -> list[Move]:
+        """Trie les coups: priorité statique, puis killers, puis historique"""
+        killers = self._killers_at(ply)
+        history = self.history
+
+        def sort_key(move: Move) -> tuple[int, int]:
+            priority = static_priority(board, move)
+            if not move.is_capture:
+                if move == killers[0]:
+                    priority += self.KILLER_PRIORITIES[0]
+                elif move == killers[1]:
+                    priority += self.KILLER_PRIORITIES[1]
+            return -priority, -history[move.from_square][move.to_square]
+
+        return sorted(moves, key=sort_key)
+
+    def record_cutoff(self, move: Move, depth: int, ply: int) -> None:
+        """Mémorise un coup calme qui a provoqué une coupure"""
+        if move.is_capture:
+            return  # les captures sont déjà triées en tête
+
+        killers = self._killers_at(ply)
+        if move != killers[0]:
+            killers[1] = killers[0]
+            killers[0] = move
+
+        self.history[move.from_square][move.to_square] += depth * depth
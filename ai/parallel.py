@@ -0,0 +1,186 @@
+"""
+Recherche parallèle à la racine (multiprocessing)
+
+Les coups de la racine sont répartis entre les processus d'un pool.
+Mode normal: les processus partagent la borne alpha de la racine
+(multiprocessing.Value), ce qui permet d'élaguer dès qu'un bon coup est connu.
+Chaque processus la relit au début de chaque coup, puis périodiquement pendant
+la recherche (SearchContext.check_budget) pour resserrer sa fenêtre.
+Mode déterministe: chaque coup est cherché avec une fenêtre complète et un
+contexte neuf, le résultat (coup et nœuds) ne dépend pas de l'ordonnancement.
+"""
+import multiprocessing
+import time
+from typing import Tuple
+
+from models.board import Board
+from models.move import Move
+from models.game_state import GameState
+from interfaces.evaluator import IEvaluator
+from .search import SearchContext, SearchStats, alphabeta, minimax, _order_moves
+from .ordering import MoveOrderer
+from .tablebase import Tablebase
+from .transposition import TranspositionTable
+
+# État propre à chaque processus du pool (voir _init_worker)
+_shared_alpha = None
+_worker_tt: TranspositionTable | None = None
+_worker_tablebase: Tablebase | None = None
+_worker_search: int | None = None  # recherche de la racine en cours dans ce processus
+
+
+def _init_worker(shared_alpha, tt_size_mb: float, tablebase_path: str | None = None) -> None:
+    """Initialise un processus: alpha partagé, table de transposition locale, tables de finales"""
+    global _shared_alpha, _worker_tt, _worker_tablebase
+    _shared_alpha = shared_alpha
+    _worker_tt = TranspositionTable(tt_size_mb) if tt_size_mb > 0 else None
+    _worker_tablebase = Tablebase(tablebase_path) if tablebase_path else None
+
+
+def _search_root_move(
+    search_id: int,
+    index: int,
+    board: Board,
+    move: Move,
+    depth: int,
+    evaluator: IEvaluator,
+    use_alphabeta: bool,
+    quiescence: bool,
+    deterministic: bool
+) -> Tuple[int, float, bool, SearchStats]:
+    """
+    Cherche un coup de la racine dans un processus du pool
+
+    search_id: Numéro de la recherche de la racine (la table de transposition
+    du processus change de génération au premier coup de chaque recherche)
+
+    Returns:
+        (indice du coup, score, score exact ?, statistiques du processus)
+    """
+    global _worker_search
+    if _worker_tt is not None and search_id != _worker_search:
+        _worker_tt.new_search()
+        _worker_search = search_id
+
+    stats = SearchStats()
+    board.track(evaluator.piece_square_table())
+    board.apply_move(move)
+
+    if not use_alphabeta:
+        score, _ = minimax(board, depth - 1, False, evaluator, stats,
+                           SearchContext(quiescence=quiescence, tablebase=_worker_tablebase), ply=1)
+        return index, score, True, stats
+
+    if deterministic:
+        alpha = float('-inf')
+        context = SearchContext(orderer=MoveOrderer(), quiescence=quiescence,
+                                tablebase=_worker_tablebase)
+    else:
+        alpha = _shared_alpha.value
+        context = SearchContext(tt=_worker_tt, orderer=MoveOrderer(), quiescence=quiescence,
+                                tablebase=_worker_tablebase, shared_alpha=_shared_alpha, alpha=alpha)
+
+    score, _ = alphabeta(board, depth - 1, alpha, float('inf'), False, evaluator, stats,
+                         context=context, ply=1)
+
+    if not deterministic:
+        with _shared_alpha.get_lock():
+            if score > _shared_alpha.value:
+                _shared_alpha.value = score
+
+    # Un score <= alpha (dernière valeur lue comprise) n'est qu'une borne supérieure
+    return index, score, score > max(alpha, context.alpha), stats
+
+
+class ParallelSearcher:
+    """
+    Pool de processus réutilisable pour la recherche à la racine
+
+    À fermer avec close() (ou à utiliser comme gestionnaire de contexte).
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        deterministic: bool = False,
+        tt_size_mb: float = 16,
+        tablebase_path: str | None = None
+    ):
+        if workers < 1:
+            raise ValueError("workers doit être >= 1")
+        self.workers = workers
+        self.deterministic = deterministic
+        self._shared_alpha = multiprocessing.Value('d', float('-inf'))
+        self._searches = 0
+        self._pool = multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(self._shared_alpha, tt_size_mb, tablebase_path)
+        )
+
+    def choose_move(
+        self,
+        board: Board,
+        depth: int,
+        evaluator: IEvaluator,
+        use_alphabeta: bool = True,
+        quiescence: bool = False
+    ) -> Tuple[Move | None, SearchStats]:
+        """
+        Choisit le meilleur coup en répartissant les coups de la racine
+
+        Les statistiques agrègent les nœuds de tous les processus.
+        À score égal, le premier coup dans l'ordre d'exploration est retenu,
+        comme dans la recherche séquentielle.
+        """
+        stats = SearchStats(nodes_explored=1)
+        start_time = time.time()
+
+        legal_moves = GameState(board).generate_legal_moves()
+        if use_alphabeta:
+            legal_moves = _order_moves(board, legal_moves)
+        best_move = legal_moves[0] if legal_moves else None
+
+        if len(legal_moves) > 1 and depth > 0:
+            self._shared_alpha.value = float('-inf')
+            self._searches += 1
+            tasks = [
+                (self._searches, index, board, move, depth, evaluator, use_alphabeta, quiescence, self.deterministic)
+                for index, move in enumerate(legal_moves)
+            ]
+            results = self._pool.starmap(_search_root_move, tasks, chunksize=1)
+
+            best_score = float('-inf')
+            for index, score, exact, worker_stats in results:
+                stats.merge(worker_stats)
+                if exact and score > best_score:
+                    best_score = score
+                    best_move = legal_moves[index]
+
+        stats.time_seconds = time.time() - start_time
+        searched = len(legal_moves) > 1 and depth > 0
+        stats.depth_reached = depth if searched else 0  # coup unique: aucune recherche
+        return best_move, stats
+
+    def close(self) -> None:
+        """Arrête les processus du pool"""
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> "ParallelSearcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def parallel_choose_move(
+    board: Board,
+    depth: int,
+    evaluator: IEvaluator,
+    workers: int,
+    use_alphabeta: bool = True,
+    quiescence: bool = False,
+    deterministic: bool = False
+) -> Tuple[Move | None, SearchStats]:
+    """Recherche parallèle ponctuelle (crée puis ferme un pool)"""
+    with ParallelSearcher(workers, deterministic) as searcher:
+        return searcher.choose_move(board, depth, evaluator, use_alphabeta, quiescence)
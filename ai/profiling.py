@@ -0,0 +1,99 @@
+"""
+Instrumentation optionnelle de la recherche (temps par phase)
+
+Activée par choose_move(..., profile=True). Sans elle, la recherche ne paie
+qu'un test `profile is None` par génération de coups: l'évaluation et
+apply_move/undo_move ne sont chronométrés qu'à travers les enveloppes
+ProfiledEvaluator et ProfiledBoard, substituées le temps d'une recherche.
+"""
+from dataclasses import asdict, dataclass
+import time
+from typing import List, Sequence
+
+from interfaces.evaluator import IBatchEvaluator, IEvaluator, PositionTuple
+from models.board import Board, UndoInfo
+from models.move import Move
+from models.piece_square import PieceSquareTable
+
+
+@dataclass
+class SearchProfile:
+    """
+    Temps passé dans chaque phase d'une recherche (secondes)
+
+    movegen_seconds: Génération des coups
+    ordering_seconds: Tri des coups
+    eval_seconds: Évaluation statique des feuilles
+    make_unmake_seconds: apply_move / undo_move (la recherche ne copie plus le plateau)
+    leaf_nodes: Nœuds évalués statiquement (feuilles, positions calmes de la
+                quiescence, fins de partie)
+    interior_nodes: Nœuds dont au moins un enfant a été cherché
+    Les deux sont comptés par la recherche à l'entrée de chaque nœud (les
+    enfants notés par lot mais jamais visités après une coupure ne comptent
+    pas); les nœuds tranchés par la table de transposition ou les tables de
+    finales ne sont ni l'un ni l'autre.
+    """
+    movegen_seconds: float = 0.0
+    ordering_seconds: float = 0.0
+    eval_seconds: float = 0.0
+    make_unmake_seconds: float = 0.0
+    leaf_nodes: int = 0
+    interior_nodes: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class ProfiledEvaluator(IEvaluator):
+    """Évaluateur chronométré: délègue à l'évaluateur d'origine"""
+
+    def __init__(self, evaluator: IEvaluator, profile: SearchProfile):
+        self.evaluator = evaluator
+        self.profile = profile
+
+    def evaluate(self, board: Board) -> float:
+        start = time.perf_counter()
+        score = self.evaluator.evaluate(board)
+        self.profile.eval_seconds += time.perf_counter() - start
+        return score
+
+    def get_name(self) -> str:
+        return self.evaluator.get_name()
+
+    def piece_square_table(self) -> PieceSquareTable | None:
+        return self.evaluator.piece_square_table()
+
+
+class ProfiledBatchEvaluator(ProfiledEvaluator, IBatchEvaluator):
+    """Évaluateur par lots chronométré"""
+
+    def evaluate_positions(self, positions: Sequence[PositionTuple]) -> List[float]:
+        start = time.perf_counter()
+        scores = self.evaluator.evaluate_positions(positions)
+        self.profile.eval_seconds += time.perf_counter() - start
+        return scores
+
+
+class ProfiledBoard(Board):
+    """Plateau de travail dont apply_move / undo_move sont chronométrés"""
+
+    profile: SearchProfile
+
+    @classmethod
+    def from_board(cls, board: Board, profile: SearchProfile) -> "ProfiledBoard":
+        timed = cls(board.white, board.black, board.kings, board.current_player)
+        timed.profile = profile
+        timed.score_table = board.score_table
+        timed.table_score = board.table_score
+        return timed
+
+    def apply_move(self, move: Move) -> UndoInfo:
+        start = time.perf_counter()
+        undo = super().apply_move(move)
+        self.profile.make_unmake_seconds += time.perf_counter() - start
+        return undo
+
+    def undo_move(self, undo: UndoInfo) -> None:
+        start = time.perf_counter()
+        super().undo_move(undo)
+        self.profile.make_unmake_seconds += time.perf_counter() - start
@@ -1,14 +1,19 @@
 """
 Algorithmes de recherche Minimax et Alpha-Beta
 """
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, fields
+from typing import Iterator, List, Tuple
+import json
 import time
 
 from models.board import Board
 from models.move import Move
 from models.game_state import GameState
-from interfaces.evaluator import IEvaluator
+from interfaces.evaluator import IBatchEvaluator, IEvaluator
+from .transposition import Bound, TranspositionTable
+from .ordering import MoveOrderer, static_priority
+from .profiling import ProfiledBatchEvaluator, ProfiledBoard, ProfiledEvaluator, SearchProfile
+from .tablebase import Outcome, Tablebase, tablebase_score
 
 
 @dataclass
@@ -17,6 +22,100 @@ class SearchStats:
     nodes_explored: int = 0
     time_seconds: float = 0.0
     depth_reached: int = 0
+    tt_hits: int = 0
+    tt_misses: int = 0
+    tt_collisions: int = 0
+    cutoffs: int = 0
+    first_move_cutoffs: int = 0
+    quiescence_nodes: int = 0
+    tablebase_hits: int = 0
+    profile: SearchProfile | None = None  # temps par phase (choose_move(..., profile=True))
+    
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Part des coupures obtenues dès le premier coup essayé (qualité du tri)"""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+    
+    @property
+    def nodes_per_second(self) -> float:
+        """Vitesse de la recherche (nœuds de quiescence compris)"""
+        nodes = self.nodes_explored + self.quiescence_nodes
+        return nodes / self.time_seconds if self.time_seconds > 0 else 0.0
+    
+    @property
+    def effective_branching_factor(self) -> float:
+        """Facteur de branchement effectif: nœuds ** (1 / profondeur)"""
+        if self.depth_reached <= 0 or self.nodes_explored <= 0:
+            return 0.0
+        return self.nodes_explored ** (1 / self.depth_reached)
+    
+    def merge(self, other: "SearchStats") -> None:
+        """Ajoute les compteurs d'une autre recherche (ex: processus parallèle)"""
+        for stat in fields(self):
+            if stat.name not in ('time_seconds', 'depth_reached', 'profile'):
+                setattr(self, stat.name, getattr(self, stat.name) + getattr(other, stat.name))
+    
+    def to_dict(self) -> dict:
+        """Compteurs, taux dérivés et profil (s'il existe), sérialisables en JSON"""
+        report = {stat.name: getattr(self, stat.name) for stat in fields(self) if stat.name != 'profile'}
+        report['first_move_cutoff_rate'] = self.first_move_cutoff_rate
+        report['nodes_per_second'] = self.nodes_per_second
+        report['effective_branching_factor'] = self.effective_branching_factor
+        report['profile'] = self.profile.to_dict() if self.profile is not None else None
+        return report
+    
+    def to_json(self, **kwargs) -> str:
+        """Rapport JSON d'une recherche (arguments transmis à json.dumps)"""
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+class SearchAborted(Exception):
+    """Levée quand le budget (temps ou nœuds) de la recherche est épuisé"""
+
+
+@dataclass
+class SearchContext:
+    """
+    Structures partagées par tous les nœuds d'une recherche
+    
+    tt: Table de transposition (None pour la désactiver)
+    orderer: Heuristiques killer/historique (None: tri statique seulement)
+    deadline: Instant limite (time.perf_counter) au-delà duquel on abandonne
+    node_limit: Nombre maximal de nœuds explorés
+    root_move: Coup à essayer en premier à la racine (itération précédente)
+    quiescence: Prolonger les feuilles tant qu'une capture est en attente
+    max_quiescence_ply: Nombre maximal de demi-coups de prolongation
+    profile: Temps par phase (None: instrumentation désactivée)
+    tablebase: Tables de finales consultées à chaque nœud (hors racine) assez pauvre en pièces
+    shared_alpha: Borne alpha de la racine partagée entre processus (multiprocessing.Value,
+                  voir ai.parallel), relue tous les BUDGET_CHECK_INTERVAL nœuds
+    alpha: Dernière valeur lue de shared_alpha; Alpha-Beta resserre sa fenêtre à chaque nœud
+    """
+    tt: TranspositionTable | None = None
+    orderer: MoveOrderer | None = None
+    deadline: float | None = None
+    node_limit: int | None = None
+    root_move: Move | None = None
+    quiescence: bool = False
+    max_quiescence_ply: int = 12
+    profile: SearchProfile | None = None
+    tablebase: Tablebase | None = None
+    shared_alpha: object = None
+    alpha: float = float('-inf')
+    
+    BUDGET_CHECK_INTERVAL = 256  # l'horloge n'est lue que tous les N nœuds
+    
+    def check_budget(self, stats: SearchStats) -> None:
+        """Lève SearchAborted si le budget est épuisé (nœuds de quiescence compris)"""
+        nodes = stats.nodes_explored + stats.quiescence_nodes
+        if self.shared_alpha is not None and nodes % self.BUDGET_CHECK_INTERVAL == 0:
+            self.alpha = self.shared_alpha.value
+        if self.node_limit is not None and nodes > self.node_limit:
+            raise SearchAborted()
+        if (self.deadline is not None
+                and nodes % self.BUDGET_CHECK_INTERVAL == 0
+                and time.perf_counter() >= self.deadline):
+            raise SearchAborted()
 
 
 def minimax(
@@ -24,32 +123,61 @@ def minimax(
     depth: int, 
     maximizing: bool, 
     evaluator: IEvaluator, 
-    stats: SearchStats
+    stats: SearchStats,
+    context: SearchContext | None = None,
+    ply: int = 0
 ) -> Tuple[float, Move | None]:
     """
     Algorithme Minimax classique
     Explore tout l'arbre jusqu'à la profondeur donnée
+    Le plateau est modifié en place puis restauré (apply_move / undo_move)
+    
+    context: Budget, quiescence et tables de finales (les autres champs sont ignorés)
+    ply: Distance à la racine (0 à la racine)
     """
     stats.nodes_explored += 1
+    if context is not None:
+        context.check_budget(stats)
+        if ply > 0 and context.tablebase is not None:
+            score = _probe_tablebase(board, maximizing, evaluator, stats, context.tablebase)
+            if score is not None:
+                return score, None
+        if depth == 0 and context.quiescence:
+            return quiescence(board, float('-inf'), float('inf'), maximizing, evaluator, stats, context), None
+    
+    profile = context.profile if context is not None else None
+    if depth == 0:
+        if profile is not None:
+            profile.leaf_nodes += 1
+        score = evaluator.evaluate(board)
+        return score if maximizing else -score, None
     
     game_state = GameState(board)
-    legal_moves = game_state.generate_legal_moves()
+    legal_moves = _generate_moves(game_state, profile)
     
     # Cas terminal
     if depth == 0 or len(legal_moves) == 0:
+        if profile is not None:
+            profile.leaf_nodes += 1
         score = evaluator.evaluate(board)
         return score if maximizing else -score, None
     
+    if profile is not None:
+        profile.interior_nodes += 1
     best_move = None
+    leaf_scores = _evaluate_children(board, legal_moves, evaluator) if depth == 1 else None
     
     if maximizing:
         max_score = float('-inf')
-        for move in legal_moves:
-            # Simuler le coup
-            child_board = board.clone()
-            child_board.apply_move(move)
-            
-            score, _ = minimax(child_board, depth - 1, False, evaluator, stats)
+        for index, move in enumerate(legal_moves):
+            if leaf_scores is not None:
+                score = _leaf_child_score(board, move, leaf_scores[index], float('-inf'), float('inf'),
+                                          False, evaluator, stats, context)
+            else:
+                # Simuler le coup (en place, annulé après l'exploration)
+                undo = board.apply_move(move)
+                score, _ = minimax(board, depth - 1, False, evaluator, stats, context, ply + 1)
+                board.undo_move(undo)
             
             if score > max_score:
                 max_score = score
@@ -58,11 +186,14 @@ def minimax(
         return max_score, best_move
     else:
         min_score = float('inf')
-        for move in legal_moves:
-            child_board = board.clone()
-            child_board.apply_move(move)
-            
-            score, _ = minimax(child_board, depth - 1, True, evaluator, stats)
+        for index, move in enumerate(legal_moves):
+            if leaf_scores is not None:
+                score = _leaf_child_score(board, move, leaf_scores[index], float('-inf'), float('inf'),
+                                          True, evaluator, stats, context)
+            else:
+                undo = board.apply_move(move)
+                score, _ = minimax(board, depth - 1, True, evaluator, stats, context, ply + 1)
+                board.undo_move(undo)
             
             if score < min_score:
                 min_score = score
@@ -79,62 +210,381 @@ def alphabeta(
     maximizing: bool, 
     evaluator: IEvaluator, 
     stats: SearchStats,
-    move_ordering: bool = True
+    move_ordering: bool = True,
+    context: SearchContext | None = None,
+    ply: int = 0
 ) -> Tuple[float, Move | None]:
     """
     Algorithme Alpha-Beta avec élagage
     Plus efficace que Minimax grâce à l'élagage des branches
+    Le plateau est modifié en place puis restauré (apply_move / undo_move)
+    
+    context: Structures partagées par toute la recherche (table de transposition, budget...)
+    ply: Distance à la racine (0 à la racine)
     """
     stats.nodes_explored += 1
+    if context is not None:
+        context.check_budget(stats)
+        # Recherche parallèle: un autre processus a pu relever l'alpha de la racine
+        if context.alpha > alpha:
+            alpha = context.alpha
+        # Position résolue par les tables de finales: score exact, sans recherche
+        if ply > 0 and context.tablebase is not None:
+            score = _probe_tablebase(board, maximizing, evaluator, stats, context.tablebase)
+            if score is not None:
+                return score, None
     
-    game_state = GameState(board)
-    legal_moves = game_state.generate_legal_moves()
+    tt = context.tt if context is not None and depth > 0 else None
+    tt_move = None
+    if tt is not None:
+        key = board.zobrist_key
+        entry = tt.probe(key, stats)
+        if entry is not None:
+            tt_move = entry.move
+            # Pas de coupure à la racine: on veut toujours un coup légal frais
+            if entry.depth >= depth and ply > 0:
+                score, bound = _from_tt(entry.score, entry.bound, maximizing)
+                if bound == Bound.EXACT:
+                    return score, tt_move
+                if bound == Bound.LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if beta <= alpha:
+                    return score, tt_move
     
-    # Cas terminal
-    if depth == 0 or len(legal_moves) == 0:
+    if depth == 0:
+        if context is not None and context.quiescence:
+            return quiescence(board, alpha, beta, maximizing, evaluator, stats, context), None
+        # Feuille: évaluation directe, aucun coup n'est généré
+        if context is not None and context.profile is not None:
+            context.profile.leaf_nodes += 1
         score = evaluator.evaluate(board)
         return score if maximizing else -score, None
     
-    # Tri des coups (captures en premier)
-    if move_ordering:
-        legal_moves = _order_moves(board, legal_moves)
+    game_state = GameState(board)
+    orderer = context.orderer if context is not None else None
+    
+    # Le meilleur coup connu (itération précédente ou table) est essayé en premier
+    first_move = context.root_move if ply == 0 and context is not None else None
+    if first_move is None:
+        first_move = tt_move
+    
+    # Les autres coups ne sont générés que si les premiers ne provoquent pas de coupure
+    profile = context.profile if context is not None else None
+    legal_moves = _staged_moves(board, game_state, first_move, move_ordering, orderer, ply, profile)
+    
+    # Nœud frontière: les enfants sont des feuilles, évaluées en un seul appel
+    leaf_scores = None
+    if depth == 1 and isinstance(evaluator, IBatchEvaluator):
+        legal_moves = list(legal_moves)
+        leaf_scores = _evaluate_children(board, legal_moves, evaluator)
     
+    original_alpha, original_beta = alpha, beta
     best_move = None
+    index = -1
     
     if maximizing:
-        max_score = float('-inf')
-        for move in legal_moves:
-            child_board = board.clone()
-            child_board.apply_move(move)
+        best_score = float('-inf')
+        for index, move in enumerate(legal_moves):
+            if leaf_scores is not None:
+                score = _leaf_child_score(board, move, leaf_scores[index], alpha, beta,
+                                          False, evaluator, stats, context)
+            else:
+                undo = board.apply_move(move)
+                score, _ = alphabeta(board, depth - 1, alpha, beta, False, evaluator, stats, move_ordering, context, ply + 1)
+                board.undo_move(undo)
             
-            score, _ = alphabeta(child_board, depth - 1, alpha, beta, False, evaluator, stats, move_ordering)
-            
-            if score > max_score:
-                max_score = score
+            if score > best_score:
+                best_score = score
                 best_move = move
             
             alpha = max(alpha, score)
             if beta <= alpha:
+                _record_cutoff(stats, orderer, move, index, depth, ply)
                 break  # Coupure Beta
-        
-        return max_score, best_move
     else:
-        min_score = float('inf')
-        for move in legal_moves:
-            child_board = board.clone()
-            child_board.apply_move(move)
+        best_score = float('inf')
+        for index, move in enumerate(legal_moves):
+            if leaf_scores is not None:
+                score = _leaf_child_score(board, move, leaf_scores[index], alpha, beta,
+                                          True, evaluator, stats, context)
+            else:
+                undo = board.apply_move(move)
+                score, _ = alphabeta(board, depth - 1, alpha, beta, True, evaluator, stats, move_ordering, context, ply + 1)
+                board.undo_move(undo)
             
-            score, _ = alphabeta(child_board, depth - 1, alpha, beta, True, evaluator, stats, move_ordering)
-            
-            if score < min_score:
-                min_score = score
+            if score < best_score:
+                best_score = score
                 best_move = move
             
             beta = min(beta, score)
             if beta <= alpha:
+                _record_cutoff(stats, orderer, move, index, depth, ply)
                 break  # Coupure Alpha
-        
-        return min_score, best_move
+    
+    # Cas terminal: aucun coup légal
+    if index < 0:
+        if profile is not None:
+            profile.leaf_nodes += 1
+        score = evaluator.evaluate(board)
+        return score if maximizing else -score, None
+    if profile is not None:
+        profile.interior_nodes += 1
+    
+    if tt is not None:
+        if best_score <= original_alpha:
+            bound = Bound.UPPER
+        elif best_score >= original_beta:
+            bound = Bound.LOWER
+        else:
+            bound = Bound.EXACT
+        tt_score, tt_bound = _from_tt(best_score, bound, maximizing)
+        tt.store(key, depth, tt_score, tt_bound, best_move)
+    
+    return best_score, best_move
+
+
+def quiescence(
+    board: Board,
+    alpha: float,
+    beta: float,
+    maximizing: bool,
+    evaluator: IEvaluator,
+    stats: SearchStats,
+    context: SearchContext,
+    qply: int = 0
+) -> float:
+    """
+    Recherche de quiescence: au-delà de la profondeur nominale, on continue
+    tant que le joueur au trait a une capture (obligatoire) à jouer.
+    Une position n'est évaluée que lorsqu'elle est calme, ou quand la
+    prolongation atteint context.max_quiescence_ply.
+    Pas d'évaluation "stand pat": la capture étant obligatoire, on ne peut
+    pas choisir de s'arrêter.
+    
+    qply: Nombre de demi-coups de prolongation déjà joués
+    """
+    if qply > 0:
+        stats.quiescence_nodes += 1
+        context.check_budget(stats)
+        if context.tablebase is not None:
+            score = _probe_tablebase(board, maximizing, evaluator, stats, context.tablebase)
+            if score is not None:
+                return score
+    
+    game_state = GameState(board)
+    
+    # Position calme (ou garde-fou atteint): évaluation statique
+    profile = context.profile
+    if qply >= context.max_quiescence_ply or not game_state.has_capture():
+        if profile is not None:
+            profile.leaf_nodes += 1
+        score = evaluator.evaluate(board)
+        return score if maximizing else -score
+    
+    if profile is not None:
+        profile.interior_nodes += 1
+    legal_moves = _generate_moves(game_state, profile, capture=True)
+    if profile is None:
+        legal_moves = _order_moves(board, legal_moves)
+    else:
+        start = time.perf_counter()
+        legal_moves = _order_moves(board, legal_moves)
+        profile.ordering_seconds += time.perf_counter() - start
+    
+    if maximizing:
+        best_score = float('-inf')
+        for move in legal_moves:
+            undo = board.apply_move(move)
+            score = quiescence(board, alpha, beta, False, evaluator, stats, context, qply + 1)
+            board.undo_move(undo)
+            
+            best_score = max(best_score, score)
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                break
+    else:
+        best_score = float('inf')
+        for move in legal_moves:
+            undo = board.apply_move(move)
+            score = quiescence(board, alpha, beta, True, evaluator, stats, context, qply + 1)
+            board.undo_move(undo)
+            
+            best_score = min(best_score, score)
+            beta = min(beta, score)
+            if beta <= alpha:
+                break
+    
+    return best_score
+
+
+def _probe_tablebase(
+    board: Board,
+    maximizing: bool,
+    evaluator: IEvaluator,
+    stats: SearchStats,
+    tablebase: Tablebase
+) -> float | None:
+    """
+    Score d'une position couverte par les tables de finales (None sinon)
+    
+    Sans distance dans la table, l'évaluation statique départage les gains
+    (et les pertes), pour que la recherche progresse vers la conversion.
+    """
+    result = tablebase.probe(board)
+    if result is None or result[0] == Outcome.UNKNOWN:
+        return None
+    stats.tablebase_hits += 1
+    outcome, distance = result
+    score = tablebase_score(outcome, distance)
+    if distance is None and outcome != Outcome.DRAW:
+        score += evaluator.evaluate(board)
+    return score if maximizing else -score
+
+
+def _evaluate_children(board: Board, moves: List[Move], evaluator: IEvaluator) -> List[float] | None:
+    """
+    Scores statiques de tous les enfants d'un nœud frontière, en un seul
+    appel d'un évaluateur par lots (None si l'évaluateur ne l'est pas)
+    """
+    if not moves or not isinstance(evaluator, IBatchEvaluator):
+        return None
+    positions = []
+    for move in moves:
+        undo = board.apply_move(move)
+        positions.append((board.white, board.black, board.kings, board.current_player.value))
+        board.undo_move(undo)
+    return evaluator.evaluate_positions(positions)
+
+
+def _leaf_child_score(
+    board: Board,
+    move: Move,
+    leaf_score: float,
+    alpha: float,
+    beta: float,
+    maximizing: bool,
+    evaluator: IEvaluator,
+    stats: SearchStats,
+    context: SearchContext | None
+) -> float:
+    """
+    Score d'un enfant feuille dont l'évaluation a été faite par lot
+    
+    Mêmes comptes et même résultat que l'appel récursif à profondeur 0:
+    tables de finales, puis quiescence si une capture est en attente.
+    maximizing: Point de vue de l'enfant
+    """
+    stats.nodes_explored += 1
+    if context is not None:
+        context.check_budget(stats)
+        if context.tablebase is not None or context.quiescence:
+            undo = board.apply_move(move)
+            score = None
+            if context.tablebase is not None:
+                score = _probe_tablebase(board, maximizing, evaluator, stats, context.tablebase)
+            if (score is None and context.quiescence and context.max_quiescence_ply > 0
+                    and GameState(board).has_capture()):
+                score = quiescence(board, alpha, beta, maximizing, evaluator, stats, context)
+            board.undo_move(undo)
+            if score is not None:
+                return score
+        if context.profile is not None:
+            context.profile.leaf_nodes += 1
+    return leaf_score if maximizing else -leaf_score
+
+
+def _from_tt(score: float, bound: Bound, maximizing: bool) -> Tuple[float, Bound]:
+    """
+    Convertit un score entre le point de vue de la racine (utilisé par la recherche)
+    et celui du joueur qui a le trait (stocké dans la table)
+    La conversion est sa propre inverse
+    """
+    if maximizing:
+        return score, bound
+    if bound == Bound.LOWER:
+        return -score, Bound.UPPER
+    if bound == Bound.UPPER:
+        return -score, Bound.LOWER
+    return -score, bound
+
+
+def _staged_moves(
+    board: Board,
+    game_state: GameState,
+    first_move: Move | None,
+    move_ordering: bool,
+    orderer: MoveOrderer | None,
+    ply: int,
+    profile: SearchProfile | None = None
+) -> Iterator[Move]:
+    """
+    Coups d'un nœud Alpha-Beta, par étapes (une étape n'est calculée que si
+    les précédentes n'ont pas provoqué de coupure):
+      1. le coup mémorisé (table ou itération précédente), vérifié, sans génération
+      2. les killers du ply, vérifiés de même (coups calmes: seulement si
+         aucune capture n'est possible)
+      3. les autres coups légaux (captures obligatoires ou coups calmes), triés;
+         sans tri, produits à la demande pièce par pièce (iter_legal_moves)
+    """
+    capture = game_state.has_capture()  # calculé une fois pour toutes les étapes
+    tried = []
+    if first_move is not None and game_state.is_pseudo_legal(first_move, capture=capture):
+        tried.append(first_move)
+        yield first_move
+    
+    if move_ordering and orderer is not None and not capture:
+        for killer in orderer.killer_moves(ply):
+            if killer not in tried and game_state.is_pseudo_legal(killer, capture=False):
+                tried.append(killer)
+                yield killer
+    
+    if not move_ordering:
+        for move in game_state.iter_legal_moves(capture=capture):
+            if move not in tried:
+                yield move
+        return
+    
+    remaining = _generate_moves(game_state, profile, capture)
+    # Tri des coups (captures en premier, puis historique)
+    start = time.perf_counter() if profile is not None else 0.0
+    if orderer is not None:
+        remaining = orderer.order(board, remaining, ply)
+    else:
+        remaining = _order_moves(board, remaining)
+    if profile is not None:
+        profile.ordering_seconds += time.perf_counter() - start
+    
+    for move in remaining:
+        if move not in tried:
+            yield move
+
+
+def _generate_moves(game_state: GameState, profile: SearchProfile | None, capture: bool | None = None) -> List[Move]:
+    """Génère les coups légaux d'un nœud intérieur (chronométré si profil actif)"""
+    if profile is None:
+        return game_state.generate_legal_moves(capture=capture)
+    start = time.perf_counter()
+    moves = game_state.generate_legal_moves(capture=capture)
+    profile.movegen_seconds += time.perf_counter() - start
+    return moves
+
+
+def _record_cutoff(
+    stats: SearchStats,
+    orderer: MoveOrderer | None,
+    move: Move,
+    index: int,
+    depth: int,
+    ply: int
+) -> None:
+    """Comptabilise une coupure et nourrit les heuristiques de tri"""
+    stats.cutoffs += 1
+    if index == 0:
+        stats.first_move_cutoffs += 1
+    if orderer is not None:
+        orderer.record_cutoff(move, depth, ply)
 
 
 def _order_moves(board: Board, moves: list[Move]) -> list[Move]:
@@ -142,42 +592,40 @@ def _order_moves(board: Board, moves: list[Move]) -> list[Move]:
     Trie les coups pour améliorer l'élagage Alpha-Beta
     Ordre: captures > promotions > autres
     """
-    def move_priority(move: Move) -> int:
-        priority = 0
-        
-        # Captures en priorité
-        if move.is_capture:
-            priority += 100 + move.capture_count * 10
-        
-        # Promotions
-        start_row, start_col = move.start
-        end_row, end_col = move.end
-        piece = board.get_piece(start_row, start_col)
-        
-        if piece and piece[1].name == 'PAWN':
-            if (piece[0].name == 'WHITE' and end_row == 0) or \
-               (piece[0].name == 'BLACK' and end_row == 7):
-                priority += 50
-        
-        return -priority  # Négatif car on veut trier décroissant
-    
-    return sorted(moves, key=move_priority)
+    return sorted(moves, key=lambda move: -static_priority(board, move))
 
 
 def choose_move(
     board: Board,
     depth: int,
     evaluator: IEvaluator,
-    use_alphabeta: bool = True
+    use_alphabeta: bool = True,
+    tt: TranspositionTable | None = None,
+    time_limit: float | None = None,
+    node_limit: int | None = None,
+    quiescence: bool = False,
+    profile: bool = False,
+    tablebase: Tablebase | None = None
 ) -> Tuple[Move, SearchStats]:
     """
     Choisit le meilleur coup avec stats
     
+    Sans budget, la recherche va directement à la profondeur demandée.
+    Avec un budget (temps et/ou nœuds), approfondissement itératif: profondeur
+    1, 2, 3... jusqu'à `depth` ou épuisement du budget. Le coup retourné est
+    celui de la dernière profondeur terminée.
+    
     Args:
         board: Plateau actuel
-        depth: Profondeur de recherche
+        depth: Profondeur de recherche (profondeur maximale si budget)
         evaluator: Fonction d'évaluation
         use_alphabeta: True pour Alpha-Beta, False pour Minimax
+        tt: Table de transposition à (ré)utiliser (Alpha-Beta uniquement)
+        time_limit: Budget de temps en secondes
+        node_limit: Budget en nombre de nœuds
+        quiescence: Résoudre les captures en attente au-delà de la profondeur
+        profile: Mesurer le temps par phase (stats.profile, voir stats.to_json())
+        tablebase: Tables de finales consultées pendant la recherche
     
     Returns:
         (meilleur_coup, statistiques)
@@ -185,14 +633,81 @@ def choose_move(
     stats = SearchStats()
     start_time = time.time()
     
+    # Une seule copie: la recherche travaille en place sur ce plateau
+    if profile:
+        stats.profile = SearchProfile()
+        board = ProfiledBoard.from_board(board, stats.profile)
+        wrapper = ProfiledBatchEvaluator if isinstance(evaluator, IBatchEvaluator) else ProfiledEvaluator
+        evaluator = wrapper(evaluator, stats.profile)
+    else:
+        board = board.clone()
+    # Termes incrémentaux de l'évaluateur tenus à jour par apply_move / undo_move
+    board.track(evaluator.piece_square_table())
+    
+    if use_alphabeta and tt is not None:
+        tt.new_search()
+    
+    if time_limit is None and node_limit is None:
+        context = SearchContext(tt=tt, orderer=MoveOrderer(), quiescence=quiescence,
+                                profile=stats.profile, tablebase=tablebase)
+        best_move = _search_root(board, depth, evaluator, use_alphabeta, stats, context)
+        stats.depth_reached = depth
+    else:
+        context = SearchContext(tt=tt, orderer=MoveOrderer(), node_limit=node_limit,
+                                quiescence=quiescence, profile=stats.profile, tablebase=tablebase)
+        if time_limit is not None:
+            context.deadline = time.perf_counter() + time_limit
+        best_move = _iterative_deepening(board, depth, evaluator, use_alphabeta, stats, context)
+    
+    stats.time_seconds = time.time() - start_time
+    
+    return best_move, stats
+
+
+def _search_root(
+    board: Board,
+    depth: int,
+    evaluator: IEvaluator,
+    use_alphabeta: bool,
+    stats: SearchStats,
+    context: SearchContext
+) -> Move | None:
+    """Lance une recherche complète à profondeur fixe"""
     if use_alphabeta:
         _, best_move = alphabeta(
-            board, depth, float('-inf'), float('inf'), True, evaluator, stats
+            board, depth, float('-inf'), float('inf'), True, evaluator, stats,
+            context=context
         )
     else:
-        _, best_move = minimax(board, depth, True, evaluator, stats)
+        _, best_move = minimax(board, depth, True, evaluator, stats, context)
+    return best_move
+
+
+def _iterative_deepening(
+    board: Board,
+    max_depth: int,
+    evaluator: IEvaluator,
+    use_alphabeta: bool,
+    stats: SearchStats,
+    context: SearchContext
+) -> Move | None:
+    """
+    Approfondissement itératif sous le budget porté par le contexte
+    Le meilleur coup de chaque itération est essayé en premier à la suivante
+    """
+    # Repli si même la profondeur 1 n'a pas le temps de se terminer
+    legal_moves = GameState(board).generate_legal_moves()
+    best_move = _order_moves(board, legal_moves)[0] if legal_moves else None
     
-    stats.time_seconds = time.time() - start_time
-    stats.depth_reached = depth
+    for current_depth in range(1, max_depth + 1):
+        try:
+            move = _search_root(board, current_depth, evaluator, use_alphabeta, stats, context)
+        except SearchAborted:
+            break  # le plateau de travail est abandonné tel quel
+        best_move = move
+        stats.depth_reached = current_depth
+        context.root_move = move
+        if move is None:
+            break  # aucun coup légal
     
-    return best_move, stats
+    return best_move
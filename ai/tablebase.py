@@ -0,0 +1,495 @@
+"""
+Tables de finales (tablebases)
+
+Pour chaque répartition du matériel (signature), une table donne le
+résultat exact de chaque position en jeu parfait (gain, nulle ou perte pour
+le joueur au trait) et, optionnellement, la distance en demi-coups jusqu'à
+la fin de la partie (le plus court gain, la plus longue défense).
+
+Normalisation: le joueur au trait est toujours ramené aux Blancs (qui
+montent). Quand les Noirs ont le trait, le plateau est tourné d'un
+demi-tour (case c -> 31 - c) et les couleurs sont échangées. Une signature
+est donc (pions, dames du joueur au trait, pions, dames de l'adversaire).
+
+Indexation (système combinatoire sur les 32 cases, voir models.bitboard):
+pions du joueur au trait parmi les cases 4-31 (un pion de la rangée de
+promotion serait une dame), pions adverses parmi les cases 0-27, dames du
+joueur au trait parmi les cases sans pion, puis dames adverses parmi les
+cases restantes. Les indices où deux pions se superposent ne correspondent
+à aucune position (résultat UNKNOWN).
+
+Fichier, un par signature (entiers petit-boutistes):
+    MAGIC (7 octets) + version (uint8) + signature (4 x uint8)
+    + nombre de positions (uint32) + drapeaux (uint8, 1: distances)
+    puis 2 bits par position (4 positions par octet, valeurs de Outcome)
+    puis, si drapeau, la distance de chaque position (uint8, saturée à 255)
+
+Génération (analyse rétrograde): les signatures sont traitées par nombre de
+pièces puis de pions croissants; une capture ou une promotion mène donc
+toujours à une table déjà construite. Une signature et sa symétrique
+(couleurs échangées) sont résolues ensemble, les coups simples passant de
+l'une à l'autre. Les positions sans coup sont perdues; les résultats sont
+ensuite propagés aux prédécesseurs par distance croissante, et les
+positions jamais résolues sont nulles. Les signatures d'un même niveau sont
+indépendantes (pool de processus), et une table déjà écrite n'est pas
+recalculée: une génération interrompue reprend là où elle s'était arrêtée.
+"""
+import mmap
+import multiprocessing
+import os
+import re
+import struct
+from array import array
+from enum import IntEnum
+from math import comb
+from typing import Dict, List, Tuple
+
+from models.board import Board
+from models.game_state import GameState
+from models.move import Move
+from models.types import Player
+
+MAGIC = b'DAMTABL'
+VERSION = 1
+
+_HEADER = struct.Struct('<7sB4BIB')
+_FLAG_DISTANCE = 0x01
+_FILE_NAME = re.compile(r'^(\d+)p(\d+)k-(\d+)p(\d+)k\.dtb$')
+
+MAX_DISTANCE = 255
+TABLEBASE_WIN = 1000.0  # au-delà de toute évaluation statique
+
+Signature = Tuple[int, int, int, int]
+
+_BINOMIALS = [[comb(n, k) for k in range(33)] for n in range(33)]
+_BYTE_REVERSE = bytes(int(f"{byte:08b}"[::-1], 2) for byte in range(256))
+_PAWN_SQUARES = 28
+_PROMOTION_ROW = 0x0000000F   # rangée 0: promotion des pions du joueur au trait
+_OPPONENT_ROW = 0xF0000000    # rangée 7: promotion des pions adverses
+
+
+class Outcome(IntEnum):
+    """Résultat d'une position pour le joueur au trait (valeur sur 2 bits)"""
+    UNKNOWN = 0
+    WIN = 1
+    DRAW = 2
+    LOSS = 3
+
+
+class Tablebase:
+    """
+    Lecture des tables d'un répertoire par mmap
+
+    Toutes les tables du répertoire sont ouvertes; une position dont la
+    signature n'a pas de table n'est pas trouvée (probe retourne None).
+    À fermer avec close() (ou gestionnaire de contexte).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._tables: Dict[Signature, _TableFile] = {}
+        for name in sorted(os.listdir(directory)):
+            match = _FILE_NAME.match(name)
+            if match:
+                signature = tuple(int(count) for count in match.groups())
+                self._tables[signature] = _TableFile(os.path.join(directory, name), signature)
+        self.max_pieces = max((sum(signature) for signature in self._tables), default=0)
+
+    def __len__(self) -> int:
+        """Nombre de tables (signatures) disponibles"""
+        return len(self._tables)
+
+    def __contains__(self, signature: Signature) -> bool:
+        return signature in self._tables
+
+    def probe(self, board: Board) -> Tuple[Outcome, int | None] | None:
+        """
+        Résultat d'une position pour le joueur au trait
+
+        Returns:
+            (résultat, distance en demi-coups ou None si la table n'a pas de
+            distances), ou None si la position n'est couverte par aucune table
+        """
+        if (board.white | board.black).bit_count() > self.max_pieces:
+            return None
+        return self.probe_position(*normalize(board))
+
+    def probe_position(self, own: int, opponent: int, kings: int) -> Tuple[Outcome, int | None] | None:
+        """Comme probe, pour une position normalisée (voir normalize)"""
+        if not own or not opponent:
+            return None
+        if own & ~kings & _PROMOTION_ROW or opponent & ~kings & _OPPONENT_ROW:
+            return None
+        signature, index = position_index(own, opponent, kings)
+        table = self._tables.get(signature)
+        if table is None:
+            return None
+        return table.read(index)
+
+    def close(self) -> None:
+        for table in self._tables.values():
+            table.close()
+        self._tables.clear()
+
+    def __enter__(self) -> "Tablebase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _TableFile:
+    """Une table (une signature) projetée en mémoire"""
+
+    def __init__(self, path: str, signature: Signature):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{path} n'est pas une table de finales")
+        magic, version, *stored, self.count, flags = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} n'est pas une table de finales (version {VERSION})")
+        if tuple(stored) != signature or self.count != table_size(signature):
+            raise ValueError(f"{path}: signature ou taille incohérente")
+        self.has_distance = bool(flags & _FLAG_DISTANCE)
+        self._distance_offset = _HEADER.size + (self.count + 3) // 4
+        expected = self._distance_offset + (self.count if self.has_distance else 0)
+        if len(self._map) != expected:
+            raise ValueError(f"{path}: table tronquée")
+
+    def read(self, index: int) -> Tuple[Outcome, int | None]:
+        byte = self._map[_HEADER.size + (index >> 2)]
+        outcome = Outcome(byte >> (2 * (index & 3)) & 3)
+        distance = self._map[self._distance_offset + index] if self.has_distance else None
+        return outcome, distance
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+def normalize(board: Board) -> Tuple[int, int, int]:
+    """
+    Position vue du joueur au trait, ramené aux Blancs
+
+    Returns:
+        (pièces du joueur au trait, pièces adverses, dames)
+    """
+    if board.current_player == Player.WHITE:
+        return board.white, board.black, board.kings
+    return _mirror(board.black), _mirror(board.white), _mirror(board.kings)
+
+
+def table_size(signature: Signature) -> int:
+    """Nombre d'indices d'une table (positions impossibles comprises)"""
+    own_pawns, own_kings, opponent_pawns, opponent_kings = signature
+    free = 32 - own_pawns - opponent_pawns
+    return (_BINOMIALS[_PAWN_SQUARES][own_pawns] * _BINOMIALS[_PAWN_SQUARES][opponent_pawns]
+            * _BINOMIALS[free][own_kings] * _BINOMIALS[free - own_kings][opponent_kings])
+
+
+def position_index(own: int, opponent: int, kings: int) -> Tuple[Signature, int]:
+    """Signature et indice d'une position normalisée"""
+    own_pawns = own & ~kings
+    opponent_pawns = opponent & ~kings
+    own_kings = own & kings
+    opponent_kings = opponent & kings
+    pawns = own_pawns | opponent_pawns
+    signature = (own_pawns.bit_count(), own_kings.bit_count(),
+                 opponent_pawns.bit_count(), opponent_kings.bit_count())
+    free = 32 - signature[0] - signature[2]
+
+    index = _rank(own_pawns, _PROMOTION_ROW)
+    index = index * _BINOMIALS[_PAWN_SQUARES][signature[2]] + _rank(opponent_pawns, 0)
+    index = index * _BINOMIALS[free][signature[1]] + _rank(own_kings, pawns)
+    index = index * _BINOMIALS[free - signature[1]][signature[3]] + _rank(opponent_kings, pawns | own_kings)
+    return signature, index
+
+
+def position_from_index(signature: Signature, index: int) -> Tuple[int, int, int] | None:
+    """Position normalisée d'un indice (None si l'indice ne correspond à aucune position)"""
+    own_pawn_count, own_king_count, opponent_pawn_count, opponent_king_count = signature
+    free = 32 - own_pawn_count - opponent_pawn_count
+    index, opponent_king_rank = divmod(index, _BINOMIALS[free - own_king_count][opponent_king_count])
+    index, own_king_rank = divmod(index, _BINOMIALS[free][own_king_count])
+    own_pawn_rank, opponent_pawn_rank = divmod(index, _BINOMIALS[_PAWN_SQUARES][opponent_pawn_count])
+
+    own_pawns = _unrank(own_pawn_rank, own_pawn_count, _PROMOTION_ROW)
+    opponent_pawns = _unrank(opponent_pawn_rank, opponent_pawn_count, 0)
+    if own_pawns & opponent_pawns:
+        return None
+    pawns = own_pawns | opponent_pawns
+    own_kings = _unrank(own_king_rank, own_king_count, pawns)
+    opponent_kings = _unrank(opponent_king_rank, opponent_king_count, pawns | own_kings)
+    return own_pawns | own_kings, opponent_pawns | opponent_kings, own_kings | opponent_kings
+
+
+def tablebase_score(outcome: Outcome, distance: int | None) -> float:
+    """
+    Score de recherche d'un résultat, pour le joueur au trait
+
+    Un gain plus court (une défense plus longue) vaut mieux; sans distance,
+    tous les gains se valent.
+    """
+    if outcome == Outcome.WIN:
+        return TABLEBASE_WIN - (distance or 0)
+    if outcome == Outcome.LOSS:
+        return -TABLEBASE_WIN + (distance or 0)
+    return 0.0
+
+
+def _rank(mask: int, excluded: int) -> int:
+    """Rang combinatoire d'un ensemble de cases parmi les cases non exclues"""
+    rank = 0
+    count = 1
+    while mask:
+        low = mask & -mask
+        position = low.bit_length() - 1 - (excluded & (low - 1)).bit_count()
+        rank += _BINOMIALS[position][count]
+        count += 1
+        mask ^= low
+    return rank
+
+
+def _unrank(rank: int, count: int, excluded: int) -> int:
+    """Ensemble de `count` cases de rang donné parmi les cases non exclues"""
+    squares = [square for square in range(32) if not excluded >> square & 1]
+    mask = 0
+    for size in range(count, 0, -1):
+        position = size - 1
+        while _BINOMIALS[position + 1][size] <= rank:
+            position += 1
+        rank -= _BINOMIALS[position][size]
+        mask |= 1 << squares[position]
+    return mask
+
+
+def _mirror(mask: int) -> int:
+    """Demi-tour du plateau: case c -> 31 - c"""
+    reverse = _BYTE_REVERSE
+    return (reverse[mask & 0xFF] << 24 | reverse[mask >> 8 & 0xFF] << 16
+            | reverse[mask >> 16 & 0xFF] << 8 | reverse[mask >> 24 & 0xFF])
+
+
+def _successor(own: int, opponent: int, kings: int, move: Move) -> Tuple[int, int, int]:
+    """Position normalisée (trait à l'adversaire) après un coup du joueur au trait"""
+    start = 1 << move.from_square
+    end = 1 << move.to_square
+    captures = move.captures
+    promoted = kings & start or end & _PROMOTION_ROW
+    own = (own & ~start) | end
+    opponent &= ~captures
+    kings = (kings & ~start & ~captures) | (end if promoted else 0)
+    return _mirror(opponent), _mirror(own), _mirror(kings)
+
+
+# --- Génération ---------------------------------------------------------------
+
+def table_path(directory: str, signature: Signature) -> str:
+    """Chemin du fichier d'une signature"""
+    return os.path.join(directory, "{}p{}k-{}p{}k.dtb".format(*signature))
+
+
+def signature_levels(max_pieces: int) -> List[List[Tuple[Signature, ...]]]:
+    """
+    Groupes de signatures à résoudre ensemble, par niveaux
+
+    Un groupe réunit une signature et sa symétrique; les groupes d'un même
+    niveau (même nombre de pièces et de pions) sont indépendants, et ne
+    dépendent que des niveaux précédents.
+    """
+    levels: Dict[Tuple[int, int], set] = {}
+    for own_pawns in range(max_pieces + 1):
+        for own_kings in range(max_pieces + 1 - own_pawns):
+            for opponent_pawns in range(max_pieces + 1 - own_pawns - own_kings):
+                for opponent_kings in range(max_pieces + 1 - own_pawns - own_kings - opponent_pawns):
+                    if own_pawns + own_kings == 0 or opponent_pawns + opponent_kings == 0:
+                        continue
+                    signature = (own_pawns, own_kings, opponent_pawns, opponent_kings)
+                    swapped = (opponent_pawns, opponent_kings, own_pawns, own_kings)
+                    level = (sum(signature), own_pawns + opponent_pawns)
+                    levels.setdefault(level, set()).add(tuple(sorted({signature, swapped})))
+    return [sorted(levels[level]) for level in sorted(levels)]
+
+
+def build_tablebase(
+    directory: str,
+    max_pieces: int,
+    workers: int | None = None,
+    distance: bool = True
+) -> List[Signature]:
+    """
+    Construit les tables de toutes les positions d'au plus `max_pieces` pièces
+
+    Les tables déjà présentes dans `directory` sont conservées (reprise).
+
+    workers: Nombre de processus (défaut: tous les cœurs, 1 = dans ce processus)
+    distance: Enregistrer aussi la distance de chaque position
+
+    Returns:
+        Les signatures construites
+    """
+    os.makedirs(directory, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    built: List[Signature] = []
+    for level in signature_levels(max_pieces):
+        tasks = [
+            (directory, group, distance)
+            for group in level
+            if not all(os.path.exists(table_path(directory, signature)) for signature in group)
+        ]
+        if workers == 1 or len(tasks) <= 1:
+            results = list(map(_solve_task, tasks))
+        else:
+            with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+                results = pool.map(_solve_task, tasks, chunksize=1)
+        for group in results:
+            built.extend(group)
+    return built
+
+
+def write_table(path: str, signature: Signature, outcomes: bytes, distances: bytes | None = None) -> None:
+    """Écrit une table (fichier temporaire renommé: jamais de table à moitié écrite)"""
+    packed = bytearray((len(outcomes) + 3) // 4)
+    for index, outcome in enumerate(outcomes):
+        if outcome:
+            packed[index >> 2] |= outcome << (2 * (index & 3))
+    flags = _FLAG_DISTANCE if distances is not None else 0
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as output:
+        output.write(_HEADER.pack(MAGIC, VERSION, *signature, len(outcomes), flags))
+        output.write(packed)
+        if distances is not None:
+            output.write(distances)
+    os.replace(temporary, path)
+
+
+def _solve_task(task: tuple) -> Tuple[Signature, ...]:
+    """Résout un groupe et écrit ses tables (exécuté dans un processus du pool)"""
+    directory, group, distance = task
+    with Tablebase(directory) as tablebase:
+        outcomes, distances = solve_group(group, tablebase)
+    offset = 0
+    for signature in group:
+        size = table_size(signature)
+        write_table(table_path(directory, signature), signature, outcomes[offset:offset + size],
+                    distances[offset:offset + size] if distance else None)
+        offset += size
+    return group
+
+
+def solve_group(group: Tuple[Signature, ...], tablebase: Tablebase) -> Tuple[bytearray, bytearray]:
+    """
+    Analyse rétrograde d'un groupe de signatures
+
+    tablebase: Tables des signatures atteintes par capture ou promotion
+
+    Returns:
+        (résultats, distances) des positions du groupe, tables mises bout à bout
+    """
+    offsets: Dict[Signature, int] = {}
+    total = 0
+    for signature in group:
+        offsets[signature] = total
+        total += table_size(signature)
+
+    outcomes = bytearray(total)
+    distances = bytearray(total)
+    valid = bytearray(total)
+    remaining = array('H', bytes(2 * total))      # successeurs du groupe pas encore gagnants
+    loss_distance = array('H', bytes(2 * total))  # plus longue défense connue
+    blocked = bytearray(total)                    # un successeur ne perd pas: pas de perte possible
+    edge_sources, edge_targets = array('I'), array('I')
+    wins: Dict[int, List[int]] = {}
+    losses: Dict[int, List[int]] = {}
+
+    # Coups de chaque position: successeurs hors du groupe lus dans les tables,
+    # successeurs du groupe retenus comme arêtes
+    for signature, offset in offsets.items():
+        for index in range(table_size(signature)):
+            position = position_from_index(signature, index)
+            if position is None:
+                continue
+            node = offset + index
+            valid[node] = 1
+            own, opponent, kings = position
+            moves = GameState(Board(own, opponent, kings, Player.WHITE)).generate_legal_moves()
+            if not moves:
+                losses.setdefault(0, []).append(node)
+                continue
+
+            win_distance = None
+            internal = 0
+            for move in moves:
+                successor = _successor(own, opponent, kings, move)
+                if not successor[0]:
+                    result = (Outcome.LOSS, 0)  # l'adversaire n'a plus de pièce
+                else:
+                    successor_signature, successor_index = position_index(*successor)
+                    if successor_signature in offsets:
+                        edge_sources.append(node)
+                        edge_targets.append(offsets[successor_signature] + successor_index)
+                        internal += 1
+                        continue
+                    result = tablebase.probe_position(*successor)
+                    if result is None:
+                        raise ValueError(f"Table manquante pour la signature {successor_signature}")
+                outcome, successor_distance = result
+                successor_distance = successor_distance or 0
+                if outcome == Outcome.LOSS:
+                    if win_distance is None or successor_distance + 1 < win_distance:
+                        win_distance = successor_distance + 1
+                elif outcome == Outcome.WIN:
+                    loss_distance[node] = max(loss_distance[node], successor_distance + 1)
+                else:
+                    blocked[node] = 1
+
+            remaining[node] = internal
+            if win_distance is not None:
+                blocked[node] = 1
+                wins.setdefault(win_distance, []).append(node)
+            elif internal == 0 and not blocked[node]:
+                losses.setdefault(loss_distance[node], []).append(node)
+
+    # Prédécesseurs de chaque position (tableaux compacts, indexés par la cible)
+    starts = array('I', bytes(4 * (total + 1)))
+    for target in edge_targets:
+        starts[target + 1] += 1
+    for node in range(total):
+        starts[node + 1] += starts[node]
+    predecessors = array('I', bytes(4 * len(edge_targets)))
+    filled = array('I', starts[:total])
+    for source, target in zip(edge_sources, edge_targets):
+        predecessors[filled[target]] = source
+        filled[target] += 1
+    del edge_sources, edge_targets, filled
+
+    # Propagation par distance croissante
+    distance = 0
+    while wins or losses:
+        resolved = []
+        for outcome, queue in ((Outcome.WIN, wins), (Outcome.LOSS, losses)):
+            for node in queue.pop(distance, ()):
+                if not outcomes[node]:
+                    outcomes[node] = outcome
+                    distances[node] = min(distance, MAX_DISTANCE)
+                    resolved.append(node)
+        for node in resolved:
+            lost = outcomes[node] == Outcome.LOSS
+            for predecessor in predecessors[starts[node]:starts[node + 1]]:
+                if outcomes[predecessor]:
+                    continue
+                if lost:
+                    wins.setdefault(distance + 1, []).append(predecessor)
+                    blocked[predecessor] = 1
+                else:
+                    remaining[predecessor] -= 1
+                    loss_distance[predecessor] = max(loss_distance[predecessor], distance + 1)
+                    if remaining[predecessor] == 0 and not blocked[predecessor]:
+                        losses.setdefault(loss_distance[predecessor], []).append(predecessor)
+        distance += 1
+
+    for node in range(total):
+        if valid[node] and not outcomes[node]:
+            outcomes[node] = Outcome.DRAW
+    return outcomes, distances
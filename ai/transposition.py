@@ -0,0 +1,98 @@
+"""
+Table de transposition pour Alpha-Beta
+Mémorise le résultat des positions déjà explorées (clé de Zobrist)
+"""
+from enum import Enum
+from typing import NamedTuple, TYPE_CHECKING
+
+from models.move import Move
+
+if TYPE_CHECKING:
+    from .search import SearchStats
+
+
+class Bound(Enum):
+    """Nature du score mémorisé"""
+    EXACT = 0  # score exact
+    LOWER = 1  # score >= valeur (coupure beta)
+    UPPER = 2  # score <= valeur (aucun coup n'a dépassé alpha)
+
+
+class TTEntry(NamedTuple):
+    """
+    Entrée de la table
+
+    score est exprimé du point de vue du joueur qui a le trait dans la position
+    """
+    key: int
+    depth: int
+    score: float
+    bound: Bound
+    move: Move | None
+    generation: int
+
+
+class TranspositionTable:
+    """
+    Table de taille bornée, indexée par les bits de poids faible de la clé
+
+    Chaque case contient deux entrées:
+      - une entrée "profondeur" remplacée seulement par une recherche au moins
+        aussi profonde (ou par une entrée d'une recherche plus récente)
+      - une entrée "toujours remplacée" qui garde le dernier résultat
+    """
+
+    ENTRY_BYTES = 160  # estimation de l'empreinte mémoire d'une entrée en Python
+
+    def __init__(self, size_mb: float = 16):
+        slots = max(1, int(size_mb * 1024 * 1024) // (2 * self.ENTRY_BYTES))
+        self.size = 1 << (slots.bit_length() - 1)  # puissance de 2 <= slots
+        self._mask = self.size - 1
+        self._depth_slots: list[TTEntry | None] = [None] * self.size
+        self._recent_slots: list[TTEntry | None] = [None] * self.size
+        self.generation = 0
+
+    def new_search(self) -> None:
+        """Signale une nouvelle recherche: les anciennes entrées deviennent remplaçables"""
+        self.generation += 1
+
+    def clear(self) -> None:
+        """Vide la table"""
+        self._depth_slots = [None] * self.size
+        self._recent_slots = [None] * self.size
+        self.generation = 0
+
+    def probe(self, key: int, stats: 'SearchStats') -> TTEntry | None:
+        """Cherche une position, met à jour les compteurs hits/misses/collisions"""
+        index = key & self._mask
+
+        entry = self._depth_slots[index]
+        if entry is not None and entry.key == key:
+            stats.tt_hits += 1
+            return entry
+        recent = self._recent_slots[index]
+        if recent is not None and recent.key == key:
+            stats.tt_hits += 1
+            return recent
+
+        stats.tt_misses += 1
+        if entry is not None or recent is not None:
+            stats.tt_collisions += 1
+        return None
+
+    def store(self, key: int, depth: int, score: float, bound: Bound, move: Move | None) -> None:
+        """Mémorise un résultat (score du point de vue du joueur qui a le trait)"""
+        index = key & self._mask
+        new_entry = TTEntry(key, depth, score, bound, move, self.generation)
+
+        entry = self._depth_slots[index]
+        if (entry is None or entry.key == key or depth >= entry.depth
+                or entry.generation != self.generation):
+            self._depth_slots[index] = new_entry
+        else:
+            self._recent_slots[index] = new_entry
+
+    def __len__(self) -> int:
+        """Nombre d'entrées occupées"""
+        return (sum(entry is not None for entry in self._depth_slots)
+                + sum(entry is not None for entry in self._recent_slots))
@@ -0,0 +1,75 @@
+"""
+Observateurs de partie: affichage console et moteur de rendu
+"""
+from interfaces.game_listener import IGameListener
+from interfaces.renderer import IRenderer
+from models.game import Game, GameResult
+from models.move import Move
+from models.types import Player
+
+
+class ConsoleListener(IGameListener):
+    """Affiche le déroulement de la partie dans la console"""
+
+    def __init__(self, show_board: bool = True):
+        """
+        Args:
+            show_board: Afficher le plateau en texte à chaque tour
+        """
+        self.show_board = show_board
+
+    def on_game_start(self, game: Game) -> None:
+        print(f"\n{'='*50}")
+        print(f"NOUVELLE PARTIE")
+        print(f"Blancs: {game.player_name(Player.WHITE)}")
+        print(f"Noirs: {game.player_name(Player.BLACK)}")
+        print(f"{'='*50}\n")
+
+    def on_turn_start(self, game: Game) -> None:
+        print(f"\n--- Tour {game.move_count + 1} ({game.board.current_player}) ---")
+        if self.show_board:
+            print(game.board.pretty_print())
+        print(f"{game.current_player.get_name()} réfléchit...")
+
+    def on_search_stats(self, game: Game, stats) -> None:
+        print(f"  → Nœuds explorés: {stats.nodes_explored}")
+        print(f"  → Temps: {stats.time_seconds:.3f}s")
+        print(f"  → Vitesse: {stats.nodes_per_second:,.0f} nœuds/s, "
+              f"{stats.cutoffs} coupures")
+
+    def on_move_played(self, game: Game, move: Move) -> None:
+        print(f"Coup joué: {move}")
+
+    def on_repetition_draw(self, game: Game) -> None:
+        print("\nMatch nul (répétition de position) !")
+
+    def on_game_over(self, game: Game, result: GameResult) -> None:
+        if result.reason == 'abandon':
+            print("Abandon !")
+            return
+        if result.winner is None:
+            if result.reason == 'move-cap':
+                print("\nMatch nul (limite de coups atteinte) !")
+            return
+        print(f"\n{'='*50}")
+        print(f"PARTIE TERMINÉE !")
+        print(f"Gagnant: {game.player_name(result.winner)}")
+        print(f"Nombre de tours: {result.move_count}")
+        print(f"{'='*50}\n")
+
+
+class RendererListener(IGameListener):
+    """Affiche la partie avec un moteur de rendu (Tkinter...)"""
+
+    def __init__(self, renderer: IRenderer):
+        self.renderer = renderer
+
+    def on_turn_start(self, game: Game) -> None:
+        self.renderer.render(game.board)
+
+    def on_repetition_draw(self, game: Game) -> None:
+        self.renderer.show_message("Match nul (répétition de position)")
+
+    def on_game_over(self, game: Game, result: GameResult) -> None:
+        if result.winner is not None:
+            self.renderer.show_message(f"Gagnant: {game.player_name(result.winner)}")
@@ -55,12 +55,10 @@ class TkinterRenderer(IRenderer):
                 color = '#f0d9b5' if (row + col) % 2 == 0 else '#b58863'
                 self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='black')
         
-        # Pièces
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece(row, col)
-                if piece:
-                    self._draw_piece(row, col, piece[0], piece[1])
+        # Pièces (uniquement les cases occupées)
+        for player in (Player.WHITE, Player.BLACK):
+            for (row, col), piece_type in board.iter_pieces(player):
+                self._draw_piece(row, col, player, piece_type)
         
         # Surbrillance
         if self.selected_pos:
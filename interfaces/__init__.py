@@ -4,7 +4,8 @@ Architecture SOLID - Inversion de dépendances
 """
 
 from .player import IPlayer
-from .evaluator import IEvaluator
+from .evaluator import IEvaluator, IBatchEvaluator
 from .renderer import IRenderer
+from .game_listener import IGameListener
 
-__all__ = ['IPlayer', 'IEvaluator', 'IRenderer']
+__all__ = ['IPlayer', 'IEvaluator', 'IBatchEvaluator', 'IRenderer', 'IGameListener']
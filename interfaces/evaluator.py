@@ -3,10 +3,11 @@ Interface pour les fonctions d'évaluation
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Sequence, Tuple
 
 if TYPE_CHECKING:
     from models.board import Board
+    from models.piece_square import PieceSquareTable
 
 
 class IEvaluator(ABC):
@@ -26,3 +27,37 @@ class IEvaluator(ABC):
     def get_name(self) -> str:
         """Obtenir le nom de l'évaluateur"""
         pass
+    
+    def piece_square_table(self) -> 'PieceSquareTable | None':
+        """
+        Termes incrémentaux de l'évaluation (matériel, valeurs pièce-case)
+        
+        La recherche fait suivre cette table à son plateau de travail
+        (Board.track): apply_move et undo_move en tiennent la somme à jour.
+        None si l'évaluateur n'en déclare pas.
+        """
+        return None
+
+
+# Position sous forme de bitboards: (blancs, noirs, dames, valeur du joueur au trait)
+PositionTuple = Tuple[int, int, int, int]
+
+
+class IBatchEvaluator(IEvaluator):
+    """
+    Évaluateur capable de noter plusieurs positions en un seul appel
+    
+    La recherche s'en sert pour évaluer d'un coup tous les enfants d'un nœud
+    frontière (dont les enfants sont des feuilles).
+    """
+    
+    @abstractmethod
+    def evaluate_positions(self, positions: Sequence[PositionTuple]) -> List[float]:
+        """
+        Évaluer plusieurs positions
+        
+        Returns:
+            Un score par position, du point de vue de son joueur au trait
+            (mêmes valeurs que evaluate)
+        """
+        pass
@@ -0,0 +1,44 @@
+"""
+Interface pour les observateurs d'une partie (affichage, journal...)
+"""
+
+from abc import ABC
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models.game import Game, GameResult
+    from models.move import Move
+    from ai.search import SearchStats
+
+
+class IGameListener(ABC):
+    """
+    Interface abstraite pour un observateur de partie
+
+    Chaque événement a une implémentation vide par défaut: un observateur
+    ne redéfinit que ceux qui l'intéressent.
+    """
+    
+    def on_game_start(self, game: 'Game') -> None:
+        """La partie commence"""
+        pass
+    
+    def on_turn_start(self, game: 'Game') -> None:
+        """Un joueur va choisir son coup (game.board, game.current_player)"""
+        pass
+    
+    def on_search_stats(self, game: 'Game', stats: 'SearchStats') -> None:
+        """Statistiques de la recherche du joueur IA qui vient de choisir"""
+        pass
+    
+    def on_move_played(self, game: 'Game', move: 'Move') -> None:
+        """Un coup vient d'être appliqué au plateau"""
+        pass
+    
+    def on_repetition_draw(self, game: 'Game') -> None:
+        """La même position est apparue trois fois: match nul"""
+        pass
+    
+    def on_game_over(self, game: 'Game', result: 'GameResult') -> None:
+        """La partie est terminée (victoire, nulle ou abandon)"""
+        pass
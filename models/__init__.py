@@ -5,7 +5,8 @@ Logique métier pure sans dépendances externes
 
 from .types import Player, Piece, CellState
 from .move import Move
-from .board import Board
+from .board import Board, UndoInfo
 from .game_state import GameState
+from .game import Game, GameResult
 
-__all__ = ['Player', 'Piece', 'CellState', 'Move', 'Board', 'GameState']
+__all__ = ['Player', 'Piece', 'CellState', 'Move', 'Board', 'UndoInfo', 'GameState', 'Game', 'GameResult']
@@ -0,0 +1,75 @@
+"""
+Représentation bitboard des 32 cases jouables
+
+Numérotation: case = row * 4 + col // 2 (de haut en bas, de gauche à droite).
+Le bit n d'un masque correspond à la case n.
+"""
+from typing import Iterator, Tuple
+
+Position = Tuple[int, int]
+Direction = Tuple[int, int]
+
+FULL_MASK = 0xFFFFFFFF
+EVEN_ROWS = 0x0F0F0F0F  # rangées 0, 2, 4, 6 (cases en colonnes impaires)
+ODD_ROWS = 0xF0F0F0F0   # rangées 1, 3, 5, 7 (cases en colonnes paires)
+LEFT_EDGE = 0x10101010  # colonne 0
+RIGHT_EDGE = 0x08080808  # colonne 7
+
+ROW_MASKS = tuple(0xF << (4 * row) for row in range(8))
+
+
+def is_dark_square(row: int, col: int) -> bool:
+    """Vérifie si (row, col) est une case jouable du plateau"""
+    return 0 <= row < 8 and 0 <= col < 8 and (row + col) % 2 == 1
+
+
+def square_index(row: int, col: int) -> int:
+    """Indice (0-31) d'une case jouable"""
+    return row * 4 + (col >> 1)
+
+
+def square_position(square: int) -> Position:
+    """Position (row, col) d'un indice de case (0-31)"""
+    row = square >> 2
+    return row, 2 * (square & 3) + ((row + 1) & 1)
+
+
+def square_bit(row: int, col: int) -> int:
+    """Masque d'une case jouable"""
+    return 1 << (row * 4 + (col >> 1))
+
+
+def _build_region(predicate) -> int:
+    mask = 0
+    for square in range(32):
+        if predicate(*square_position(square)):
+            mask |= 1 << square
+    return mask
+
+
+CENTER_MASK = _build_region(lambda row, col: 2 <= row <= 5 and 2 <= col <= 5)
+
+
+def shift(mask: int, direction: Direction) -> int:
+    """
+    Décale toutes les cases d'un masque d'un pas diagonal
+    Les cases qui sortiraient du plateau disparaissent
+    """
+    dr, dc = direction
+    even = mask & EVEN_ROWS
+    odd = mask & ODD_ROWS
+    if dr < 0:
+        if dc < 0:
+            return (even >> 4) | ((odd & ~LEFT_EDGE) >> 5)
+        return ((even & ~RIGHT_EDGE) >> 3) | (odd >> 4)
+    if dc < 0:
+        return ((even << 4) | ((odd & ~LEFT_EDGE) << 3)) & FULL_MASK
+    return (((even & ~RIGHT_EDGE) << 5) | (odd << 4)) & FULL_MASK
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Itère sur les indices des bits à 1, par ordre croissant"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
@@ -2,123 +2,297 @@
 Plateau de jeu (Board) pour les Dames
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
-from copy import deepcopy
+from typing import Iterator, List, Optional, Tuple
 from .types import CellState, Player, Piece, cell_state_from
 from .move import Move, Position
+from .bitboard import (
+    FULL_MASK, ROW_MASKS, is_dark_square, square_bit, square_index, square_position, iter_bits
+)
+from .zobrist import PIECE_KEYS, SIDE_KEY, compute_key, piece_kind
+from .piece_square import PieceSquareTable
 
 
 @dataclass
-class Board:
+class UndoInfo:
     """
-    Représente le plateau de jeu 8x8
+    Informations nécessaires pour annuler un coup (voir Board.undo_move)
     
-    grid: Grille 8x8 avec des CellState
+    move: Coup joué
+    captured: Masque des pièces capturées
+    captured_kings: Masque des dames parmi les pièces capturées
+    promoted: True si le coup a promu un pion en dame
+    previous_player: Joueur qui avait le trait avant le coup
+    previous_key: Clé de Zobrist des pièces avant le coup
+    previous_score: Somme de la table pièce-case suivie avant le coup
+    """
+    move: Move
+    captured: int
+    captured_kings: int
+    promoted: bool
+    previous_player: Player
+    previous_key: int
+    previous_score: int = 0
+
+    @property
+    def captured_pieces(self) -> List[Tuple[Position, CellState]]:
+        """Pièces capturées avec leur type"""
+        victim = self.previous_player.opponent()
+        return [
+            (square_position(square),
+             cell_state_from(victim, Piece.KING if self.captured_kings >> square & 1 else Piece.PAWN))
+            for square in iter_bits(self.captured)
+        ]
+
+
+@dataclass
+class Board:
+    """
+    Représente le plateau de jeu 8x8 sous forme de bitboards
+
+    Seules les 32 cases jouables sont stockées (voir models.bitboard).
+    white: Masque des pièces blanches
+    black: Masque des pièces noires
+    kings: Masque des dames (des deux couleurs)
     current_player: Joueur dont c'est le tour
+
+    Les masques ne doivent être modifiés qu'à travers set_piece, remove_piece,
+    apply_move et undo_move, qui tiennent la clé de Zobrist à jour (ainsi
+    que la somme de la table pièce-case suivie, voir track).
+    Ils servent d'ensembles de pièces: les comptes (count_pawns, count_kings)
+    sont des popcounts en temps constant et iter_pieces ne visite que les
+    cases occupées.
     """
-    grid: List[List[CellState]] = field(default_factory=lambda: [[CellState.EMPTY for _ in range(8)] for _ in range(8)])
+    white: int = 0
+    black: int = 0
+    kings: int = 0
     current_player: Player = Player.WHITE
+    piece_key: int = field(init=False, repr=False, compare=False)
+    score_table: Optional[PieceSquareTable] = field(default=None, init=False, repr=False, compare=False)
+    table_score: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.piece_key = compute_key(self.white, self.black, self.kings)
 
     @staticmethod
     def initial_board() -> "Board":
         """Crée le plateau initial"""
-        board = Board()
-        # Pièces NOIRES aux rangées 0-2 (en haut)
-        for row in range(3):
-            for col in range(8):
-                if (row + col) % 2 == 1:  # Cases jouables uniquement
-                    board.grid[row][col] = CellState.BLACK_PAWN
-        
-        # Pièces BLANCHES aux rangées 5-7 (en bas)
-        for row in range(5, 8):
-            for col in range(8):
-                if (row + col) % 2 == 1:
-                    board.grid[row][col] = CellState.WHITE_PAWN
-        
-        board.current_player = Player.WHITE
-        return board
-
-    def clone(self) -> "Board":
-        """Crée une copie profonde du plateau"""
         return Board(
-            grid=deepcopy(self.grid),
-            current_player=self.current_player
+            # Pièces BLANCHES aux rangées 5-7 (en bas)
+            white=ROW_MASKS[5] | ROW_MASKS[6] | ROW_MASKS[7],
+            # Pièces NOIRES aux rangées 0-2 (en haut)
+            black=ROW_MASKS[0] | ROW_MASKS[1] | ROW_MASKS[2],
+            current_player=Player.WHITE
         )
 
+    @property
+    def zobrist_key(self) -> int:
+        """Clé de Zobrist 64 bits de la position (pièces et trait)"""
+        if self.current_player == Player.BLACK:
+            return self.piece_key ^ SIDE_KEY
+        return self.piece_key
+
+    @property
+    def grid(self) -> List[List[CellState]]:
+        """Grille 8x8 de CellState (copie en lecture seule, reconstruite à chaque appel)"""
+        return [[self.get_cell(row, col) for col in range(8)] for row in range(8)]
+
+    def clone(self) -> "Board":
+        """Crée une copie du plateau"""
+        board = Board(self.white, self.black, self.kings, self.current_player)
+        board.score_table = self.score_table
+        board.table_score = self.table_score
+        return board
+
+    def track(self, table: Optional[PieceSquareTable]) -> None:
+        """
+        Suit une table pièce-case: table_score (somme de la table sur les
+        pièces) est ensuite mis à jour par chaque modification du plateau
+
+        None arrête le suivi. Un seul suivi à la fois.
+        """
+        self.score_table = table
+        self.table_score = table.score(self.white, self.black, self.kings) if table is not None else 0
+
+    def pieces_of(self, player: Player) -> int:
+        """Masque des pièces d'un joueur"""
+        return self.white if player == Player.WHITE else self.black
+
+    def get_cell(self, row: int, col: int) -> CellState:
+        """Retourne l'état d'une case"""
+        if not is_dark_square(row, col):
+            return CellState.EMPTY
+        bit = square_bit(row, col)
+        if self.white & bit:
+            return CellState.WHITE_KING if self.kings & bit else CellState.WHITE_PAWN
+        if self.black & bit:
+            return CellState.BLACK_KING if self.kings & bit else CellState.BLACK_PAWN
+        return CellState.EMPTY
+
     def get_piece(self, row: int, col: int) -> Optional[Tuple[Player, Piece]]:
         """Retourne (Joueur, Pièce) ou None si vide"""
-        cell = self.grid[row][col]
-        if cell == CellState.EMPTY:
+        if not is_dark_square(row, col):
             return None
-        return (cell.player(), cell.piece_type())
+        bit = square_bit(row, col)
+        if self.white & bit:
+            return (Player.WHITE, Piece.KING if self.kings & bit else Piece.PAWN)
+        if self.black & bit:
+            return (Player.BLACK, Piece.KING if self.kings & bit else Piece.PAWN)
+        return None
 
     def set_piece(self, row: int, col: int, cell_state: CellState) -> None:
-        """Place une pièce"""
-        self.grid[row][col] = cell_state
+        """Place une pièce (uniquement sur une case jouable)"""
+        if cell_state == CellState.EMPTY:
+            self.remove_piece(row, col)
+            return
+        if not is_dark_square(row, col):
+            raise ValueError(f"Case non jouable: {(row, col)}")
+        self.remove_piece(row, col)
+        square = square_index(row, col)
+        bit = 1 << square
+        is_white = cell_state.player() == Player.WHITE
+        is_king = cell_state.piece_type() == Piece.KING
+        if is_white:
+            self.white |= bit
+        else:
+            self.black |= bit
+        if is_king:
+            self.kings |= bit
+        self.piece_key ^= PIECE_KEYS[piece_kind(is_white, is_king)][square]
+        if self.score_table is not None:
+            self.table_score += self.score_table.values[piece_kind(is_white, is_king)][square]
 
     def remove_piece(self, row: int, col: int) -> None:
         """Retire une pièce"""
-        self.grid[row][col] = CellState.EMPTY
+        if not is_dark_square(row, col):
+            return
+        square = square_index(row, col)
+        bit = 1 << square
+        if not (self.white | self.black) & bit:
+            return
+        kind = piece_kind(self.white & bit, self.kings & bit)
+        self.piece_key ^= PIECE_KEYS[kind][square]
+        if self.score_table is not None:
+            self.table_score -= self.score_table.values[kind][square]
+        clear = FULL_MASK ^ bit
+        self.white &= clear
+        self.black &= clear
+        self.kings &= clear
 
-    def apply_move(self, move: Move) -> None:
+    def apply_move(self, move: Move) -> UndoInfo:
         """
         Applique un coup sur le plateau (modification en place)
         Gère le déplacement et les captures
-        """
-        start_row, start_col = move.start
-        end_row, end_col = move.end
-        
-        # Récupère la pièce
-        piece_cell = self.grid[start_row][start_col]
-        
-        # Enlève de la position de départ
-        self.remove_piece(start_row, start_col)
-        
-        # Retire les pièces capturées
-        for cap_row, cap_col in move.captured_positions:
-            self.remove_piece(cap_row, cap_col)
         
+        Returns:
+            Les informations permettant d'annuler le coup avec undo_move
+        """
+        start = move.from_square
+        start_bit = 1 << start
+        end = move.to_square
+        end_bit = 1 << end
+
+        is_white = bool(self.white & start_bit)
+        is_king = bool(self.kings & start_bit)
+        previous_key = key = self.piece_key
+
+        captured = move.captures
+        captured_kings = self.kings & captured
+        if captured:
+            victim_pawn = PIECE_KEYS[piece_kind(not is_white, False)]
+            victim_king = PIECE_KEYS[piece_kind(not is_white, True)]
+            for square in iter_bits(captured):
+                key ^= (victim_king if captured_kings >> square & 1 else victim_pawn)[square]
+
         # Promotion (pion devient dame)
-        if piece_cell in (CellState.WHITE_PAWN, CellState.BLACK_PAWN):
-            if (piece_cell == CellState.WHITE_PAWN and end_row == 0) or \
-               (piece_cell == CellState.BLACK_PAWN and end_row == 7):
-                piece_cell = CellState.WHITE_KING if piece_cell == CellState.WHITE_PAWN else CellState.BLACK_KING
-        
-        # Place à la destination
-        self.set_piece(end_row, end_col, piece_cell)
-        
+        if is_white:
+            self.white = (self.white ^ start_bit) | end_bit
+            self.black &= ~captured
+            promote = not is_king and end < 4  # rangée 0
+        else:
+            self.black = (self.black ^ start_bit) | end_bit
+            self.white &= ~captured
+            promote = not is_king and end >= 28  # rangée 7
+
+        self.kings &= ~(captured | start_bit)
+        if is_king or promote:
+            self.kings |= end_bit
+
+        key ^= PIECE_KEYS[piece_kind(is_white, is_king)][start]
+        key ^= PIECE_KEYS[piece_kind(is_white, is_king or promote)][end]
+        self.piece_key = key
+
+        # Somme de la table suivie: seules les cases modifiées comptent
+        previous_score = score = self.table_score
+        table = self.score_table
+        if table is not None:
+            values = table.values
+            score -= values[piece_kind(is_white, is_king)][start]
+            score += values[piece_kind(is_white, is_king or promote)][end]
+            if captured:
+                victim_pawn = values[piece_kind(not is_white, False)]
+                victim_king = values[piece_kind(not is_white, True)]
+                for square in iter_bits(captured):
+                    score -= (victim_king if captured_kings >> square & 1 else victim_pawn)[square]
+            self.table_score = score
+
         # Change de joueur
-        self.current_player = self.current_player.opponent()
+        previous_player = self.current_player
+        self.current_player = previous_player.opponent()
+        return UndoInfo(move, captured, captured_kings, promote, previous_player, previous_key, previous_score)
+
+    def undo_move(self, undo: UndoInfo) -> None:
+        """Annule un coup joué avec apply_move (doit être le dernier coup joué)"""
+        start_bit = 1 << undo.move.from_square
+        end_bit = 1 << undo.move.to_square
+        moved = start_bit | end_bit
+
+        if self.white & end_bit:
+            self.white ^= moved
+            self.black |= undo.captured
+        else:
+            self.black ^= moved
+            self.white |= undo.captured
+
+        was_king = self.kings & end_bit and not undo.promoted
+        self.kings = (self.kings & ~end_bit) | undo.captured_kings
+        if was_king:
+            self.kings |= start_bit
+
+        self.current_player = undo.previous_player
+        self.piece_key = undo.previous_key
+        self.table_score = undo.previous_score
 
     def count_pieces(self, player: Player) -> int:
         """Compte les pièces d'un joueur"""
-        count = 0
-        for row in range(8):
-            for col in range(8):
-                piece = self.get_piece(row, col)
-                if piece and piece[0] == player:
-                    count += 1
-        return count
+        return self.pieces_of(player).bit_count()
+
+    def count_pawns(self, player: Player) -> int:
+        """Compte les pions d'un joueur"""
+        return (self.pieces_of(player) & ~self.kings).bit_count()
+
+    def count_kings(self, player: Player) -> int:
+        """Compte les dames d'un joueur"""
+        return (self.pieces_of(player) & self.kings).bit_count()
 
     def get_all_pieces(self, player: Player) -> List[Position]:
         """Retourne les positions de toutes les pièces d'un joueur"""
-        positions = []
-        for row in range(8):
-            for col in range(8):
-                piece = self.get_piece(row, col)
-                if piece and piece[0] == player:
-                    positions.append((row, col))
-        return positions
+        return [square_position(square) for square in iter_bits(self.pieces_of(player))]
+
+    def iter_pieces(self, player: Player) -> Iterator[Tuple[Position, Piece]]:
+        """Parcourt uniquement les cases occupées par un joueur: ((row, col), Pièce)"""
+        kings = self.kings
+        for square in iter_bits(self.pieces_of(player)):
+            yield square_position(square), Piece.KING if kings >> square & 1 else Piece.PAWN
 
     def pretty_print(self) -> str:
         """Représentation textuelle du plateau"""
         lines = ["  0 1 2 3 4 5 6 7", "  +-+-+-+-+-+-+-+-+"]
-        
+
         for row in range(8):
-            row_str = f"{row}|" + "|".join(str(self.grid[row][col]) for col in range(8)) + "|"
+            row_str = f"{row}|" + "|".join(str(self.get_cell(row, col)) for col in range(8)) + "|"
             lines.append(row_str)
             lines.append("  +-+-+-+-+-+-+-+-+")
-        
+
         lines.append(f"Joueur actuel: {self.current_player}")
         return "\n".join(lines)
 
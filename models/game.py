@@ -0,0 +1,131 @@
+"""
+Déroulement d'une partie (boucle de jeu réutilisable)
+
+La boucle ne fait aucun affichage: elle émet des événements vers des
+observateurs (voir interfaces.game_listener). Sans observateur, une partie
+tourne à la vitesse brute du moteur.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from interfaces.game_listener import IGameListener
+from interfaces.player import IPlayer
+from .board import Board
+from .game_state import GameState
+from .types import Player
+
+
+@dataclass
+class GameResult:
+    """
+    Résultat d'une partie
+
+    winner: Joueur gagnant (None pour une nulle ou un abandon)
+    reason: 'no-moves' (l'adversaire ne peut plus jouer), 'repetition',
+            'move-cap' (plafond de coups atteint) ou 'abandon'
+    move_count: Nombre de coups joués
+    """
+    winner: Optional[Player]
+    reason: str
+    move_count: int
+
+
+class Game:
+    """
+    Partie entre deux joueurs
+
+    Événements émis, dans l'ordre: on_game_start, puis à chaque tour
+    on_turn_start, on_search_stats (joueurs IA), on_move_played, et enfin
+    on_repetition_draw (le cas échéant) et on_game_over.
+    """
+
+    def __init__(
+        self,
+        white: IPlayer,
+        black: IPlayer,
+        listeners: Iterable[IGameListener] = (),
+        board: Board | None = None,
+        max_moves: int | None = None
+    ):
+        """
+        Args:
+            white: Joueur blanc (humain ou IA)
+            black: Joueur noir (humain ou IA)
+            listeners: Observateurs de la partie
+            board: Position de départ (défaut: position initiale)
+            max_moves: Plafond de coups (partie nulle au-delà)
+        """
+        self.players: Dict[Player, IPlayer] = {Player.WHITE: white, Player.BLACK: black}
+        self.listeners: List[IGameListener] = list(listeners)
+        self.board = board if board is not None else Board.initial_board()
+        self.game_state = GameState(self.board)
+        self.max_moves = max_moves
+        self.move_count = 0
+        # Positions vues, indexées par leur clé de Zobrist (pièces + trait)
+        self.position_counts = {self.board.zobrist_key: 1}
+        self.result: GameResult | None = None
+
+    @property
+    def current_player(self) -> IPlayer:
+        """Joueur qui a le trait"""
+        return self.players[self.board.current_player]
+
+    def add_listener(self, listener: IGameListener) -> None:
+        """Ajoute un observateur"""
+        self.listeners.append(listener)
+
+    def player_name(self, player: Player) -> str:
+        """Nom du joueur d'une couleur"""
+        return self.players[player].get_name()
+
+    def play(self) -> GameResult:
+        """Joue la partie jusqu'au bout et retourne son résultat"""
+        board = self.board
+        game_state = self.game_state
+        listeners = self.listeners
+
+        for listener in listeners:
+            listener.on_game_start(self)
+
+        while True:
+            if game_state.is_game_over():
+                return self._finish(game_state.get_winner(), 'no-moves')
+            if self.max_moves is not None and self.move_count >= self.max_moves:
+                return self._finish(None, 'move-cap')
+
+            for listener in listeners:
+                listener.on_turn_start(self)
+
+            # Choisir le coup
+            player = self.current_player
+            move = player.choose_move(board)
+            if move is None:
+                return self._finish(None, 'abandon')
+
+            if listeners:
+                get_stats = getattr(player, 'get_stats', None)
+                stats = get_stats() if get_stats is not None else None
+                if stats is not None:
+                    for listener in listeners:
+                        listener.on_search_stats(self, stats)
+
+            # Appliquer le coup
+            game_state.apply_move(move)
+            self.move_count += 1
+            for listener in listeners:
+                listener.on_move_played(self, move)
+
+            # Détection de répétition (match nul si même position 3 fois)
+            key = board.zobrist_key
+            count = self.position_counts.get(key, 0) + 1
+            self.position_counts[key] = count
+            if count >= 3:
+                for listener in listeners:
+                    listener.on_repetition_draw(self)
+                return self._finish(None, 'repetition')
+
+    def _finish(self, winner: Player | None, reason: str) -> GameResult:
+        self.result = GameResult(winner, reason, self.move_count)
+        for listener in self.listeners:
+            listener.on_game_over(self, self.result)
+        return self.result
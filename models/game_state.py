@@ -1,10 +1,12 @@
 """
 État du jeu et règles (logique métier)
 """
-from typing import List, Set, Tuple
+from typing import Iterator, List, Tuple
 from .board import Board
-from .move import Move, Position
+from .move import Move
 from .types import Player, Piece, CellState
+from .bitboard import FULL_MASK, ROW_MASKS, iter_bits, shift
+from .tables import JUMPS, NEIGHBORS, PAWN_DIRECTIONS, RAY_MASKS, RAYS
 
 
 def is_valid_position(row: int, col: int) -> bool:
@@ -38,214 +40,301 @@ class GameState:
     
     def __init__(self, board: Board):
         self.board = board
+        # Statut terminal mis en cache, valable pour la position de clé _status_key
+        self._status_key: int | None = None
+        self._game_over = False
     
-    def generate_legal_moves(self, player: Player | None = None) -> List[Move]:
+    def generate_legal_moves(self, player: Player | None = None, capture: bool | None = None) -> List[Move]:
         """
         Génère tous les coups légaux
         RÈGLE IMPORTANTE: Si une capture est possible, elle est obligatoire
+        capture: Résultat de has_capture(player) s'il est déjà connu
         """
         if player is None:
             player = self.board.current_player
+        if capture is None:
+            capture = self.has_capture(player)
         
-        captures = self._generate_capture_moves(player)
-        if captures:
-            return captures  # Capture obligatoire !
+        if capture:
+            return list(self._iter_capture_moves(player))  # Capture obligatoire !
         
-        return self._generate_simple_moves(player)
+        return list(self._iter_simple_moves(player))
     
-    def _generate_simple_moves(self, player: Player) -> List[Move]:
-        """Génère les coups simples (non-capture)"""
-        moves = []
+    def iter_legal_moves(self, player: Player | None = None, capture: bool | None = None) -> Iterator[Move]:
+        """
+        Génère les coups légaux à la demande, pièce par pièce
+        Étape 1: les captures (si une capture existe, il n'y a pas d'étape 2)
+        Étape 2: les coups simples
+        Rien n'est calculé au-delà de ce que le consommateur demande
+        capture: Résultat de has_capture(player) s'il est déjà connu
+        """
+        if player is None:
+            player = self.board.current_player
+        if capture is None:
+            capture = self.has_capture(player)
+        
+        if capture:
+            yield from self._iter_capture_moves(player)
+        else:
+            yield from self._iter_simple_moves(player)
+    
+    def count_legal_moves(self, player: Player | None = None) -> int:
+        """
+        Nombre de coups légaux, égal à len(generate_legal_moves(player))
+        Compté sur les masques sans créer de Move ni copier le plateau
+        (mobilité des évaluateurs); la capture reste obligatoire
+        """
+        if player is None:
+            player = self.board.current_player
+        
+        board = self.board
+        own = board.pieces_of(player)
+        enemies = board.pieces_of(player.opponent())
+        empty = ~(board.white | board.black) & FULL_MASK
         
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.get_piece(row, col)
-                if piece is None or piece[0] != player:
-                    continue
-                
-                piece_type = piece[1]
-                
-                if piece_type == Piece.PAWN:
-                    # Les pions ne se déplacent que d'une case
-                    directions = get_pawn_directions(player)
-                    for dr, dc in directions:
-                        new_row, new_col = row + dr, col + dc
-                        
-                        if is_playable_square(new_row, new_col) and self.board.get_piece(new_row, new_col) is None:
-                            move = Move(
-                                path=[(row, col), (new_row, new_col)],
-                                captured_positions=set()
-                            )
-                            moves.append(move)
-                else:
-                    # Les dames peuvent se déplacer de plusieurs cases en diagonale
-                    directions = get_king_directions()
-                    for dr, dc in directions:
-                        distance = 1
-                        while True:
-                            new_row = row + dr * distance
-                            new_col = col + dc * distance
-                            
-                            # Vérifier si on sort du plateau
-                            if not is_playable_square(new_row, new_col):
-                                break
-                            
-                            # Vérifier si la case est occupée
-                            if self.board.get_piece(new_row, new_col) is not None:
-                                break
-                            
-                            # Case valide : ajouter le mouvement
-                            move = Move(
-                                path=[(row, col), (new_row, new_col)],
-                                captured_positions=set()
-                            )
-                            moves.append(move)
-                            
-                            # Continuer dans cette direction
-                            distance += 1
+        # Coups simples comptés en une passe, qui détecte aussi les captures
+        # (mêmes tests que has_capture)
+        count = 0
+        capture = False
+        capturers = 0  # pions qui peuvent sauter (les dames sont toutes essayées)
+        pawns = own & ~board.kings
+        if pawns:
+            for direction in get_pawn_directions(player):
+                steps = shift(pawns, direction)
+                count += (steps & empty).bit_count()
+                landings = shift(steps & enemies, direction) & empty
+                if landings:
+                    capture = True
+                    back = (-direction[0], -direction[1])
+                    capturers |= shift(shift(landings, back), back)
+        kings = own & board.kings
+        if kings:
+            for direction in get_king_directions():
+                frontier = shift(kings, direction)
+                while frontier:
+                    if shift(frontier & enemies, direction) & empty:
+                        capture = True
+                    frontier &= empty
+                    count += frontier.bit_count()
+                    frontier = shift(frontier, direction)
+        if not capture:
+            return count
         
-        return moves
+        # Capture obligatoire: seules les rafles comptent
+        promotion_row = ROW_MASKS[0] if player == Player.WHITE else ROW_MASKS[7]
+        pawn_directions = PAWN_DIRECTIONS[player]
+        return sum(
+            _count_capture_sequences(square, bool(board.kings >> square & 1), enemies, empty,
+                                     pawn_directions, promotion_row)
+            for square in iter_bits(capturers | kings)
+        )
     
-    def _generate_capture_moves(self, player: Player) -> List[Move]:
-        """Génère tous les coups de capture (avec multi-capture)"""
-        captures = []
+    def has_capture(self, player: Player | None = None) -> bool:
+        """Vérifie par masques si le joueur a au moins une capture"""
+        if player is None:
+            player = self.board.current_player
+        
+        board = self.board
+        own = board.pieces_of(player)
+        enemies = board.pieces_of(player.opponent())
+        empty = ~(board.white | board.black) & FULL_MASK
         
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.get_piece(row, col)
-                if piece is None or piece[0] != player:
-                    continue
-                
-                piece_type = piece[1]
-                sequences = self._find_capture_sequences(
-                    row, col, player, piece_type, set()
-                )
-                captures.extend(sequences)
+        # Pions: ennemi adjacent et case d'atterrissage vide derrière lui
+        pawns = own & ~board.kings
+        if pawns:
+            for direction in get_pawn_directions(player):
+                if shift(shift(pawns, direction) & enemies, direction) & empty:
+                    return True
         
-        return captures
+        # Dames: glisser sur les cases vides jusqu'à un ennemi suivi d'une case vide
+        kings = own & board.kings
+        if kings:
+            for direction in get_king_directions():
+                frontier = shift(kings, direction)
+                while frontier:
+                    if shift(frontier & enemies, direction) & empty:
+                        return True
+                    frontier = shift(frontier & empty, direction)
+        
+        return False
+    
+    def has_legal_move(self, player: Player | None = None) -> bool:
+        """Vérifie par masques si le joueur peut jouer (sans générer de coups)"""
+        if player is None:
+            player = self.board.current_player
+        
+        board = self.board
+        own = board.pieces_of(player)
+        empty = ~(board.white | board.black) & FULL_MASK
+        
+        pawns = own & ~board.kings
+        if pawns:
+            for direction in get_pawn_directions(player):
+                if shift(pawns, direction) & empty:
+                    return True
+        kings = own & board.kings
+        if kings:
+            for direction in get_king_directions():
+                if shift(kings, direction) & empty:
+                    return True
+        
+        # Aucun déplacement simple: seule une capture peut encore sauver le joueur
+        return self.has_capture(player)
     
-    def _find_capture_sequences(
-        self, 
-        row: int, 
-        col: int, 
-        player: Player, 
-        piece_type: Piece,
-        captured: Set[Position],
-        path: List[Position] | None = None
-    ) -> List[Move]:
+    def is_pseudo_legal(self, move: Move, player: Player | None = None, capture: bool | None = None) -> bool:
         """
-        Trouve récursivement toutes les séquences de capture
+        Vérification rapide d'un coup venant d'ailleurs (table de transposition,
+        killer...): pièce du joueur au départ, arrivée libre, pièces capturées
+        adverses, et capture jouée si et seulement si une capture est possible.
+        Un coup simple est entièrement vérifié (pion vers l'avant, dame sur des
+        cases vides); le chemin intermédiaire d'une rafle n'est pas revérifié.
+        capture: Résultat de has_capture(player) s'il est déjà connu
+        """
+        if player is None:
+            player = self.board.current_player
+        
+        board = self.board
+        start = 1 << move.from_square
+        end = 1 << move.to_square
+        if not board.pieces_of(player) & start:
+            return False
+        if end != start and (board.white | board.black) & end:
+            return False
+        
+        captures = move.captures
+        if captures & ~board.pieces_of(player.opponent()):
+            return False
+        if capture is None:
+            capture = self.has_capture(player)
+        if captures or capture:
+            return bool(captures) == capture
+        
+        # Coup simple: déplacement possible pour ce type de pièce
+        target = move.to_square
+        if not board.kings & start:
+            neighbors = NEIGHBORS[move.from_square]
+            return any(neighbors[direction] == target for direction in PAWN_DIRECTIONS[player])
+        occupied = board.white | board.black
+        for ray in RAYS[move.from_square]:
+            for square in ray:
+                if square == target:
+                    return True
+                if occupied >> square & 1:
+                    break
+        return False
+    
+    def _iter_simple_moves(self, player: Player) -> Iterator[Move]:
+        """Génère les coups simples (non-capture) en parcourant les tables précalculées"""
+        board = self.board
+        own = board.pieces_of(player)
+        kings = board.kings
+        empty = ~(board.white | board.black) & FULL_MASK
+        pawn_directions = PAWN_DIRECTIONS[player]
+        
+        for square in iter_bits(own):
+            if not kings >> square & 1:
+                # Les pions ne se déplacent que d'une case
+                neighbors = NEIGHBORS[square]
+                for direction in pawn_directions:
+                    target = neighbors[direction]
+                    if target >= 0 and empty >> target & 1:
+                        yield Move.from_squares(square, target)
+            else:
+                # Les dames glissent sur les cases vides de chaque diagonale
+                for ray in RAYS[square]:
+                    for target in ray:
+                        if not empty >> target & 1:
+                            break
+                        yield Move.from_squares(square, target)
+    
+    def _iter_capture_moves(self, player: Player) -> Iterator[Move]:
+        """Génère tous les coups de capture (avec multi-capture), pièce par pièce"""
+        board = self.board
+        
+        for square in iter_bits(board.pieces_of(player)):
+            piece_type = Piece.KING if board.kings >> square & 1 else Piece.PAWN
+            yield from self._find_capture_sequences(square, player, piece_type)
+    
+    def _find_capture_sequences(self, square: int, player: Player, piece_type: Piece) -> List[Move]:
+        """
+        Trouve toutes les séquences de capture d'une pièce (parcours itératif)
         Gère les multi-captures (sauts consécutifs avec la même pièce)
+        Les pièces capturées restent sur le plateau jusqu'à la fin de la rafle
+        
+        Un seul chemin et un seul masque de captures sont modifiés en place
+        le long du parcours; un Move n'est créé qu'en fin de séquence.
+        Les séquences qui finissent sur la même case avec les mêmes captures
+        ne donnent qu'un seul coup (le premier trouvé).
+        
+        square: Case de départ de la pièce (indice 0-31)
         """
-        if path is None:
-            path = [(row, col)]
+        board = self.board
+        enemies = board.pieces_of(player.opponent())
+        empty = ~(board.white | board.black) & FULL_MASK
+        promotion_row = ROW_MASKS[0] if player == Player.WHITE else ROW_MASKS[7]
+        pawn_directions = PAWN_DIRECTIONS[player]
         
-        found_sequences = []
+        is_king = piece_type == Piece.KING
+        captured = 0
+        path = [square]
+        sequences = []
+        seen = set()
         
-        if piece_type == Piece.PAWN:
-            # Les pions capturent comme avant (saut de 2 cases)
-            directions = get_pawn_directions(player)
-            
-            for dr, dc in directions:
-                enemy_row, enemy_col = row + dr, col + dc
-                land_row, land_col = row + 2*dr, col + 2*dc
-                
-                if not is_playable_square(land_row, land_col):
-                    continue
-                
-                if (enemy_row, enemy_col) in captured:
-                    continue
-                
-                enemy_piece = self.board.get_piece(enemy_row, enemy_col)
-                if enemy_piece is None or enemy_piece[0] != player.opponent():
-                    continue
-                
-                if self.board.get_piece(land_row, land_col) is not None:
-                    continue
-                
-                # Capture valide !
-                new_captured = captured | {(enemy_row, enemy_col)}
-                new_path = path + [(land_row, land_col)]
-                
-                # Promouvoir en dame si atteint dernière ligne
-                new_piece_type = piece_type
-                if (player == Player.WHITE and land_row == 0) or \
-                   (player == Player.BLACK and land_row == 7):
-                    new_piece_type = Piece.KING
-                
-                # Chercher des captures supplémentaires
-                continuations = self._find_capture_sequences(
-                    land_row, land_col, player, new_piece_type,
-                    new_captured, new_path
-                )
-                
-                if continuations:
-                    found_sequences.extend(continuations)
-                else:
-                    found_sequences.append(Move(
-                        path=new_path,
-                        captured_positions=new_captured
-                    ))
+        # Pile de cadres: [sauts possibles, prochain saut, bit capturé pour y arriver, était dame]
+        hops = _capture_hops(square, is_king, enemies, empty, pawn_directions)
+        stack = [[hops, 0, 0, is_king]]
         
-        else:  # KING - Peut capturer à distance
-            directions = get_king_directions()
+        while stack:
+            frame = stack[-1]
+            hops, index = frame[0], frame[1]
+            
+            if index == len(hops):
+                # Toutes les suites explorées: revenir au saut précédent
+                stack.pop()
+                if frame[2]:
+                    captured ^= frame[2]
+                    is_king = frame[3]
+                    path.pop()
+                continue
+            frame[1] = index + 1
             
-            for dr, dc in directions:
-                # Chercher un ennemi dans cette direction
-                distance = 1
-                enemy_found = None
-                enemy_pos = None
-                
-                while True:
-                    check_row = row + dr * distance
-                    check_col = col + dc * distance
-                    
-                    if not is_playable_square(check_row, check_col):
-                        break
-                    
-                    piece_at = self.board.get_piece(check_row, check_col)
-                    
-                    if piece_at is not None:
-                        # On a trouvé une pièce
-                        if piece_at[0] == player.opponent() and enemy_found is None:
-                            # C'est un ennemi et c'est le premier trouvé
-                            if (check_row, check_col) not in captured:
-                                enemy_found = piece_at
-                                enemy_pos = (check_row, check_col)
-                                distance += 1
-                                continue
-                        # Pièce alliée ou deuxième ennemi : arrêter
-                        break
-                    
-                    # Case vide
-                    if enemy_found is not None:
-                        # On a déjà trouvé un ennemi, donc on peut atterrir ici
-                        land_row, land_col = check_row, check_col
-                        
-                        new_captured = captured | {enemy_pos}
-                        new_path = path + [(land_row, land_col)]
-                        
-                        # Chercher des captures supplémentaires depuis cette position
-                        continuations = self._find_capture_sequences(
-                            land_row, land_col, player, piece_type,
-                            new_captured, new_path
-                        )
-                        
-                        if continuations:
-                            found_sequences.extend(continuations)
-                        else:
-                            found_sequences.append(Move(
-                                path=new_path,
-                                captured_positions=new_captured
-                            ))
-                    
-                    distance += 1
+            over, land = hops[index]
+            bit = 1 << over
+            was_king = is_king
+            captured |= bit
+            path.append(land)
+            # Promouvoir en dame si atteint dernière ligne
+            if promotion_row >> land & 1:
+                is_king = True
+            
+            # Chercher des captures supplémentaires depuis la case d'arrivée
+            next_hops = _capture_hops(land, is_king, enemies & ~captured, empty, pawn_directions)
+            if next_hops:
+                stack.append([next_hops, 0, bit, was_king])
+                continue
+            
+            # Fin de séquence
+            end_state = (land, captured)
+            if end_state not in seen:
+                seen.add(end_state)
+                sequences.append(Move.from_squares(square, land, captured, path[1:-1]))
+            captured ^= bit
+            is_king = was_king
+            path.pop()
         
-        return found_sequences
+        return sequences
     
     def is_game_over(self) -> bool:
-        """Vérifie si le jeu est terminé"""
-        return len(self.generate_legal_moves()) == 0
+        """
+        Vérifie si le jeu est terminé (le joueur au trait n'a aucun coup)
+        S'arrête au premier coup légal trouvé; le résultat est mis en cache
+        pour la position courante (clé de Zobrist) et partagé par get_winner
+        """
+        key = self.board.zobrist_key
+        if key != self._status_key:
+            self._game_over = not self.has_legal_move()
+            self._status_key = key
+        return self._game_over
     
     def get_winner(self) -> Player | None:
         """Retourne le gagnant si le jeu est terminé"""
@@ -256,3 +345,67 @@ class GameState:
     def apply_move(self, move: Move) -> None:
         """Applique un coup"""
         self.board.apply_move(move)
+
+
+def _count_capture_sequences(square: int, is_king: bool, enemies: int, empty: int,
+                             pawn_directions: Tuple[int, ...], promotion_row: int) -> int:
+    """
+    Nombre de rafles d'une pièce, comptées comme GameState._find_capture_sequences
+    (une par couple case d'arrivée / pièces capturées), sans construire les coups
+    """
+    ends = set()
+    # Pile de (case, dame ?, masque des pièces capturées)
+    stack = [(square, is_king, 0)]
+    while stack:
+        square, is_king, captured = stack.pop()
+        hops = _capture_hops(square, is_king, enemies & ~captured, empty, pawn_directions)
+        if not hops:
+            if captured:
+                ends.add(captured << 5 | square)  # fin de séquence
+            continue
+        for over, land in hops:
+            stack.append((land, is_king or bool(promotion_row >> land & 1), captured | 1 << over))
+    return len(ends)
+
+
+def _capture_hops(square: int, is_king: bool, enemies: int, empty: int,
+                  pawn_directions: Tuple[int, ...]) -> List[Tuple[int, int]]:
+    """
+    Sauts de capture possibles depuis une case: liste de (case sautée, arrivée)
+    
+    enemies: Masque des pièces adverses encore capturables
+    empty: Masque des cases vides (les pièces capturées restent en place)
+    """
+    hops = []
+    if not is_king:
+        # Les pions capturent en sautant par-dessus une pièce adjacente
+        jumps = JUMPS[square]
+        for direction in pawn_directions:
+            jump = jumps[direction]
+            if jump is not None and enemies >> jump[0] & 1 and empty >> jump[1] & 1:
+                hops.append(jump)
+        return hops
+    
+    # Les dames capturent à distance
+    occupied = ~empty
+    ray_masks = RAY_MASKS[square]
+    for direction in range(4):
+        blockers = ray_masks[direction] & occupied
+        if not blockers:
+            continue
+        # Première pièce rencontrée: indices décroissants vers le haut, croissants vers le bas
+        if direction < 2:
+            target = blockers.bit_length() - 1
+        else:
+            target = (blockers & -blockers).bit_length() - 1
+        
+        # La première pièce doit être un ennemi pas encore capturé
+        if not enemies >> target & 1:
+            continue
+        
+        # Atterrissages possibles: toutes les cases vides derrière l'ennemi
+        for land in RAYS[target][direction]:
+            if not empty >> land & 1:
+                break
+            hops.append((target, land))
+    return hops
@@ -1,56 +1,133 @@
 """
 Représentation d'un coup dans le jeu de Dames
 """
-from dataclasses import dataclass
-from typing import List, Set, Tuple
+from typing import Iterable, List, Set, Tuple
+
+from .bitboard import FULL_MASK, iter_bits, square_index, square_position
 
 
 Position = Tuple[int, int]
 
+# Disposition des champs dans Move.key
+_TO_SHIFT = 5
+_CAPTURES_SHIFT = 10
+_HOP_COUNT_SHIFT = 42
+_HOPS_SHIFT = 46
+_SQUARE_MASK = 0x1F
+
 
-@dataclass
 class Move:
     """
-    Représente un coup aux Dames
-    
-    path: Liste des positions (row, col) de départ jusqu'à l'arrivée
+    Représente un coup aux Dames, compacté dans un seul entier
+
+    key: bits 0-4 case de départ, 5-9 case d'arrivée (indices 0-31),
+         10-41 masque des pièces capturées, 42-45 nombre d'étapes
+         intermédiaires, puis 5 bits par étape intermédiaire
+    path: Liste des positions (row, col) de départ jusqu'à l'arrivée (dérivée)
           Simple: [départ, arrivée]
           Multi-capture: [départ, après_capture1, après_capture2, ...]
-    captured_positions: Ensemble des positions des pièces capturées
+    captured_positions: Ensemble des positions des pièces capturées (dérivé)
     """
-    path: List[Position]
-    captured_positions: Set[Position]
+    __slots__ = ('key',)
+
+    def __init__(self, path: List[Position], captured_positions: Set[Position]):
+        captures = 0
+        for position in captured_positions:
+            captures |= 1 << square_index(*position)
+        squares = [square_index(*position) for position in path]
+        self.key = _pack(squares[0], squares[-1], captures, squares[1:-1])
+
+    @classmethod
+    def from_squares(cls, start: int, end: int, captures: int = 0, hops: Iterable[int] = ()) -> "Move":
+        """Construit un coup à partir d'indices de cases (0-31) et d'un masque de captures"""
+        move = cls.__new__(cls)
+        move.key = _pack(start, end, captures, hops)
+        return move
+
+    @classmethod
+    def from_key(cls, key: int) -> "Move":
+        """Reconstruit un coup à partir de sa clé entière"""
+        move = cls.__new__(cls)
+        move.key = key
+        return move
+
+    @property
+    def from_square(self) -> int:
+        """Indice de la case de départ"""
+        return self.key & _SQUARE_MASK
+
+    @property
+    def to_square(self) -> int:
+        """Indice de la case d'arrivée"""
+        return self.key >> _TO_SHIFT & _SQUARE_MASK
+
+    @property
+    def captures(self) -> int:
+        """Masque des pièces capturées"""
+        return self.key >> _CAPTURES_SHIFT & FULL_MASK
+
+    @property
+    def hops(self) -> Tuple[int, ...]:
+        """Indices des cases intermédiaires d'une rafle"""
+        count = self.key >> _HOP_COUNT_SHIFT & 0xF
+        packed = self.key >> _HOPS_SHIFT
+        return tuple(packed >> (5 * index) & _SQUARE_MASK for index in range(count))
 
     @property
     def start(self) -> Position:
         """Position de départ"""
-        return self.path[0]
+        return square_position(self.key & _SQUARE_MASK)
 
     @property
     def end(self) -> Position:
         """Position d'arrivée"""
-        return self.path[-1]
+        return square_position(self.key >> _TO_SHIFT & _SQUARE_MASK)
+
+    @property
+    def path(self) -> List[Position]:
+        """Positions successives de la pièce (calculées à la demande)"""
+        squares = (self.from_square, *self.hops, self.to_square)
+        return [square_position(square) for square in squares]
+
+    @property
+    def captured_positions(self) -> Set[Position]:
+        """Positions des pièces capturées (calculées à la demande)"""
+        return {square_position(square) for square in iter_bits(self.captures)}
 
     @property
     def is_capture(self) -> bool:
         """True si ce coup capture des pièces"""
-        return len(self.captured_positions) > 0
+        return self.key >> _CAPTURES_SHIFT & FULL_MASK != 0
 
     @property
     def capture_count(self) -> int:
         """Nombre de pièces capturées"""
-        return len(self.captured_positions)
+        return (self.key >> _CAPTURES_SHIFT & FULL_MASK).bit_count()
 
     def __str__(self) -> str:
         if self.is_capture:
             return f"{self.start} -> {self.end} (x{self.capture_count})"
         return f"{self.start} -> {self.end}"
 
+    def __repr__(self) -> str:
+        return f"Move(path={self.path!r}, captured_positions={self.captured_positions!r})"
+
     def __hash__(self) -> int:
-        return hash((tuple(self.path), tuple(sorted(self.captured_positions))))
+        return hash(self.key)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Move):
             return False
-        return (self.path == other.path and 
-                self.captured_positions == other.captured_positions)
+        return self.key == other.key
+
+    def __reduce__(self):
+        return (Move.from_key, (self.key,))
+
+
+def _pack(start: int, end: int, captures: int, hops: Iterable[int]) -> int:
+    key = start | end << _TO_SHIFT | captures << _CAPTURES_SHIFT
+    count = 0
+    for hop in hops:
+        key |= hop << (_HOPS_SHIFT + 5 * count)
+        count += 1
+    return key | count << _HOP_COUNT_SHIFT
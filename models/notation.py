@@ -0,0 +1,60 @@
+"""
+Notation des positions (FEN du format PDN)
+
+Les cases jouables sont numérotées de 1 à 32, de haut en bas et de gauche à
+droite (numéro = indice de models.bitboard + 1). Les Noirs sont en haut.
+Exemple: "W:W21,22,K30:B1,2" -> trait aux Blancs, pions blancs en 21 et 22,
+dame blanche en 30, pions noirs en 1 et 2.
+Les coups s'écrivent "22-18" (déplacement) ou "22x15x6" (rafle: départ,
+cases d'arrivée successives).
+"""
+from .board import Board
+from .move import Move
+from .types import CellState, Player
+from .bitboard import iter_bits, square_position
+
+
+def board_from_fen(fen: str) -> Board:
+    """Construit un plateau à partir d'une FEN PDN"""
+    fields = fen.strip().rstrip('.').split(':')
+    if len(fields) != 3 or fields[0].upper() not in ('W', 'B'):
+        raise ValueError(f"FEN invalide: {fen!r}")
+
+    board = Board()
+    board.current_player = Player.WHITE if fields[0].upper() == 'W' else Player.BLACK
+
+    for field in fields[1:]:
+        color, squares = field[:1].upper(), field[1:]
+        if color not in ('W', 'B'):
+            raise ValueError(f"FEN invalide: {fen!r}")
+        for token in filter(None, (token.strip() for token in squares.split(','))):
+            is_king = token[0].upper() == 'K'
+            number = int(token[1:] if is_king else token)
+            if not 1 <= number <= 32:
+                raise ValueError(f"Case hors plateau dans la FEN: {number}")
+            if color == 'W':
+                cell = CellState.WHITE_KING if is_king else CellState.WHITE_PAWN
+            else:
+                cell = CellState.BLACK_KING if is_king else CellState.BLACK_PAWN
+            board.set_piece(*square_position(number - 1), cell)
+
+    return board
+
+
+def board_to_fen(board: Board) -> str:
+    """Représente un plateau en FEN PDN"""
+    def squares(mask: int) -> str:
+        return ','.join(
+            f"{'K' if board.kings >> square & 1 else ''}{square + 1}"
+            for square in iter_bits(mask)
+        )
+
+    side = 'W' if board.current_player == Player.WHITE else 'B'
+    return f"{side}:W{squares(board.white)}:B{squares(board.black)}"
+
+
+def move_to_pdn(move: Move) -> str:
+    """Représente un coup en notation PDN ("22-18", "22x15x6")"""
+    squares = (move.from_square, *move.hops, move.to_square)
+    separator = 'x' if move.is_capture else '-'
+    return separator.join(str(square + 1) for square in squares)
@@ -0,0 +1,58 @@
+"""
+Tables pièce-case: termes d'évaluation tenus à jour par le plateau
+
+Une valeur entière par (type de pièce, case jouable), indexée comme
+PIECE_KEYS (voir models.zobrist.piece_kind). Les valeurs des pièces noires
+sont stockées en négatif: la somme sur toutes les pièces est le score du
+point de vue des Blancs. Comme la clé de Zobrist, cette somme peut être
+tenue à jour par Board.apply_move / undo_move en ne touchant que les cases
+modifiées (voir Board.track).
+
+Les valeurs sont des entiers (les évaluateurs comptent en centièmes de
+pion): une somme tenue à jour coup après coup reste exactement égale à un
+recalcul complet.
+"""
+from dataclasses import dataclass
+from typing import Callable, Tuple
+
+from .bitboard import iter_bits
+from .types import Piece, Player
+from .zobrist import BLACK_KING, BLACK_PAWN, WHITE_KING, WHITE_PAWN
+
+_KINDS = ((WHITE_PAWN, Player.WHITE, Piece.PAWN), (WHITE_KING, Player.WHITE, Piece.KING),
+          (BLACK_PAWN, Player.BLACK, Piece.PAWN), (BLACK_KING, Player.BLACK, Piece.KING))
+
+
+@dataclass(frozen=True, eq=False)
+class PieceSquareTable:
+    """
+    Valeurs entières par type de pièce et par case (noires en négatif)
+
+    values[piece_kind][case]; deux tables sont égales si elles sont le même
+    objet (le plateau compare la table qu'il suit à celle de l'évaluateur).
+    """
+    values: Tuple[Tuple[int, ...], ...]
+
+    @classmethod
+    def from_function(cls, value: Callable[[Player, Piece, int], int]) -> "PieceSquareTable":
+        """
+        Construit la table à partir de la valeur d'une pièce pour son camp
+
+        value(joueur, pièce, case) est comptée en positif pour les Blancs et
+        en négatif pour les Noirs.
+        """
+        values = [()] * 4
+        for kind, player, piece in _KINDS:
+            sign = 1 if player == Player.WHITE else -1
+            values[kind] = tuple(sign * value(player, piece, square) for square in range(32))
+        return cls(tuple(values))
+
+    def score(self, white: int, black: int, kings: int) -> int:
+        """Somme complète sur les pièces des masques (point de vue des Blancs)"""
+        white_pawn, white_king, black_pawn, black_king = self.values
+        total = 0
+        for square in iter_bits(white):
+            total += (white_king if kings >> square & 1 else white_pawn)[square]
+        for square in iter_bits(black):
+            total += (black_king if kings >> square & 1 else black_pawn)[square]
+        return total
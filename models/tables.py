@@ -0,0 +1,51 @@
+"""
+Tables précalculées pour les 32 cases jouables (construites à l'import)
+
+Les directions sont indexées dans l'ordre de get_king_directions():
+0 = haut-gauche, 1 = haut-droite, 2 = bas-gauche, 3 = bas-droite.
+Toutes les cases sont des indices 0-31 (voir models.bitboard).
+"""
+from typing import Tuple
+
+from .bitboard import is_dark_square, square_index, square_position
+from .types import Player
+
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# Directions des pions: BLANC monte, NOIR descend
+PAWN_DIRECTIONS = {
+    Player.WHITE: (0, 1),
+    Player.BLACK: (2, 3),
+}
+
+
+def _ray(square: int, direction: Tuple[int, int]) -> Tuple[int, ...]:
+    row, col = square_position(square)
+    dr, dc = direction
+    squares = []
+    row, col = row + dr, col + dc
+    while is_dark_square(row, col):
+        squares.append(square_index(row, col))
+        row, col = row + dr, col + dc
+    return tuple(squares)
+
+
+# RAYS[case][direction]: cases parcourues par une dame, de la plus proche à la plus lointaine
+RAYS: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(_ray(square, direction) for direction in DIRECTIONS) for square in range(32)
+)
+
+# NEIGHBORS[case][direction]: case voisine, ou -1 hors du plateau
+NEIGHBORS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(ray[0] if ray else -1 for ray in rays) for rays in RAYS
+)
+
+# JUMPS[case][direction]: (case sautée, case d'atterrissage), ou None hors du plateau
+JUMPS: Tuple[Tuple[Tuple[int, int] | None, ...], ...] = tuple(
+    tuple((ray[0], ray[1]) if len(ray) >= 2 else None for ray in rays) for rays in RAYS
+)
+
+# RAY_MASKS[case][direction]: masque des cases de RAYS[case][direction]
+RAY_MASKS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sum(1 << target for target in ray) for ray in rays) for rays in RAYS
+)
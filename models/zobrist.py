@@ -0,0 +1,31 @@
+"""
+Clés de Zobrist pour identifier une position en O(1)
+
+Une clé 64 bits par (type de pièce, case jouable) et une clé pour le trait
+aux Noirs. La clé d'une position est le XOR des clés de ses pièces.
+"""
+import random
+
+from .bitboard import iter_bits
+
+WHITE_PAWN, WHITE_KING, BLACK_PAWN, BLACK_KING = range(4)
+
+_rng = random.Random(0x5EED_DA3E5)  # graine fixe: clés identiques d'une exécution à l'autre
+
+PIECE_KEYS = tuple(tuple(_rng.getrandbits(64) for _ in range(32)) for _ in range(4))
+SIDE_KEY = _rng.getrandbits(64)
+
+
+def piece_kind(is_white: bool, is_king: bool) -> int:
+    """Indice de PIECE_KEYS pour une couleur et un type de pièce"""
+    return (0 if is_white else 2) + (1 if is_king else 0)
+
+
+def compute_key(white: int, black: int, kings: int) -> int:
+    """Calcule la clé des pièces à partir des masques (sans le trait)"""
+    key = 0
+    for square in iter_bits(white):
+        key ^= PIECE_KEYS[WHITE_KING if kings >> square & 1 else WHITE_PAWN][square]
+    for square in iter_bits(black):
+        key ^= PIECE_KEYS[BLACK_KING if kings >> square & 1 else BLACK_PAWN][square]
+    return key
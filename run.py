@@ -5,110 +5,43 @@ import sys
 from typing import Optional
 
 from models.board import Board
-from models.game_state import GameState
+from models.game import Game
 from ai.ai_player import AIPlayer, Difficulty
 from interfaces.player import IPlayer
 
 
 def play_game(white_player: IPlayer, black_player: IPlayer, renderer=None) -> Optional[str]:
     """
-    Joue une partie complète
+    Joue une partie complète avec affichage (console, et renderer s'il est fourni)
     
     Args:
         white_player: Joueur blanc (humain ou IA)
         black_player: Joueur noir (humain ou IA)
     
     Returns:
-        Nom du gagnant ou None si abandon
+        Nom du gagnant, "Match nul", ou None si abandon
     """
-    board = Board.initial_board()
-    game_state = GameState(board)
-    
-    print(f"\n{'='*50}")
-    print(f"NOUVELLE PARTIE")
-    print(f"Blancs: {white_player.get_name()}")
-    print(f"Noirs: {black_player.get_name()}")
-    print(f"{'='*50}\n")
-    
-    move_count = 0
-    position_counts = {}
-    
-    def _state_key(b: Board):
-        return (
-            tuple(tuple(cell.value for cell in row) for row in b.grid),
-            b.current_player
-        )
-    
-    position_counts[_state_key(board)] = 1
-    
-    while not game_state.is_game_over():
-        move_count += 1
-        current_player = white_player if board.current_player.name == 'WHITE' else black_player
-        
-        print(f"\n--- Tour {move_count} ({board.current_player}) ---")
-        
-        # Afficher le plateau
-        if renderer:
-            renderer.render(board)
-        else:
-            print(board.pretty_print())
-        
-        # Choisir le coup
-        print(f"{current_player.get_name()} réfléchit...")
-        
-        try:
-            if hasattr(current_player, 'wait_for_move'):
-                # Joueur humain avec interface graphique
-                move = renderer.wait_for_move(board) if renderer else None
-                if move is None:
-                    print("Abandon !")
-                    return None
-            else:
-                # Joueur IA
-                move = current_player.choose_move(board)
-                
-                # Afficher les stats de l'IA
-                if isinstance(current_player, AIPlayer):
-                    stats = current_player.get_stats()
-                    if stats:
-                        print(f"  → Nœuds explorés: {stats.nodes_explored}")
-                        print(f"  → Temps: {stats.time_seconds:.3f}s")
-        
-        except KeyboardInterrupt:
-            print("\nPartie interrompue !")
-            return None
-        except Exception as e:
-            print(f"Erreur: {e}")
-            return None
-        
-        print(f"Coup joué: {move}")
-        
-        # Appliquer le coup
-        game_state.apply_move(move)
-        
-        # Détection de répétition (match nul si même position 3 fois)
-        state_key = _state_key(board)
-        position_counts[state_key] = position_counts.get(state_key, 0) + 1
-        if position_counts[state_key] >= 3:
-            print("\nMatch nul (répétition de position) !")
-            if renderer:
-                renderer.show_message("Match nul (répétition de position)")
-            return "Match nul"
-    
-    # Partie terminée
-    winner = game_state.get_winner()
-    winner_name = white_player.get_name() if winner.name == 'WHITE' else black_player.get_name()
-    
-    print(f"\n{'='*50}")
-    print(f"PARTIE TERMINÉE !")
-    print(f"Gagnant: {winner_name}")
-    print(f"Nombre de tours: {move_count}")
-    print(f"{'='*50}\n")
+    from gui.listeners import ConsoleListener, RendererListener
     
+    listeners = [ConsoleListener(show_board=renderer is None)]
     if renderer:
-        renderer.show_message(f"Gagnant: {winner_name}")
+        listeners.append(RendererListener(renderer))
+    game = Game(white_player, black_player, listeners)
     
-    return winner_name
+    try:
+        result = game.play()
+    except KeyboardInterrupt:
+        print("\nPartie interrompue !")
+        return None
+    except Exception as e:
+        print(f"Erreur: {e}")
+        return None
+    
+    if result.reason == 'abandon':
+        return None
+    if result.winner is None:
+        return "Match nul"
+    return game.player_name(result.winner)
 
 
 def main_menu():
@@ -184,26 +117,11 @@ def demo_ai_vs_ai():
 
 
 def run_performance_tests():
-    """Tests de performance de l'IA"""
-    from ai.search import choose_move
-    from ai.evaluators import MaterialEvaluator, MobilityEvaluator, AdvancedEvaluator
-    
-    board = Board.initial_board()
+    """Tests de performance de l'IA (voir tools/benchmark.py)"""
+    from tools.benchmark import main as benchmark_main
     
     print("\n=== TESTS DE PERFORMANCE ===\n")
-    
-    tests = [
-        ("Facile (Minimax depth=2)", 2, MaterialEvaluator(), False),
-        ("Moyen (Alpha-Beta depth=4)", 4, MobilityEvaluator(), True),
-        ("Difficile (Alpha-Beta depth=5)", 5, AdvancedEvaluator(), True),
-    ]
-    
-    for name, depth, evaluator, use_ab in tests:
-        print(f"{name}:")
-        move, stats = choose_move(board, depth, evaluator, use_ab)
-        print(f"  Nœuds explorés: {stats.nodes_explored}")
-        print(f"  Temps: {stats.time_seconds:.3f}s")
-        print(f"  Coup choisi: {move}\n")
+    benchmark_main(['--repeat', '1'])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,11 @@
+"""
+Stockage des parties: archive binaire compacte et import/export PDN
+"""
+
+from .archive import GameRecord, ArchiveWriter, ArchiveReader
+from .pdn import game_to_pdn, games_from_pdn, export_pdn, import_pdn
+
+__all__ = [
+    'GameRecord', 'ArchiveWriter', 'ArchiveReader',
+    'game_to_pdn', 'games_from_pdn', 'export_pdn', 'import_pdn'
+]
@@ -0,0 +1,232 @@
+"""
+Archive binaire compacte de parties
+
+Format (entiers petit-boutistes):
+    En-tête de fichier: MAGIC (7 octets) + version (1 octet)
+    Puis une suite d'enregistrements, un par partie:
+        longueur du reste de l'enregistrement (uint32)
+        résultat (uint8: 0 nulle/inconnu, 1 Blancs, 2 Noirs), raison (uint8),
+        nombre de coups (uint16), drapeaux (uint8)
+        joueur blanc, joueur noir: longueur (uint8) + texte UTF-8
+        position de départ si drapeau START: blancs, noirs, dames (3 x uint32) + trait (uint8)
+        coups, cases numérotées 0-31 (voir models.bitboard):
+            octet 1: départ | 0x20 si capture | 0x40 si étapes intermédiaires
+            octet 2: arrivée
+            si capture: masque des pièces capturées (uint32)
+            si étapes: nombre (uint8) + une case par octet
+
+Un déplacement simple occupe 2 octets. L'écriture se fait en ajout (une
+archive peut grossir partie après partie); la lecture passe par mmap et ne
+décode qu'une partie à la fois.
+"""
+import mmap
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from models.board import Board
+from models.move import Move
+from models.types import Player
+
+MAGIC = b'DAMARCH'
+VERSION = 1
+FILE_HEADER = MAGIC + bytes([VERSION])
+
+REASONS = ('unknown', 'no-moves', 'repetition', 'move-cap', 'abandon')
+
+_LENGTH = struct.Struct('<I')
+_RECORD = struct.Struct('<BBHB')
+_START = struct.Struct('<IIIB')
+_MASK = struct.Struct('<I')
+
+_FLAG_START = 0x01
+_CAPTURE = 0x20
+_HOPS = 0x40
+_SQUARE_MASK = 0x1F
+
+
+@dataclass
+class GameRecord:
+    """
+    Une partie archivée
+
+    white, black: Description des joueurs (nom ou configuration)
+    winner: Gagnant (None pour une nulle, un abandon ou un résultat inconnu)
+    reason: Fin de partie, voir REASONS (mêmes valeurs que GameResult.reason)
+    moves: Coups joués depuis la position de départ
+    start: Position de départ (None: position initiale)
+    """
+    white: str
+    black: str
+    winner: Optional[Player] = None
+    reason: str = 'unknown'
+    moves: List[Move] = field(default_factory=list)
+    start: Optional[Board] = None
+
+    def initial_board(self) -> Board:
+        """Copie de la position de départ"""
+        return self.start.clone() if self.start is not None else Board.initial_board()
+
+
+def encode_record(record: GameRecord) -> bytes:
+    """Encode une partie (enregistrement complet, longueur comprise)"""
+    if record.reason not in REASONS:
+        raise ValueError(f"Raison de fin de partie inconnue: {record.reason!r}")
+    result = {None: 0, Player.WHITE: 1, Player.BLACK: 2}[record.winner]
+    flags = _FLAG_START if record.start is not None else 0
+
+    body = bytearray(_RECORD.pack(result, REASONS.index(record.reason), len(record.moves), flags))
+    for label in (record.white, record.black):
+        # Tronqué à 255 octets sans couper un caractère multi-octets
+        encoded = label.encode('utf-8')[:255].decode('utf-8', 'ignore').encode('utf-8')
+        body.append(len(encoded))
+        body += encoded
+    if record.start is not None:
+        start = record.start
+        body += _START.pack(start.white, start.black, start.kings, start.current_player.value)
+
+    for move in record.moves:
+        captures = move.captures
+        hops = move.hops
+        body.append(move.from_square | (_CAPTURE if captures else 0) | (_HOPS if hops else 0))
+        body.append(move.to_square)
+        if captures:
+            body += _MASK.pack(captures)
+        if hops:
+            body.append(len(hops))
+            body += bytes(hops)
+
+    return _LENGTH.pack(len(body)) + bytes(body)
+
+
+def decode_record(data, offset: int = 0) -> tuple[GameRecord, int]:
+    """
+    Décode l'enregistrement qui commence à `offset`
+
+    Returns:
+        (partie, position de l'enregistrement suivant)
+    """
+    (length,) = _LENGTH.unpack_from(data, offset)
+    position = offset + _LENGTH.size
+    end = position + length
+    if end > len(data):
+        raise ValueError(f"Enregistrement tronqué à la position {offset}")
+
+    result, reason, move_count, flags = _RECORD.unpack_from(data, position)
+    position += _RECORD.size
+    labels = []
+    for _ in range(2):
+        size = data[position]
+        labels.append(bytes(data[position + 1:position + 1 + size]).decode('utf-8'))
+        position += 1 + size
+
+    start = None
+    if flags & _FLAG_START:
+        white, black, kings, side = _START.unpack_from(data, position)
+        position += _START.size
+        start = Board(white, black, kings, Player(side))
+
+    moves = []
+    for _ in range(move_count):
+        head = data[position]
+        to_square = data[position + 1]
+        position += 2
+        captures = 0
+        hops = ()
+        if head & _CAPTURE:
+            (captures,) = _MASK.unpack_from(data, position)
+            position += _MASK.size
+        if head & _HOPS:
+            count = data[position]
+            hops = tuple(data[position + 1:position + 1 + count])
+            position += 1 + count
+        moves.append(Move.from_squares(head & _SQUARE_MASK, to_square, captures, hops))
+
+    if position != end:
+        raise ValueError(f"Enregistrement corrompu à la position {offset}")
+    winner = (None, Player.WHITE, Player.BLACK)[result]
+    return GameRecord(labels[0], labels[1], winner, REASONS[reason], moves, start), end
+
+
+class ArchiveWriter:
+    """
+    Écriture en ajout dans une archive (créée si besoin)
+
+    Chaque partie est écrite immédiatement: un processus interrompu laisse
+    une archive lisible. À fermer avec close() (ou gestionnaire de contexte).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, 'rb') as existing:
+                _check_header(existing.read(len(FILE_HEADER)), path)
+        self._file = open(path, 'ab')
+        if not exists:
+            self._file.write(FILE_HEADER)
+
+    def append(self, record: GameRecord) -> None:
+        """Ajoute une partie à la fin de l'archive"""
+        self._file.write(encode_record(record))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ArchiveReader:
+    """
+    Lecture d'une archive par mmap: les parties sont décodées une à une,
+    à la demande, sans charger le fichier en mémoire
+
+    À fermer avec close() (ou gestionnaire de contexte).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_header(self._map[:len(FILE_HEADER)], path)
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        data = self._map
+        offset = len(FILE_HEADER)
+        while offset < len(data):
+            record, offset = decode_record(data, offset)
+            yield record
+
+    def count(self) -> int:
+        """Nombre de parties (parcourt les longueurs sans décoder les coups)"""
+        data = self._map
+        offset = len(FILE_HEADER)
+        games = 0
+        while offset < len(data):
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size + length
+            games += 1
+        return games
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _check_header(header: bytes, path: str) -> None:
+    if header[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} n'est pas une archive de parties")
+    if header[len(MAGIC):] != bytes([VERSION]):
+        raise ValueError(f"{path}: version d'archive non supportée")
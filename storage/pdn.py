@@ -0,0 +1,196 @@
+"""
+Import / export PDN (Portable Draughts Notation) des parties archivées
+
+Les cases sont numérotées de 1 à 32 (voir models.notation); les Blancs
+jouent en premier. Résultats: "1-0" (Blancs gagnent), "0-1" (Noirs
+gagnent), "1/2-1/2" (nulle), "*" (inconnu ou abandon).
+
+Exemple:
+    [White "HARD"]
+    [Black "MEDIUM"]
+    [Result "1-0"]
+
+    1. 22-18 11-15 2. 18x11 8x15 ... 1-0
+"""
+import re
+from typing import Iterable, Iterator, List
+
+from models.board import Board
+from models.game_state import GameState
+from models.move import Move
+from models.notation import board_from_fen, board_to_fen, move_to_pdn
+from models.tables import RAYS
+from models.types import Player
+from .archive import ArchiveReader, ArchiveWriter, GameRecord
+
+_RESULTS = {Player.WHITE: '1-0', Player.BLACK: '0-1'}
+_TAG = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+_MOVE_NUMBER = re.compile(r'^\d+\.(\.\.)?$')
+_MOVE = re.compile(r'^\d+([-x]\d+)+$')
+
+
+def game_to_pdn(record: GameRecord) -> str:
+    """Représente une partie en PDN"""
+    if record.winner is not None:
+        result = _RESULTS[record.winner]
+    elif record.reason in ('repetition', 'move-cap'):
+        result = '1/2-1/2'
+    else:
+        result = '*'
+
+    tags = [('White', record.white), ('Black', record.black), ('Result', result)]
+    board = record.initial_board()
+    if record.start is not None:
+        tags.append(('FEN', board_to_fen(board)))
+    if record.reason != 'unknown':
+        tags.append(('Termination', record.reason))
+
+    tokens = []
+    side = board.current_player
+    number = 1
+    if side == Player.BLACK and record.moves:
+        tokens.append(f"{number}...")
+    for move in record.moves:
+        if side == Player.WHITE:
+            tokens.append(f"{number}.")
+        else:
+            number += 1
+        tokens.append(move_to_pdn(move))
+        side = side.opponent()
+    tokens.append(result)
+
+    header = '\n'.join(f'[{name} "{_escape(value)}"]' for name, value in tags)
+    return f"{header}\n\n{_wrap(tokens)}\n"
+
+
+def games_from_pdn(text: str) -> Iterator[GameRecord]:
+    """
+    Lit les parties d'un texte PDN
+
+    Chaque coup est rejoué et identifié parmi les coups légaux; une rafle
+    peut être donnée sans ses cases intermédiaires ("22x6").
+    """
+    for tags, movetext in _split_games(text):
+        start = board_from_fen(tags['FEN']) if 'FEN' in tags else None
+        board = start.clone() if start is not None else Board.initial_board()
+        moves = []
+        for token in _move_tokens(movetext):
+            move = _resolve_move(board, token)
+            board.apply_move(move)
+            moves.append(move)
+
+        result = tags.get('Result', '*')
+        winner = {'1-0': Player.WHITE, '2-0': Player.WHITE, '0-1': Player.BLACK, '0-2': Player.BLACK}.get(result)
+        reason = tags.get('Termination', 'unknown')
+        if reason not in ('unknown', 'no-moves', 'repetition', 'move-cap', 'abandon'):
+            reason = 'unknown'
+        yield GameRecord(tags.get('White', '?'), tags.get('Black', '?'), winner, reason, moves, start)
+
+
+def export_pdn(archive_path: str, pdn_path: str) -> int:
+    """Convertit une archive binaire en fichier PDN; retourne le nombre de parties"""
+    games = 0
+    with ArchiveReader(archive_path) as reader, open(pdn_path, 'w', encoding='utf-8') as output:
+        for record in reader:
+            if games:
+                output.write('\n')
+            output.write(game_to_pdn(record))
+            games += 1
+    return games
+
+
+def import_pdn(pdn_path: str, archive_path: str) -> int:
+    """Ajoute les parties d'un fichier PDN à une archive; retourne le nombre de parties"""
+    with open(pdn_path, encoding='utf-8') as source:
+        text = source.read()
+    games = 0
+    with ArchiveWriter(archive_path) as writer:
+        for record in games_from_pdn(text):
+            writer.append(record)
+            games += 1
+    return games
+
+
+def _split_games(text: str) -> Iterator[tuple[dict, str]]:
+    """Découpe un texte PDN en (tags, texte des coups), une entrée par partie"""
+    tags: dict = {}
+    movetext: List[str] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('['):
+            if movetext:
+                yield tags, ' '.join(movetext)
+                tags, movetext = {}, []
+            for name, value in _TAG.findall(stripped):
+                tags[name] = value.replace('\\"', '"').replace('\\\\', '\\')
+        elif stripped:
+            movetext.append(stripped)
+    if tags or movetext:
+        yield tags, ' '.join(movetext)
+
+
+def _move_tokens(movetext: str) -> Iterable[str]:
+    """Coups d'un texte de partie (numéros, commentaires et résultat ignorés)"""
+    movetext = re.sub(r'\{[^}]*\}', ' ', movetext)
+    for token in movetext.split():
+        if _MOVE_NUMBER.match(token) or token in ('1-0', '0-1', '2-0', '0-2', '1/2-1/2', '1-1', '*'):
+            continue
+        token = re.sub(r'^\d+\.(\.\.)?', '', token)  # "1.22-18" écrit sans espace
+        if not _MOVE.match(token):
+            raise ValueError(f"Coup PDN invalide: {token!r}")
+        yield token
+
+
+def _resolve_move(board: Board, token: str) -> Move:
+    """
+    Retrouve le coup légal correspondant à un coup PDN
+
+    Une rafle notée avec ses cases intermédiaires est reconnue par son
+    départ, son arrivée et les pièces prises le long du chemin donné, quel
+    que soit l'ordre des sauts (le générateur ne garde qu'un chemin par
+    ensemble de prises). Sans cases intermédiaires, le coup doit être unique.
+    """
+    squares = [int(square) - 1 for square in re.split('[-x]', token)]
+    start, end = squares[0], squares[-1]
+    candidates = [move for move in GameState(board).generate_legal_moves()
+                  if move.from_square == start and move.to_square == end]
+    if len(squares) > 2:
+        captures = _path_captures(board, squares)
+        candidates = [move for move in candidates if move.captures == captures]
+    if len(candidates) > 1:
+        raise ValueError(f"Coup ambigu dans la position {board_to_fen(board)}: {token} "
+                         f"({', '.join(move_to_pdn(move) for move in candidates)})")
+    if not candidates:
+        raise ValueError(f"Coup illégal dans la position {board_to_fen(board)}: {token}")
+    return candidates[0]
+
+
+def _path_captures(board: Board, squares: List[int]) -> int | None:
+    """Masque des pièces entre les cases successives d'un chemin (None si un pas n'est pas diagonal)"""
+    occupied = board.white | board.black
+    captures = 0
+    for origin, target in zip(squares, squares[1:]):
+        for ray in RAYS[origin]:
+            if target in ray:
+                for square in ray[:ray.index(target)]:
+                    captures |= occupied & 1 << square
+                break
+        else:
+            return None
+    return captures
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _wrap(tokens: List[str], width: int = 79) -> str:
+    lines, line = [], ''
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > width:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+    return '\n'.join(lines)
@@ -40,6 +40,305 @@ class TestBoardSetup:
         board = Board.initial_board()
         black_pieces = board.get_all_pieces(Player.BLACK)
         assert all(row <= 2 for row, col in black_pieces)
+    
+    def test_piece_counters_and_iteration(self):
+        """Les compteurs et l'itération ne voient que les cases occupées"""
+        board = Board()
+        board.set_piece(5, 0, CellState.WHITE_PAWN)
+        board.set_piece(3, 4, CellState.WHITE_KING)
+        board.set_piece(0, 1, CellState.BLACK_PAWN)
+        
+        assert board.count_pawns(Player.WHITE) == 1
+        assert board.count_kings(Player.WHITE) == 1
+        assert sorted(board.iter_pieces(Player.WHITE)) == [((3, 4), Piece.KING), ((5, 0), Piece.PAWN)]
+        assert list(board.iter_pieces(Player.BLACK)) == [((0, 1), Piece.PAWN)]
+
+
+class TestBitboard:
+    """Tests de la représentation bitboard"""
+    
+    def test_grid_matches_pieces(self):
+        """La grille reconstruite doit refléter les masques"""
+        board = Board.initial_board()
+        cells = [cell for row in board.grid for cell in row]
+        assert cells.count(CellState.WHITE_PAWN) == 12
+        assert cells.count(CellState.BLACK_PAWN) == 12
+    
+    def test_light_square_is_rejected(self):
+        """Impossible de poser une pièce sur une case non jouable"""
+        import pytest
+        board = Board()
+        with pytest.raises(ValueError):
+            board.set_piece(0, 0, CellState.WHITE_PAWN)
+        assert board.get_piece(0, 0) is None
+    
+    def test_capture_removes_piece(self):
+        """Une capture retire la pièce adverse des masques"""
+        board = Board()
+        board.set_piece(3, 2, CellState.WHITE_PAWN)
+        board.set_piece(2, 3, CellState.BLACK_KING)
+        board.apply_move(GameState(board).generate_legal_moves()[0])
+        
+        assert board.get_piece(1, 4) == (Player.WHITE, Piece.PAWN)
+        assert board.count_pieces(Player.BLACK) == 0
+        assert board.kings == 0
+
+    def test_precomputed_tables(self):
+        """Les tables de rayons et de sauts doivent suivre les diagonales"""
+        from models.bitboard import square_index
+        from models.tables import JUMPS, NEIGHBORS, RAYS
+
+        corner = square_index(7, 0)
+        assert NEIGHBORS[corner] == (-1, square_index(6, 1), -1, -1)
+        assert len(RAYS[corner][1]) == 7  # grande diagonale
+        assert JUMPS[corner][1] == (square_index(6, 1), square_index(5, 2))
+        assert JUMPS[corner][0] is None
+
+
+class TestMakeUnmake:
+    """Tests de apply_move / undo_move"""
+    
+    def test_undo_restores_every_move(self):
+        """Annuler chaque coup doit restaurer exactement le plateau"""
+        import random
+        rng = random.Random(7)
+        board = Board.initial_board()
+        
+        for _ in range(80):
+            moves = GameState(board).generate_legal_moves()
+            if not moves:
+                break
+            for move in moves:
+                before = board.clone()
+                undo = board.apply_move(move)
+                board.undo_move(undo)
+                assert board == before
+            board.apply_move(rng.choice(moves))
+    
+    def test_undo_info_describes_capture(self):
+        """L'annulation connaît les pièces capturées et la promotion"""
+        board = Board()
+        board.set_piece(2, 1, CellState.WHITE_PAWN)
+        board.set_piece(1, 2, CellState.BLACK_KING)
+        board.current_player = Player.WHITE
+        
+        move = GameState(board).generate_legal_moves()[0]
+        undo = board.apply_move(move)
+        
+        assert undo.promoted
+        assert undo.previous_player == Player.WHITE
+        assert undo.captured_pieces == [((1, 2), CellState.BLACK_KING)]
+    
+    def test_search_leaves_board_unchanged(self):
+        """La recherche en place ne doit pas modifier le plateau"""
+        board = Board.initial_board()
+        before = board.clone()
+        alphabeta(board, 3, float('-inf'), float('inf'), True, MaterialEvaluator(), SearchStats())
+        minimax(board, 2, True, MaterialEvaluator(), SearchStats())
+        assert board == before
+
+
+class TestZobrist:
+    """Tests de la clé de Zobrist incrémentale"""
+    
+    def test_incremental_key_matches_recomputed(self):
+        """La clé mise à jour par apply_move/undo_move égale la clé recalculée"""
+        import random
+        rng = random.Random(3)
+        board = Board.initial_board()
+        
+        for _ in range(80):
+            moves = GameState(board).generate_legal_moves()
+            if not moves:
+                break
+            key = board.zobrist_key
+            undo = board.apply_move(rng.choice(moves))
+            assert board.zobrist_key == board.clone().zobrist_key
+            board.undo_move(undo)
+            assert board.zobrist_key == key
+            board.apply_move(rng.choice(moves))
+    
+    def test_key_includes_side_to_move(self):
+        """Même pièces, trait différent => clés différentes"""
+        board = Board.initial_board()
+        other = board.clone()
+        other.current_player = Player.BLACK
+        assert board.zobrist_key != other.zobrist_key
+    
+    def test_set_and_remove_update_key(self):
+        """Poser puis retirer une pièce restaure la clé"""
+        board = Board.initial_board()
+        key = board.zobrist_key
+        board.set_piece(4, 1, CellState.BLACK_KING)
+        assert board.zobrist_key != key
+        board.remove_piece(4, 1)
+        assert board.zobrist_key == key
+
+
+class TestIncrementalEvaluation:
+    """Tests des termes d'évaluation tenus à jour par le plateau"""
+
+    def test_tracked_score_matches_recomputed(self):
+        """La somme mise à jour par apply_move/undo_move égale la somme recalculée"""
+        import random
+        from ai.evaluators import AdvancedEvaluator
+        table = AdvancedEvaluator().piece_square_table()
+        rng = random.Random(5)
+        board = Board.initial_board()
+        board.track(table)
+
+        for _ in range(80):
+            moves = GameState(board).generate_legal_moves()
+            if not moves:
+                break
+            score = board.table_score
+            undo = board.apply_move(rng.choice(moves))
+            assert board.table_score == table.score(board.white, board.black, board.kings)
+            board.undo_move(undo)
+            assert board.table_score == score
+            board.apply_move(rng.choice(moves))
+
+        board.set_piece(4, 1, CellState.BLACK_KING)
+        board.remove_piece(7, 0)
+        assert board.clone().table_score == table.score(board.white, board.black, board.kings)
+
+    def test_evaluation_same_with_or_without_tracking(self):
+        """Le score ne dépend pas du suivi; le mode de débogage vérifie la somme"""
+        import pytest
+        from ai.evaluators import AdvancedEvaluator
+        from ai.search import choose_move
+        evaluator = AdvancedEvaluator(check_incremental=True)
+        board = Board.initial_board()
+        board.apply_move(GameState(board).generate_legal_moves()[0])
+        tracked = board.clone()
+        tracked.track(evaluator.piece_square_table())
+
+        assert evaluator.evaluate(tracked) == evaluator.evaluate(board)
+        choose_move(board, 3, evaluator, quiescence=True)  # chaque feuille vérifiée
+
+        tracked.table_score += 1
+        with pytest.raises(RuntimeError):
+            evaluator.evaluate(tracked)
+
+
+class TestStagedGeneration:
+    """Tests de la génération de coups à la demande"""
+    
+    def _random_positions(self, count=60, seed=11):
+        import random
+        rng = random.Random(seed)
+        board = Board.initial_board()
+        positions = []
+        while len(positions) < count:
+            moves = GameState(board).generate_legal_moves()
+            positions.append(board.clone())
+            if not moves:
+                board = Board.initial_board()
+                continue
+            board.apply_move(rng.choice(moves))
+        return positions
+    
+    def test_iterator_matches_list(self):
+        """Le générateur produit les mêmes coups, dans le même ordre"""
+        for board in self._random_positions():
+            game_state = GameState(board)
+            assert list(game_state.iter_legal_moves()) == game_state.generate_legal_moves()
+    
+    def test_cheap_checks_match_generation(self):
+        """has_capture / has_legal_move sont cohérents avec la génération complète"""
+        for board in self._random_positions():
+            game_state = GameState(board)
+            moves = game_state.generate_legal_moves()
+            assert game_state.has_legal_move() == bool(moves)
+            assert game_state.has_capture() == any(move.is_capture for move in moves)
+    
+    def test_iterator_is_lazy(self):
+        """Arrêter l'itération ne génère pas les coups restants"""
+        board = Board.initial_board()
+        moves = GameState(board).iter_legal_moves()
+        first = next(moves)
+        assert first == GameState(board).generate_legal_moves()[0]
+    
+    def test_pseudo_legal_rejects_foreign_move(self):
+        """Un coup d'une autre position est refusé"""
+        board = Board.initial_board()
+        game_state = GameState(board)
+        move = game_state.generate_legal_moves()[0]
+        assert game_state.is_pseudo_legal(move)
+        board.current_player = Player.BLACK
+        assert not game_state.is_pseudo_legal(move)
+    
+    def test_pseudo_legal_checks_quiet_geometry(self):
+        """Un coup calme d'une autre position (killer) doit être jouable ici"""
+        from models.move import Move
+        from models.bitboard import square_index
+        board = Board()
+        board.set_piece(4, 1, CellState.WHITE_PAWN)
+        board.set_piece(6, 1, CellState.WHITE_KING)
+        board.set_piece(0, 7, CellState.BLACK_PAWN)
+        game_state = GameState(board)
+        
+        def quiet(start, end):
+            return Move.from_squares(square_index(*start), square_index(*end))
+        
+        assert game_state.is_pseudo_legal(quiet((4, 1), (3, 2)))
+        assert not game_state.is_pseudo_legal(quiet((4, 1), (5, 2)))   # pion en arrière
+        assert game_state.is_pseudo_legal(quiet((6, 1), (3, 4)))       # glissade de dame
+        assert not game_state.is_pseudo_legal(quiet((6, 1), (3, 0)))   # pas une diagonale
+        assert not game_state.is_pseudo_legal(quiet((6, 1), (4, 1)))   # case occupée
+        board.set_piece(4, 3, CellState.BLACK_PAWN)
+        assert not game_state.is_pseudo_legal(quiet((6, 1), (3, 4)))   # chemin occupé
+    
+    def test_killers_are_tried_before_generation(self):
+        """Un killer jouable est proposé sans générer les coups du nœud"""
+        from ai.ordering import MoveOrderer
+        from ai.profiling import SearchProfile
+        from ai.search import _staged_moves
+        board = Board.initial_board()
+        game_state = GameState(board)
+        moves = game_state.generate_legal_moves()
+        orderer = MoveOrderer()
+        orderer.record_cutoff(moves[3], 2, 1)
+        profile = SearchProfile()
+        
+        staged = _staged_moves(board, game_state, None, True, orderer, 1, profile)
+        assert next(staged) == moves[3]
+        assert profile.movegen_seconds == 0
+        rest = list(staged)
+        assert profile.movegen_seconds > 0
+        assert sorted(rest + [moves[3]], key=str) == sorted(moves, key=str)
+
+
+class TestCompactMove:
+    """Tests de la représentation compacte des coups"""
+    
+    def test_path_and_captures_round_trip(self):
+        """path et captured_positions sont reconstruits à l'identique"""
+        from models.move import Move
+        move = Move(path=[(5, 0), (3, 2), (1, 4)], captured_positions={(4, 1), (2, 3)})
+        
+        assert move.path == [(5, 0), (3, 2), (1, 4)]
+        assert move.captured_positions == {(4, 1), (2, 3)}
+        assert move.start == (5, 0) and move.end == (1, 4)
+        assert move.capture_count == 2
+    
+    def test_equality_and_hash_use_packed_key(self):
+        """Deux coups identiques sont égaux et ont le même hash"""
+        from models.move import Move
+        a = Move(path=[(5, 0), (4, 1)], captured_positions=set())
+        b = Move.from_squares(a.from_square, a.to_square)
+        c = Move.from_key(a.key)
+        
+        assert a == b == c
+        assert len({a, b, c}) == 1
+        assert not a.is_capture
+    
+    def test_pickle(self):
+        """Les coups traversent les processus (recherche parallèle)"""
+        import pickle
+        from models.move import Move
+        move = Move(path=[(5, 0), (3, 2), (1, 4)], captured_positions={(4, 1), (2, 3)})
+        assert pickle.loads(pickle.dumps(move)) == move
 
 
 class TestMovement:
@@ -57,8 +356,8 @@ class TestMovement:
     def test_capture_is_mandatory(self):
         """Si une capture est possible, elle est obligatoire"""
         board = Board()
-        board.set_piece(3, 3, CellState.WHITE_PAWN)
-        board.set_piece(2, 4, CellState.BLACK_PAWN)  # Peut être capturé
+        board.set_piece(3, 2, CellState.WHITE_PAWN)
+        board.set_piece(2, 3, CellState.BLACK_PAWN)  # Peut être capturé
         board.current_player = Player.WHITE
         
         game_state = GameState(board)
@@ -70,15 +369,15 @@ class TestMovement:
     def test_promotion_to_king(self):
         """Un pion atteignant le bout devient dame"""
         board = Board()
-        board.set_piece(1, 1, CellState.WHITE_PAWN)
+        board.set_piece(1, 0, CellState.WHITE_PAWN)
         board.current_player = Player.WHITE
         
         from models.move import Move
-        move = Move(path=[(1, 1), (0, 0)], captured_positions=set())
+        move = Move(path=[(1, 0), (0, 1)], captured_positions=set())
         board.apply_move(move)
         
         # Vérifier que c'est maintenant une dame
-        piece = board.get_piece(0, 0)
+        piece = board.get_piece(0, 1)
         assert piece is not None
         assert piece[1] == Piece.KING
 
@@ -89,8 +388,8 @@ class TestAI:
     def test_material_evaluator(self):
         """L'évaluateur matériel doit calculer correctement"""
         board = Board()
-        board.set_piece(0, 0, CellState.WHITE_PAWN)
-        board.set_piece(1, 1, CellState.BLACK_KING)
+        board.set_piece(0, 1, CellState.WHITE_PAWN)
+        board.set_piece(1, 0, CellState.BLACK_KING)
         board.current_player = Player.WHITE
         
         evaluator = MaterialEvaluator()
@@ -99,6 +398,56 @@ class TestAI:
         # Blancs: 1 pion (+1), Noirs: 1 dame (-5) => score = -4
         assert score == -4.0
     
+    def test_advanced_scores_match_square_scan(self):
+        """Les scores égalent la somme case par case d'origine, à l'arrondi près"""
+        import random
+        from ai.evaluators import AdvancedEvaluator
+        evaluator = AdvancedEvaluator()
+        
+        def square_scan(board):
+            # Formule d'origine (balayage des 64 cases en flottants)
+            current = board.current_player
+            score = 0.0
+            for row in range(8):
+                for col in range(8):
+                    piece = board.get_piece(row, col)
+                    if piece is None:
+                        continue
+                    player, piece_type = piece
+                    value = evaluator.KING_VALUE if piece_type == Piece.KING else evaluator.PAWN_VALUE
+                    distance = row if player == Player.WHITE else 7 - row
+                    if piece_type == Piece.PAWN and distance <= 2:
+                        value += (3 - distance) * evaluator.PROMOTION_THREAT_WEIGHT
+                    if 2 <= row <= 5 and 2 <= col <= 5:
+                        value += evaluator.CENTER_WEIGHT
+                    if row == (7 if player == Player.WHITE else 0):
+                        value += evaluator.BACK_ROW_WEIGHT
+                    score += value if player == current else -value
+            return score + evaluator._calculate_mobility(board)
+        
+        rng = random.Random(1)
+        board = Board.initial_board()
+        for _ in range(60):
+            moves = GameState(board).generate_legal_moves()
+            if not moves:
+                break
+            assert abs(evaluator.evaluate(board) - square_scan(board)) < 1e-9
+            board.apply_move(rng.choice(moves))
+    
+    def test_advanced_search_is_pinned(self):
+        """Comportement de référence: profondeur 5 depuis la position initiale"""
+        import pytest
+        from ai.evaluators import AdvancedEvaluator
+        board = Board.initial_board()
+        stats = SearchStats()
+        
+        score, move = alphabeta(board, 5, float('-inf'), float('inf'), True, AdvancedEvaluator(), stats)
+        
+        # Mêmes coup et nœuds que l'évaluateur d'origine (score 0.7 à l'arrondi près)
+        assert str(move) == "(5, 6) -> (4, 7)"
+        assert stats.nodes_explored == 2181
+        assert score == pytest.approx(0.7)
+    
     def test_minimax_finds_moves(self):
         """Minimax doit trouver des coups"""
         board = Board.initial_board()
@@ -138,6 +487,562 @@ class TestAI:
         assert stats_alphabeta.nodes_explored <= stats_minimax.nodes_explored
 
 
+class TestTranspositionTable:
+    """Tests de la table de transposition"""
+    
+    def test_same_score_with_and_without_table(self):
+        """La table ne doit pas changer le score de la racine"""
+        from ai.search import SearchContext
+        from ai.transposition import TranspositionTable
+        board = Board.initial_board()
+        evaluator = MaterialEvaluator()
+        
+        plain = alphabeta(board, 4, float('-inf'), float('inf'), True, evaluator, SearchStats())
+        stats = SearchStats()
+        context = SearchContext(tt=TranspositionTable(1))
+        cached = alphabeta(board, 4, float('-inf'), float('inf'), True, evaluator, stats, context=context)
+        
+        assert cached[0] == plain[0]
+        assert stats.tt_hits > 0
+    
+    def test_depth_preferred_replacement(self):
+        """Une entrée moins profonde ne remplace pas une entrée plus profonde"""
+        from ai.transposition import TranspositionTable, Bound
+        tt = TranspositionTable(0.001)
+        stats = SearchStats()
+        deep_key, shallow_key = 1, 1 + tt.size  # même case
+        
+        tt.store(deep_key, 6, 1.0, Bound.EXACT, None)
+        tt.store(shallow_key, 2, 2.0, Bound.LOWER, None)
+        
+        assert tt.probe(deep_key, stats).depth == 6
+        assert tt.probe(shallow_key, stats).depth == 2
+        assert tt.probe(shallow_key + tt.size, stats) is None
+        assert (stats.tt_hits, stats.tt_misses, stats.tt_collisions) == (2, 1, 1)
+    
+    def test_ai_player_keeps_table(self):
+        """L'IA réutilise la même table d'un coup à l'autre"""
+        from ai.ai_player import AIPlayer, Difficulty
+        ai = AIPlayer(Difficulty.MEDIUM, tt_size_mb=1)
+        table = ai.transposition_table
+        ai.choose_move(Board.initial_board())
+        ai.choose_move(Board.initial_board())
+        assert ai.transposition_table is table
+        assert ai.get_stats().tt_hits > 0
+
+
+class TestIterativeDeepening:
+    """Tests de l'approfondissement itératif sous budget"""
+    
+    def test_unlimited_budget_matches_fixed_depth(self):
+        """Sans contrainte effective, on atteint la profondeur demandée avec le même coup"""
+        from ai.search import choose_move
+        board = Board.initial_board()
+        fixed_move, _ = choose_move(board, 3, MaterialEvaluator())
+        move, stats = choose_move(board, 3, MaterialEvaluator(), time_limit=60)
+        
+        assert stats.depth_reached == 3
+        assert move == fixed_move
+    
+    def test_node_budget_stops_search(self):
+        """Un budget de nœuds interrompt la recherche à la dernière profondeur terminée"""
+        from ai.search import choose_move
+        board = Board.initial_board()
+        move, stats = choose_move(board, 20, MaterialEvaluator(), node_limit=500)
+        
+        assert move in GameState(board).generate_legal_moves()
+        assert 1 <= stats.depth_reached < 20
+        assert stats.nodes_explored <= 501
+    
+    def test_tiny_time_budget_still_returns_move(self):
+        """Même sans itération terminée, un coup légal est retourné"""
+        from ai.search import choose_move
+        board = Board.initial_board()
+        move, stats = choose_move(board, 20, MaterialEvaluator(), time_limit=0.0)
+        
+        assert move in GameState(board).generate_legal_moves()
+
+
+class TestMoveOrdering:
+    """Tests des heuristiques de tri des coups"""
+    
+    def test_killer_move_comes_first(self):
+        """Un coup calme ayant provoqué une coupure passe devant les autres"""
+        from ai.ordering import MoveOrderer
+        board = Board.initial_board()
+        moves = GameState(board).generate_legal_moves()
+        orderer = MoveOrderer()
+        orderer.record_cutoff(moves[-1], depth=1, ply=2)
+        orderer.record_cutoff(moves[-2], depth=1, ply=1)
+        
+        assert orderer.order(board, moves, ply=2)[0] == moves[-1]
+        assert orderer.order(board, moves, ply=1)[0] == moves[-2]
+    
+    def test_history_breaks_ties(self):
+        """À priorité égale, le coup avec le meilleur historique passe devant"""
+        from ai.ordering import MoveOrderer
+        board = Board.initial_board()
+        moves = GameState(board).generate_legal_moves()
+        orderer = MoveOrderer()
+        for move in moves[-2:]:
+            orderer.record_cutoff(move, depth=1, ply=5)
+        orderer.record_cutoff(moves[-1], depth=4, ply=6)
+        
+        assert orderer.order(board, moves, ply=0)[:2] == [moves[-1], moves[-2]]
+    
+    def test_cutoff_statistics(self):
+        """Les coupures et le taux de coupure au premier coup sont mesurés"""
+        from ai.search import choose_move
+        _, stats = choose_move(Board.initial_board(), 4, MaterialEvaluator())
+        
+        assert stats.cutoffs > 0
+        assert 0.0 < stats.first_move_cutoff_rate <= 1.0
+
+
+class TestQuiescence:
+    """Tests de la recherche de quiescence"""
+    
+    def test_leaf_with_pending_capture_is_resolved(self):
+        """À profondeur 0, une capture en attente est jouée avant d'évaluer"""
+        from ai.search import SearchContext
+        board = Board()
+        board.set_piece(3, 2, CellState.WHITE_PAWN)
+        board.set_piece(2, 3, CellState.BLACK_PAWN)
+        board.set_piece(7, 0, CellState.WHITE_PAWN)
+        board.current_player = Player.WHITE
+        
+        stats = SearchStats()
+        context = SearchContext(quiescence=True)
+        score, _ = alphabeta(board, 0, float('-inf'), float('inf'), True, MaterialEvaluator(), stats, context=context)
+        
+        # Sans quiescence: 2 - 1 = 1 ; après la capture: 2 - 0 = 2
+        assert score == 2.0
+        assert stats.quiescence_nodes == 1
+    
+    def test_extension_guard(self):
+        """Le garde-fou limite la prolongation"""
+        from ai.search import SearchContext
+        board = Board()
+        board.set_piece(3, 2, CellState.WHITE_PAWN)
+        board.set_piece(2, 3, CellState.BLACK_PAWN)
+        board.current_player = Player.WHITE
+        
+        stats = SearchStats()
+        context = SearchContext(quiescence=True, max_quiescence_ply=0)
+        score, _ = alphabeta(board, 0, float('-inf'), float('inf'), True, MaterialEvaluator(), stats, context=context)
+        
+        assert score == 0.0
+        assert stats.quiescence_nodes == 0
+    
+    def test_minimax_and_alphabeta_agree(self):
+        """Avec quiescence, Minimax et Alpha-Beta trouvent le même score"""
+        from ai.search import SearchContext
+        board = Board.initial_board()
+        evaluator = MaterialEvaluator()
+        
+        mm_score, _ = minimax(board, 3, True, evaluator, SearchStats(), SearchContext(quiescence=True))
+        ab_score, _ = alphabeta(board, 3, float('-inf'), float('inf'), True, evaluator, SearchStats(),
+                                context=SearchContext(quiescence=True))
+        assert mm_score == ab_score
+
+
+class TestInstrumentation:
+    """Tests de l'instrumentation optionnelle de la recherche"""
+    
+    def test_profile_is_opt_in(self):
+        """Sans demande, aucun profil n'est collecté"""
+        from ai.search import choose_move
+        _, stats = choose_move(Board.initial_board(), 3, MaterialEvaluator())
+        assert stats.profile is None
+        assert stats.to_dict()['profile'] is None
+    
+    def test_profile_does_not_change_search(self):
+        """Le profil mesure la recherche sans en changer le résultat"""
+        import json
+        from ai.search import choose_move
+        from ai.evaluators import AdvancedEvaluator
+        board = Board.initial_board()
+        
+        move, stats = choose_move(board, 4, AdvancedEvaluator(), quiescence=True)
+        profiled_move, profiled = choose_move(board, 4, AdvancedEvaluator(), quiescence=True, profile=True)
+        
+        assert profiled_move == move
+        assert profiled.nodes_explored == stats.nodes_explored
+        report = json.loads(profiled.to_json())
+        assert report['profile']['leaf_nodes'] > 0
+        assert report['profile']['interior_nodes'] > 0
+        assert report['profile']['movegen_seconds'] > 0
+        assert report['effective_branching_factor'] > 1
+
+
+    def test_profile_splits_every_node(self):
+        """Sans table ni quiescence, chaque nœud est soit une feuille soit un nœud intérieur"""
+        from ai.search import choose_move
+        from ai.evaluators import AdvancedEvaluator
+        evaluators = [AdvancedEvaluator()]
+        try:
+            from ai.batch import BatchEvaluator
+            evaluators.append(BatchEvaluator(AdvancedEvaluator()))  # enfants notés par lot
+        except ImportError:
+            pass
+        board = Board.initial_board()
+        
+        for evaluator in evaluators:
+            for use_alphabeta in (True, False):
+                _, stats = choose_move(board, 3, evaluator, use_alphabeta=use_alphabeta, profile=True)
+                profile = stats.profile
+                assert profile.leaf_nodes + profile.interior_nodes == stats.nodes_explored
+
+
+class TestBatchEvaluation:
+    """Tests de l'évaluation par lots (NumPy)"""
+
+    def _random_positions(self, count=400, seed=5):
+        import random
+        rng = random.Random(seed)
+        board = Board.initial_board()
+        positions = []
+        while len(positions) < count:
+            moves = GameState(board).generate_legal_moves()
+            positions.append(board.clone())
+            if not moves:
+                board = Board.initial_board()
+                continue
+            board.apply_move(rng.choice(moves))
+        return positions
+
+    def test_scores_match_evaluators(self):
+        """Les scores par lots sont exactement ceux des évaluateurs d'origine"""
+        import pytest
+        pytest.importorskip("numpy")
+        from ai.batch import BatchEvaluator, boards_to_array
+        from ai.evaluators import AdvancedEvaluator, MobilityEvaluator
+        boards = self._random_positions()
+        positions = boards_to_array(boards)
+
+        for evaluator in (MaterialEvaluator(), MobilityEvaluator(), AdvancedEvaluator()):
+            scores = BatchEvaluator(evaluator).evaluate_array(positions)
+            assert scores.tolist() == [evaluator.evaluate(board) for board in boards]
+
+    def test_search_scores_frontier_in_batches(self):
+        """La recherche note les enfants des nœuds frontière par lots, sans changer de résultat"""
+        import pytest
+        pytest.importorskip("numpy")
+        from ai.batch import BatchEvaluator
+        from ai.evaluators import AdvancedEvaluator
+        from ai.search import choose_move
+
+        class CountingEvaluator(BatchEvaluator):
+            calls = 0
+
+            def evaluate_positions(self, positions):
+                self.calls += 1
+                return super().evaluate_positions(positions)
+
+        for board in self._random_positions(count=3, seed=8)[1:]:
+            batch_evaluator = CountingEvaluator(AdvancedEvaluator())
+            move, stats = choose_move(board, 3, AdvancedEvaluator(), quiescence=True)
+            batch_move, batch_stats = choose_move(board, 3, batch_evaluator, quiescence=True)
+            assert batch_evaluator.calls > 0
+            assert batch_move == move
+            assert batch_stats.nodes_explored == stats.nodes_explored
+            assert batch_stats.quiescence_nodes == stats.quiescence_nodes
+            
+            _, profiled = choose_move(board, 3, batch_evaluator, quiescence=True, profile=True)
+            assert profiled.nodes_explored == stats.nodes_explored
+
+
+class TestParallelSearch:
+    """Tests de la recherche parallèle à la racine"""
+    
+    def test_deterministic_matches_sequential(self):
+        """Le mode déterministe choisit le même coup que la recherche séquentielle"""
+        from ai.search import choose_move
+        from ai.parallel import ParallelSearcher
+        board = Board.initial_board()
+        evaluator = MaterialEvaluator()
+        expected, _ = choose_move(board, 4, evaluator)
+        
+        with ParallelSearcher(2, deterministic=True, tt_size_mb=1) as searcher:
+            first, stats_a = searcher.choose_move(board, 4, evaluator)
+            second, stats_b = searcher.choose_move(board, 4, evaluator)
+        
+        assert first == expected == second
+        assert stats_a.nodes_explored == stats_b.nodes_explored > 1
+    
+    def test_shared_alpha_finds_a_best_move(self):
+        """Avec alpha partagé, le coup trouvé a le score optimal"""
+        from ai.parallel import parallel_choose_move
+        board = Board.initial_board()
+        evaluator = MaterialEvaluator()
+        best_score, _ = alphabeta(board, 4, float('-inf'), float('inf'), True, evaluator, SearchStats())
+        
+        move, stats = parallel_choose_move(board, 4, evaluator, workers=2)
+        board.apply_move(move)
+        score, _ = alphabeta(board, 3, float('-inf'), float('inf'), False, evaluator, SearchStats())
+        
+        assert score == best_score
+        assert stats.nodes_explored > 1
+
+    def test_worker_table_ages_once_per_search(self, monkeypatch):
+        """La table d'un processus change de génération à chaque recherche de la racine"""
+        from ai import parallel
+        from ai.transposition import TranspositionTable
+        tt = TranspositionTable(1)
+        monkeypatch.setattr(parallel, '_worker_tt', tt)
+        monkeypatch.setattr(parallel, '_worker_search', None)
+        board = Board.initial_board()
+        moves = GameState(board).generate_legal_moves()
+
+        for search_id in (1, 1, 2):
+            for index, move in enumerate(moves[:2]):
+                parallel._search_root_move(search_id, index, board.clone(), move, 2,
+                                           MaterialEvaluator(), True, False, True)
+
+        assert tt.generation == 2
+
+    def test_shared_alpha_is_read_during_search(self):
+        """Un alpha relevé par un autre processus élague la recherche en cours"""
+        import multiprocessing
+        from ai.search import SearchContext
+        board = Board.initial_board()
+        evaluator = MaterialEvaluator()
+        shared_alpha = multiprocessing.Value('d', float('-inf'))
+        full = SearchStats()
+        alphabeta(board, 6, float('-inf'), float('inf'), True, evaluator, full,
+                  context=SearchContext(shared_alpha=shared_alpha))
+
+        shared_alpha.value = 100.0
+        context = SearchContext(shared_alpha=shared_alpha)
+        pruned = SearchStats()
+        alphabeta(board, 6, float('-inf'), float('inf'), True, evaluator, pruned, context=context)
+
+        assert context.alpha == 100.0
+        assert pruned.nodes_explored < full.nodes_explored
+
+    def test_single_move_reports_no_depth(self):
+        """Avec un seul coup légal, aucune recherche n'est faite: profondeur 0"""
+        from ai.parallel import parallel_choose_move
+        from models.notation import board_from_fen
+        board = board_from_fen("W:W25:B22")
+        assert len(GameState(board).generate_legal_moves()) == 1
+
+        move, stats = parallel_choose_move(board, 4, MaterialEvaluator(), workers=2)
+
+        assert move is not None
+        assert stats.depth_reached == 0
+
+
+class TestOpeningBook:
+    """Tests de la bibliothèque d'ouvertures"""
+    
+    def _build(self, tmp_path):
+        from ai.book import build_book
+        path = str(tmp_path / "book.bin")
+        build_book(path, plies=2, depth=2, evaluator=MaterialEvaluator(), margin=0.5, quiescence=False)
+        return path
+    
+    def test_lookup_finds_book_positions(self, tmp_path):
+        """La position initiale et ses suites sont dans la bibliothèque, triée par clé"""
+        from ai.book import OpeningBook
+        board = Board.initial_board()
+        with OpeningBook(self._build(tmp_path)) as book:
+            candidates = book.probe(board)
+            legal_moves = GameState(board).generate_legal_moves()
+            assert candidates and all(move in legal_moves for move, _ in candidates)
+            
+            board.apply_move(candidates[0][0])
+            assert book.probe(board)
+            board.apply_move(GameState(board).generate_legal_moves()[0])
+            assert book.choose(board) is None  # au-delà des 2 demi-coups
+    
+    def test_transpositions_keep_full_coverage(self):
+        """Une position revue avec plus de demi-coups restants est redéveloppée"""
+        from ai.book import _expand
+        from ai.transposition import TranspositionTable
+        from models.notation import board_from_fen
+        # Deux dames: une position du 4e demi-coup est aussi atteinte au 2e
+        board = board_from_fen("W:WK25:BK27")
+        positions = {}
+        _expand(board, 5, 1, MaterialEvaluator(), 100.0, False, TranspositionTable(1), positions, {})
+        checked = set()
+        
+        def covered(board, plies):
+            # Toutes les suites de coups gardés restent dans la bibliothèque
+            if plies == 0 or (board.zobrist_key, plies) in checked:
+                return True
+            checked.add((board.zobrist_key, plies))
+            if board.zobrist_key not in positions:
+                return not GameState(board).generate_legal_moves()
+            for move, _ in positions[board.zobrist_key]:
+                undo = board.apply_move(move)
+                ok = covered(board, plies - 1)
+                board.undo_move(undo)
+                if not ok:
+                    return False
+            return True
+        
+        assert covered(board, 5)
+    
+    def test_player_uses_book_before_search(self, tmp_path):
+        """Le joueur joue le coup de plus fort poids sans chercher, ou un tirage reproductible"""
+        from ai.ai_player import AIPlayer, Difficulty
+        path = self._build(tmp_path)
+        board = Board.initial_board()
+        
+        player = AIPlayer(Difficulty.HARD, book_path=path)
+        move = player.choose_move(board)
+        assert player.get_stats().nodes_explored == 0
+        assert move == max(player.book.probe(board), key=lambda candidate: candidate[1])[0]
+        
+        draws = [AIPlayer(Difficulty.HARD, book_path=path, book_random=True, book_seed=3) for _ in range(2)]
+        assert [draws[0].choose_move(board) for _ in range(5)] == [draws[1].choose_move(board) for _ in range(5)]
+        for ai_player in [player] + draws:
+            ai_player.close()
+    
+    def test_invalid_book_is_rejected(self, tmp_path):
+        """Un fichier qui n'est pas une bibliothèque est refusé"""
+        import pytest
+        from ai.book import OpeningBook
+        path = tmp_path / "book.bin"
+        path.write_bytes(b"DAMARCH\x01")
+        with pytest.raises(ValueError):
+            OpeningBook(str(path))
+
+
+class TestTablebase:
+    """Tests des tables de finales"""
+
+    def test_tables_are_consistent(self, tmp_path):
+        """Chaque résultat découle de ceux des successeurs; la génération reprend sans refaire"""
+        from ai.tablebase import Outcome, Tablebase, build_tablebase, position_from_index, position_index, table_size
+        directory = str(tmp_path / "tables")
+        assert len(build_tablebase(directory, 2, workers=1)) == 4
+        assert build_tablebase(directory, 2, workers=1) == []
+
+        with Tablebase(directory) as tablebase:
+            for signature in [(1, 0, 1, 0), (0, 1, 1, 0), (1, 0, 0, 1), (0, 1, 0, 1)]:
+                for index in range(table_size(signature)):
+                    position = position_from_index(signature, index)
+                    if position is None:
+                        continue
+                    assert position_index(*position) == (signature, index)
+                    board = Board(*position, Player.WHITE)
+                    outcome, distance = tablebase.probe(board)
+                    children = []
+                    for move in GameState(board).generate_legal_moves():
+                        undo = board.apply_move(move)
+                        children.append(tablebase.probe(board) if board.black else (Outcome.LOSS, 0))
+                        board.undo_move(undo)
+
+                    if any(child == Outcome.LOSS for child, _ in children):
+                        expected = (Outcome.WIN, 1 + min(d for child, d in children if child == Outcome.LOSS))
+                    elif all(child == Outcome.WIN for child, _ in children):
+                        expected = (Outcome.LOSS, 1 + max((d for _, d in children), default=-1))
+                    else:
+                        expected = (Outcome.DRAW, 0)
+                    assert (outcome, distance) == expected
+
+    def test_search_converts_a_won_ending(self, tmp_path):
+        """La recherche sonde les tables et choisit le gain le plus court"""
+        from ai.search import choose_move
+        from ai.tablebase import Outcome, Tablebase, build_tablebase, position_from_index, table_size
+        directory = str(tmp_path / "tables")
+        build_tablebase(directory, 2, workers=1)
+
+        with Tablebase(directory) as tablebase:
+            signature = (0, 1, 1, 0)  # dame contre pion
+            wins = []
+            for index in range(table_size(signature)):
+                position = position_from_index(signature, index)
+                if position is not None and tablebase.probe_position(*position)[0] == Outcome.WIN:
+                    wins.append((tablebase.probe_position(*position)[1], position))
+            distance, position = max(wins)
+            assert distance >= 3
+
+            board = Board(*position, Player.WHITE)  # position normalisée: les Blancs ont le trait
+            move, stats = choose_move(board, 3, MaterialEvaluator(), tablebase=tablebase)
+            assert stats.tablebase_hits > 0
+            board.apply_move(move)
+            assert tablebase.probe(board) == (Outcome.LOSS, distance - 1)
+
+
+class TestGameDriver:
+    """Tests de la boucle de jeu réutilisable"""
+    
+    class Recorder:
+        def __init__(self):
+            self.events = []
+        
+        def on_game_start(self, game):
+            self.events.append('start')
+        
+        def on_turn_start(self, game):
+            self.events.append('turn')
+        
+        def on_search_stats(self, game, stats):
+            self.events.append('stats')
+        
+        def on_move_played(self, game, move):
+            self.events.append('move')
+        
+        def on_repetition_draw(self, game):
+            self.events.append('repetition')
+        
+        def on_game_over(self, game, result):
+            self.events.append(result.reason)
+    
+    def test_events_follow_the_game(self, capsys):
+        """Les observateurs reçoivent les événements dans l'ordre, sans affichage"""
+        from models.game import Game
+        from ai.ai_player import AIPlayer, Difficulty
+        board = Board()
+        board.set_piece(2, 1, CellState.WHITE_PAWN)
+        board.set_piece(1, 2, CellState.BLACK_PAWN)
+        recorder = self.Recorder()
+        
+        result = Game(AIPlayer(Difficulty.EASY), AIPlayer(Difficulty.EASY), [recorder], board).play()
+        
+        assert result.winner == Player.WHITE and result.reason == 'no-moves'
+        assert result.move_count == 1
+        assert recorder.events == ['start', 'turn', 'stats', 'move', 'no-moves']
+        assert capsys.readouterr().out == ""
+    
+    def test_repetition_and_move_cap(self):
+        """Deux dames qui tournent en rond: nulle par répétition, ou plafond de coups"""
+        from models.game import Game
+        from interfaces.player import IPlayer
+        
+        class Shuttle(IPlayer):
+            """Fait des allers-retours entre deux cases"""
+            def __init__(self):
+                self.previous = None
+            
+            def choose_move(self, board):
+                moves = GameState(board).generate_legal_moves()
+                move = next((move for move in moves if move.to_square == self.previous), moves[0])
+                self.previous = move.from_square
+                return move
+            
+            def get_name(self):
+                return "Navette"
+        
+        def kings_board():
+            board = Board()
+            board.set_piece(7, 0, CellState.WHITE_KING)
+            board.set_piece(0, 1, CellState.BLACK_KING)
+            return board
+        
+        recorder = self.Recorder()
+        result = Game(Shuttle(), Shuttle(), [recorder], kings_board()).play()
+        assert result.winner is None and result.reason == 'repetition'
+        assert result.move_count == 8
+        assert recorder.events[-2:] == ['repetition', 'repetition']
+        
+        result = Game(Shuttle(), Shuttle(), board=kings_board(), max_moves=3).play()
+        assert result.reason == 'move-cap' and result.move_count == 3
+
+
 class TestGameState:
     """Tests de l'état du jeu"""
     
@@ -165,6 +1070,46 @@ class TestGameState:
         
         winner = game_state.get_winner()
         assert winner == Player.BLACK
+    
+    def test_terminal_status_follows_board(self):
+        """Le statut mis en cache est recalculé quand la position change"""
+        board = Board()
+        board.set_piece(2, 1, CellState.WHITE_PAWN)
+        board.set_piece(1, 2, CellState.BLACK_PAWN)
+        game_state = GameState(board)
+        
+        assert not game_state.is_game_over()
+        assert game_state.get_winner() is None
+        
+        # Les blancs capturent le dernier pion noir
+        game_state.apply_move(game_state.generate_legal_moves()[0])
+        assert game_state.is_game_over()
+        assert game_state.get_winner() == Player.WHITE
+
+    def test_count_matches_generation(self):
+        """Le compte des coups (mobilité) égale le nombre de coups générés"""
+        import random
+        rng = random.Random(11)
+        boards = []
+        for _ in range(20):
+            board = Board.initial_board()
+            for _ in range(rng.randrange(60)):
+                moves = GameState(board).generate_legal_moves()
+                if not moves:
+                    break
+                board.apply_move(rng.choice(moves))
+            boards.append(board)
+        # Positions denses en dames: rafles, promotions en cours de prise, doublons
+        for _ in range(300):
+            occupied = rng.getrandbits(32) & rng.getrandbits(32)
+            white = occupied & rng.getrandbits(32)
+            kings = occupied & rng.getrandbits(32) & rng.getrandbits(32)
+            boards.append(Board(white, occupied & ~white, kings | white & 0xF | occupied & ~white & 0xF0000000))
+
+        for board in boards:
+            game_state = GameState(board)
+            for player in (Player.WHITE, Player.BLACK):
+                assert game_state.count_legal_moves(player) == len(game_state.generate_legal_moves(player))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+"""
+Tests perft: nombres de feuilles de référence du générateur de coups
+Toute optimisation du générateur doit conserver ces valeurs
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from models.board import Board
+from models.notation import board_from_fen, board_to_fen
+from tools.perft import PERFT_POSITIONS, perft, perft_divide
+
+
+# (position, profondeur, nombre de feuilles)
+# Les rafles qui finissent sur la même case avec les mêmes prises comptent pour un coup
+KNOWN_COUNTS = [
+    ('initial', 1, 7),
+    ('initial', 2, 49),
+    ('initial', 3, 302),
+    ('initial', 4, 1469),
+    ('initial', 5, 7361),
+    ('kings', 1, 17),
+    ('kings', 3, 485),
+    ('kings', 5, 12674),
+    ('promotion', 1, 4),
+    ('promotion', 4, 409),
+    ('promotion', 6, 9240),
+    ('endgame', 1, 13),
+    ('endgame', 3, 1096),
+    ('endgame', 4, 11517),
+]
+
+
+class TestPerft:
+    """Tests du compteur perft"""
+
+    @pytest.mark.parametrize("name,depth,expected", KNOWN_COUNTS)
+    def test_known_counts(self, name, depth, expected):
+        """Les nombres de feuilles connus doivent être reproduits"""
+        board = board_from_fen(PERFT_POSITIONS[name])
+        assert perft(board, depth) == expected
+
+    def test_divide_sums_to_perft(self):
+        """Le détail par coup de la racine doit sommer au total"""
+        board = board_from_fen(PERFT_POSITIONS['kings'])
+        divide = perft_divide(board, 3)
+
+        assert len(divide) == 17
+        assert sum(count for _, count in divide) == perft(board, 3)
+
+    def test_duplicate_captures_are_merged(self):
+        """Deux ordres de prise menant au même résultat donnent un seul coup"""
+        from models.game_state import GameState
+        board = board_from_fen("W:WK20,K28:B3,K16,17,K18,K24,25,K26,32")
+        moves = GameState(board).generate_legal_moves()
+
+        outcomes = {(move.from_square, move.to_square, move.captures) for move in moves}
+        assert len(outcomes) == len(moves)
+
+    def test_perft_restores_board(self):
+        """Perft travaille en place et doit restaurer le plateau"""
+        board = Board.initial_board()
+        before = board.clone()
+        perft(board, 4)
+        assert board == before
+
+
+class TestNotation:
+    """Tests de la notation FEN"""
+
+    def test_fen_round_trip(self):
+        """FEN -> plateau -> FEN est l'identité"""
+        for fen in PERFT_POSITIONS.values():
+            assert board_to_fen(board_from_fen(fen)) == fen
+
+    def test_initial_fen(self):
+        """La position initiale a une FEN connue"""
+        board = board_from_fen("W:W21,22,23,24,25,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,9,10,11,12")
+        assert board == Board.initial_board()
+
+    def test_invalid_fen(self):
+        """Une FEN mal formée est refusée"""
+        with pytest.raises(ValueError):
+            board_from_fen("X:W1:B2")
@@ -0,0 +1,120 @@
+"""
+Tests de l'archive binaire de parties et de l'import/export PDN
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+import pytest
+
+from models.board import Board
+from models.game_state import GameState
+from models.notation import board_from_fen
+from models.types import Player
+from storage import ArchiveReader, ArchiveWriter, GameRecord, game_to_pdn, games_from_pdn
+from storage.archive import decode_record, encode_record
+
+
+def random_game(seed: int, start: Board | None = None, plies: int = 60) -> GameRecord:
+    rng = random.Random(seed)
+    board = start.clone() if start is not None else Board.initial_board()
+    moves = []
+    for _ in range(plies):
+        legal_moves = GameState(board).generate_legal_moves()
+        if not legal_moves:
+            break
+        move = rng.choice(legal_moves)
+        board.apply_move(move)
+        moves.append(move)
+    return GameRecord("HARD", "MEDIUM,nodes=500", Player.WHITE, 'no-moves', moves, start)
+
+
+class TestArchive:
+    """Tests de l'archive binaire"""
+
+    def test_record_round_trip(self):
+        """Un enregistrement se décode à l'identique, position de départ comprise"""
+        start = board_from_fen("B:WK1,17,K30:BK4,12,K29")
+        for record in (random_game(1), random_game(2, start)):
+            data = encode_record(record)
+            assert decode_record(data) == (record, len(data))
+
+    def test_long_label_is_truncated_on_character(self):
+        """Une étiquette trop longue est tronquée sans couper de caractère accentué"""
+        record = GameRecord("é" * 200, "Difficulté élevée")
+        decoded, _ = decode_record(encode_record(record))
+        assert decoded.white == "é" * 127
+        assert decoded.black == record.black
+
+    def test_simple_moves_are_two_bytes(self):
+        """Un déplacement simple occupe deux octets"""
+        record = GameRecord("A", "B", moves=GameState(Board.initial_board()).generate_legal_moves()[:1])
+        empty = GameRecord("A", "B")
+        assert len(encode_record(record)) - len(encode_record(empty)) == 2
+
+    def test_append_and_stream(self, tmp_path):
+        """Les parties s'ajoutent à une archive existante et se relisent dans l'ordre"""
+        path = str(tmp_path / "games.bin")
+        games = [random_game(seed) for seed in range(5)]
+        with ArchiveWriter(path) as writer:
+            for record in games[:3]:
+                writer.append(record)
+        with ArchiveWriter(path) as writer:
+            for record in games[3:]:
+                writer.append(record)
+
+        with ArchiveReader(path) as reader:
+            assert reader.count() == 5
+            assert list(reader) == games
+
+    def test_foreign_file_is_rejected(self, tmp_path):
+        """Un fichier qui n'est pas une archive est refusé"""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not an archive")
+        with pytest.raises(ValueError):
+            ArchiveReader(str(path))
+        with pytest.raises(ValueError):
+            ArchiveWriter(str(path))
+
+
+class TestPDN:
+    """Tests de l'import/export PDN"""
+
+    def test_pdn_round_trip(self):
+        """Export puis import redonnent la même partie"""
+        start = board_from_fen("B:WK1,17,K30:BK4,12,K29")
+        games = [random_game(3), random_game(4, start)]
+        text = '\n'.join(game_to_pdn(record) for record in games)
+        assert list(games_from_pdn(text)) == games
+
+    def test_capture_without_intermediate_squares(self):
+        """Une rafle peut être notée sans ses cases intermédiaires"""
+        text = '[FEN "W:W25:B22,15"]\n1. 25x11 *'
+        record = next(games_from_pdn(text))
+        assert record.moves[0].capture_count == 2
+        assert record.winner is None
+
+    def test_capture_with_other_intermediate_squares(self):
+        """Une rafle est reconnue par ses prises, quel que soit le chemin noté"""
+        fen = "W:WK25:B8,9,22"
+        first = next(games_from_pdn(f'[FEN "{fen}"]\n1. 25x18x4 *')).moves[0]
+        other = next(games_from_pdn(f'[FEN "{fen}"]\n1. 25x15x4 *')).moves[0]
+        assert other == first
+        assert other.capture_count == 2
+
+    def test_ambiguous_capture_is_rejected(self):
+        """Sans cases intermédiaires, une rafle qui n'est pas unique est refusée"""
+        text = '[FEN "W:WK30:B9,10,11,26"]\n1. 30x5 *'
+        with pytest.raises(ValueError, match="ambigu"):
+            list(games_from_pdn(text))
+        short = next(games_from_pdn('[FEN "W:WK30:B9,10,11,26"]\n1. 30x23x5 *')).moves[0]
+        long = next(games_from_pdn('[FEN "W:WK30:B9,10,11,26"]\n1. 30x16x7x14x5 *')).moves[0]
+        assert (short.capture_count, long.capture_count) == (2, 4)
+
+    def test_illegal_move_is_rejected(self):
+        """Un coup illégal dans la position est refusé"""
+        with pytest.raises(ValueError):
+            list(games_from_pdn('1. 22-15 *'))
@@ -0,0 +1,105 @@
+"""
+Tests des outils en ligne de commande (benchmark, auto-jeu)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+
+import pytest
+
+from ai.ai_player import Difficulty
+from models.board import Board
+from models.notation import board_from_fen
+from tools.benchmark import BENCHMARK_POSITIONS, compare, main as benchmark_main, run_benchmark
+from tools.selfplay import PlayerConfig, play_selfplay_game, run_selfplay
+
+
+class TestBenchmark:
+    """Tests du benchmark reproductible"""
+
+    def test_positions_are_valid(self):
+        """Chaque position du jeu de référence se charge"""
+        for phase, fen in BENCHMARK_POSITIONS.values():
+            assert phase in ('opening', 'middlegame', 'endgame')
+            assert isinstance(board_from_fen(fen), Board)
+
+    def test_report_is_reproducible(self):
+        """Le nombre de nœuds ne dépend que du moteur"""
+        positions = {'initial': BENCHMARK_POSITIONS['initial']}
+        first = run_benchmark([Difficulty.EASY], repeat=1, positions=positions)
+        second = run_benchmark([Difficulty.EASY], repeat=2, positions=positions)
+
+        assert first['summary']['EASY']['total_nodes'] == second['summary']['EASY']['total_nodes']
+        assert json.loads(json.dumps(first)) == first
+
+    def test_regression_is_detected(self):
+        """Une vitesse ou un nombre de nœuds dégradés au-delà du seuil sont signalés"""
+        positions = {'initial': BENCHMARK_POSITIONS['initial']}
+        report = run_benchmark([Difficulty.EASY], repeat=1, positions=positions)
+        baseline = json.loads(json.dumps(report))
+
+        assert compare(report, baseline, 0.10) == []
+
+        baseline['summary']['EASY']['median_nodes_per_second'] *= 2
+        baseline['summary']['EASY']['total_nodes'] //= 2
+        assert len(compare(report, baseline, 0.10)) == 2
+
+        baseline['version'] = report['version'] + 1
+        with pytest.raises(ValueError):
+            compare(report, baseline, 0.10)
+
+    def test_command_fails_on_regression(self, tmp_path):
+        """La commande écrit le rapport et échoue face à une référence meilleure"""
+        output = tmp_path / "bench.json"
+        assert benchmark_main(['--repeat', '1', '--difficulty', 'EASY', '--output', str(output)]) == 0
+
+        baseline = json.loads(output.read_text(encoding='utf-8'))
+        baseline['summary']['EASY']['total_nodes'] //= 2
+        output.write_text(json.dumps(baseline), encoding='utf-8')
+        assert benchmark_main(['--repeat', '1', '--difficulty', 'EASY', '--baseline', str(output)]) == 1
+
+
+class TestSelfPlay:
+    """Tests de l'auto-jeu sans affichage"""
+
+    def test_parse_player_config(self):
+        """Une configuration se lit depuis la ligne de commande"""
+        config = PlayerConfig.parse("medium,nodes=500,time=0.5")
+        assert config == PlayerConfig(Difficulty.MEDIUM, time_limit=0.5, node_limit=500)
+        assert config.label == "MEDIUM,time=0.5,nodes=500"
+        with pytest.raises(ValueError):
+            PlayerConfig.parse("EXPERT")
+        with pytest.raises(ValueError):
+            PlayerConfig.parse("EASY,depth=3")
+
+    def test_game_is_silent_and_reproducible(self, capsys):
+        """Une partie ne produit aucune sortie et dépend uniquement de sa graine"""
+        easy = PlayerConfig(Difficulty.EASY)
+        first = play_selfplay_game(0, easy, easy, seed=5, random_plies=4, max_moves=30)
+        second = play_selfplay_game(0, easy, easy, seed=5, random_plies=4, max_moves=30)
+
+        assert capsys.readouterr().out == ""
+        assert first == second
+        assert first['plies'] <= 30
+        assert first['result'] in ('WHITE', 'BLACK', 'DRAW')
+
+    def test_results_are_streamed_to_disk(self, tmp_path):
+        """Chaque partie donne une ligne JSON; les couleurs peuvent alterner"""
+        output = tmp_path / "games.jsonl"
+        easy = PlayerConfig(Difficulty.EASY)
+        capped = PlayerConfig(Difficulty.EASY, node_limit=50)
+        archive = tmp_path / "games.bin"
+        tally = run_selfplay(3, easy, capped, str(output), workers=1, max_moves=20, alternate=True,
+                             archive=str(archive))
+
+        games = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert [game['game'] for game in games] == [0, 1, 2]
+        assert games[1]['white'] == capped.label
+        assert sum(tally.values()) == 3
+
+        from storage import ArchiveReader
+        with ArchiveReader(str(archive)) as reader:
+            assert [len(record.moves) for record in reader] == [game['plies'] for game in games]
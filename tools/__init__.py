@@ -0,0 +1,4 @@
+"""
+Outils en ligne de commande (mesure et vérification du moteur)
+Usage: python -m tools.<outil> --help
+"""
@@ -0,0 +1,172 @@
+"""
+Benchmark reproductible du moteur
+
+Chaque niveau de difficulté cherche un coup sur un jeu fixe et versionné de
+positions (ouverture, milieu de partie, finale), plusieurs fois. Le rapport
+(médiane des nœuds/s, temps jusqu'à la profondeur, total des nœuds) est
+écrit en JSON; il peut être comparé à un rapport de référence, et le
+benchmark échoue si une régression dépasse le seuil.
+
+Usage:
+    python -m tools.benchmark
+    python -m tools.benchmark --repeat 5 --output bench.json
+    python -m tools.benchmark --baseline bench.json --threshold 0.10
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+from typing import Dict, List
+
+from ai.ai_player import AIPlayer, Difficulty
+from models.notation import board_from_fen
+
+# À incrémenter à chaque modification des positions: les rapports de
+# versions différentes ne sont pas comparables
+BENCHMARK_VERSION = 1
+
+# nom -> (phase, FEN PDN)
+BENCHMARK_POSITIONS = {
+    'initial': ('opening', "W:W21,22,23,24,25,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,9,10,11,12"),
+    'opening-4': ('opening', "W:W21,22,24,25,26,27,28,29,30,31,32:B1,2,3,4,6,7,8,10,11,12,14"),
+    'middlegame-16': ('middlegame', "W:W19,20,21,22,23,24,25,28,29,30:B1,2,3,4,5,8,10,12,14,15"),
+    'middlegame-24': ('middlegame', "W:W13,14,15,21,22,25,27,28,30,32:B1,5,6,8,10,16"),
+    'endgame-pawns': ('endgame', "W:W13,21,29,32:B1,7,8,12,K30"),
+    'endgame-kings': ('endgame', "B:WK1,17,K30:BK4,12,K29"),
+}
+
+
+def run_benchmark(
+    difficulties: List[Difficulty],
+    repeat: int = 3,
+    positions: Dict[str, tuple] = BENCHMARK_POSITIONS
+) -> dict:
+    """
+    Lance le benchmark et retourne le rapport (sérialisable en JSON)
+
+    Chaque recherche part d'un joueur neuf (table de transposition vide):
+    le nombre de nœuds ne dépend que du moteur, seul le temps varie.
+    """
+    results = []
+    summary = {}
+
+    for difficulty in difficulties:
+        rates = []
+        total_nodes = 0
+        for name, (phase, fen) in positions.items():
+            times = []
+            for _ in range(repeat):
+                player = AIPlayer(difficulty)
+                player.choose_move(board_from_fen(fen))
+                stats = player.get_stats()
+                times.append(stats.time_seconds)
+
+            nodes = stats.nodes_explored + stats.quiescence_nodes
+            median_time = statistics.median(times)
+            rate = nodes / median_time if median_time > 0 else 0.0
+            rates.append(rate)
+            total_nodes += nodes
+            results.append({
+                'difficulty': difficulty.name,
+                'position': name,
+                'phase': phase,
+                'depth': stats.depth_reached,
+                'nodes': nodes,
+                'median_time_seconds': median_time,
+                'median_nodes_per_second': rate,
+            })
+
+        summary[difficulty.name] = {
+            'total_nodes': total_nodes,
+            'median_nodes_per_second': statistics.median(rates),
+        }
+
+    return {
+        'version': BENCHMARK_VERSION,
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'results': results,
+        'summary': summary,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Compare un rapport à une référence
+
+    Une régression est une vitesse médiane (nœuds/s) inférieure, ou un total
+    de nœuds supérieur, de plus de `threshold` (fraction) à la référence.
+
+    Returns:
+        La liste des régressions (vide si aucune)
+    """
+    if baseline.get('version') != report['version']:
+        raise ValueError(
+            f"Référence de version {baseline.get('version')}, benchmark en version {report['version']}"
+        )
+
+    regressions = []
+    for difficulty, current in report['summary'].items():
+        reference = baseline['summary'].get(difficulty)
+        if reference is None:
+            continue
+        if current['median_nodes_per_second'] < reference['median_nodes_per_second'] * (1 - threshold):
+            regressions.append(
+                f"{difficulty}: {current['median_nodes_per_second']:,.0f} nœuds/s "
+                f"(référence {reference['median_nodes_per_second']:,.0f})"
+            )
+        if current['total_nodes'] > reference['total_nodes'] * (1 + threshold):
+            regressions.append(
+                f"{difficulty}: {current['total_nodes']} nœuds (référence {reference['total_nodes']})"
+            )
+    return regressions
+
+
+def print_report(report: dict) -> None:
+    """Affiche le rapport sous forme de tableau"""
+    print(f"Benchmark v{report['version']} ({report['repeat']} répétitions, Python {report['python']})")
+    for result in report['results']:
+        print(f"  {result['difficulty']:<7} {result['position']:<15} prof. {result['depth']}  "
+              f"{result['nodes']:>8} nœuds  {result['median_time_seconds']:8.3f}s  "
+              f"{result['median_nodes_per_second']:>10,.0f} nœuds/s")
+    for difficulty, summary in report['summary'].items():
+        print(f"{difficulty:<7} total {summary['total_nodes']:>9} nœuds   "
+              f"médiane {summary['median_nodes_per_second']:>10,.0f} nœuds/s")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark reproductible du moteur")
+    parser.add_argument('--repeat', type=int, default=3, help="répétitions par position (défaut: 3)")
+    parser.add_argument('--difficulty', choices=[level.name for level in Difficulty], action='append',
+                        help="niveau à mesurer (répétable, défaut: tous)")
+    parser.add_argument('--output', help="fichier JSON où écrire le rapport")
+    parser.add_argument('--baseline', help="rapport JSON de référence à comparer")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="régression tolérée, en fraction (défaut: 0.10)")
+    args = parser.parse_args(argv)
+
+    difficulties = [Difficulty[name] for name in args.difficulty] if args.difficulty else list(Difficulty)
+    report = run_benchmark(difficulties, args.repeat)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print("RÉGRESSIONS:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("Aucune régression par rapport à la référence")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+Construction d'une bibliothèque d'ouvertures (voir ai.book)
+
+Usage:
+    python -m tools.build_book --output book.bin
+    python -m tools.build_book --plies 8 --depth 6 --margin 0.3 --output book.bin
+"""
+import argparse
+import sys
+import time
+from typing import List
+
+from ai.book import OpeningBook, build_book
+from ai.evaluators import AdvancedEvaluator
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Construit une bibliothèque d'ouvertures")
+    parser.add_argument('--output', default='book.bin', help="fichier de la bibliothèque")
+    parser.add_argument('--plies', type=int, default=6, help="demi-coups couverts (défaut: 6)")
+    parser.add_argument('--depth', type=int, default=5, help="profondeur de recherche par coup (défaut: 5)")
+    parser.add_argument('--margin', type=float, default=0.5,
+                        help="écart de score toléré avec le meilleur coup (défaut: 0.5)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    entries = build_book(args.output, args.plies, args.depth, AdvancedEvaluator(), args.margin)
+    elapsed = time.perf_counter() - start
+    print(f"{entries} coups écrits dans {args.output} en {elapsed:.1f}s")
+
+    with OpeningBook(args.output) as book:
+        stored = len(book)
+    if stored != entries:
+        print(f"ERREUR: {stored} coups relus dans {args.output} au lieu de {entries}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""
+Construction des tables de finales (voir ai.tablebase)
+
+Une génération interrompue peut être relancée: les tables déjà écrites
+sont conservées.
+
+Usage:
+    python -m tools.build_tablebase --output tables --pieces 4
+    python -m tools.build_tablebase --output tables --pieces 5 --workers 8 --wdl-only
+"""
+import argparse
+import sys
+import time
+from typing import List
+
+from ai.tablebase import Tablebase, build_tablebase
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Construit les tables de finales")
+    parser.add_argument('--output', default='tablebase', help="répertoire des tables")
+    parser.add_argument('--pieces', type=int, default=4, help="nombre maximal de pièces (défaut: 4)")
+    parser.add_argument('--workers', type=int, help="processus (défaut: tous les cœurs)")
+    parser.add_argument('--wdl-only', action='store_true',
+                        help="gain/nulle/perte seulement, sans les distances")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    built = build_tablebase(args.output, args.pieces, args.workers, distance=not args.wdl_only)
+    elapsed = time.perf_counter() - start
+    with Tablebase(args.output) as tablebase:
+        print(f"{len(built)} tables construites en {elapsed:.1f}s "
+              f"({len(tablebase)} tables dans {args.output}, jusqu'à {tablebase.max_pieces} pièces)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark de l'énumération des rafles (fins de partie à dames)
+
+Mesure GameState.generate_legal_moves sur des positions où des dames ont
+de longues rafles à distance, là où l'énumération des séquences domine.
+
+Usage:
+    python -m tools.capture_bench
+    python -m tools.capture_bench --repeat 2000
+"""
+import argparse
+import sys
+import time
+from typing import List
+
+from models.game_state import GameState
+from models.notation import board_from_fen
+
+# Fins de partie à dames avec rafles multiples obligatoires (FEN PDN)
+CAPTURE_POSITIONS = {
+    # Deux dames blanches, dames et pions noirs espacés: beaucoup de rafles
+    'two-kings': "W:WK20,K28:B3,K16,17,K18,K24,25,K26,32",
+    # Dame seule face à une défense serrée
+    'lone-king': "W:WK2:BK3,9,11,12,14,15,22,K23,27,30,K32",
+    # Trois dames blanches qui se disputent les mêmes victimes
+    'three-kings': "W:WK2,K12,K29:BK10,14,15,16,K17,21,24,K25,26",
+    # Trois dames, pièces noires dispersées jusqu'aux bords
+    'open-board': "W:WK4,K14,K31:B7,9,K15,K22,23,24,25",
+}
+
+
+def bench_position(fen: str, repeat: int) -> tuple[int, float]:
+    """Retourne (nombre de coups, microsecondes par génération)"""
+    game_state = GameState(board_from_fen(fen))
+    count = len(game_state.generate_legal_moves())
+    start = time.perf_counter()
+    for _ in range(repeat):
+        game_state.generate_legal_moves()
+    elapsed = time.perf_counter() - start
+    return count, elapsed / repeat * 1e6
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark des rafles de dames")
+    parser.add_argument('--repeat', type=int, default=500, help="générations par position (défaut: 500)")
+    args = parser.parse_args(argv)
+
+    total = 0.0
+    for name, fen in CAPTURE_POSITIONS.items():
+        count, micros = bench_position(fen, args.repeat)
+        total += micros
+        print(f"{name:<10} {count:>5} coups   {micros:10.1f} µs/génération")
+    print(f"{'total':<10} {'':>11}   {total:10.1f} µs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
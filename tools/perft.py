@@ -0,0 +1,92 @@
+"""
+Perft: compte les feuilles de l'arbre des coups légaux à profondeur N
+
+Sert à vérifier le générateur de coups (GameState.generate_legal_moves)
+et à mesurer sa vitesse.
+
+Usage:
+    python -m tools.perft --depth 6
+    python -m tools.perft --position kings --depth 4 --divide
+    python -m tools.perft --fen "W:WK18:B6,7,14,15" --depth 3
+"""
+import argparse
+import sys
+import time
+from typing import List, Tuple
+
+from models.board import Board
+from models.move import Move
+from models.game_state import GameState
+from models.notation import board_from_fen, board_to_fen
+
+# Positions de référence (FEN PDN, voir models.notation)
+PERFT_POSITIONS = {
+    'initial': board_to_fen(Board.initial_board()),
+    # Dame blanche au centre entourée de pions: rafles à distance dans 4 directions
+    'kings': "W:WK18:B6,7,14,15,22,23",
+    # Pion blanc qui se promeut en pleine rafle et continue comme dame
+    'promotion': "W:W9,29,30:B6,7,K26",
+    # Fin de partie à dames: beaucoup de glissades
+    'endgame': "B:WK1,17,K30:BK4,12,K29",
+}
+
+
+def perft(board: Board, depth: int) -> int:
+    """Nombre de positions atteintes en exactement `depth` demi-coups"""
+    if depth == 0:
+        return 1
+
+    moves = GameState(board).generate_legal_moves()
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        undo = board.apply_move(move)
+        nodes += perft(board, depth - 1)
+        board.undo_move(undo)
+    return nodes
+
+
+def perft_divide(board: Board, depth: int) -> List[Tuple[Move, int]]:
+    """Perft détaillé par coup de la racine"""
+    results = []
+    for move in GameState(board).generate_legal_moves():
+        undo = board.apply_move(move)
+        results.append((move, perft(board, depth - 1)))
+        board.undo_move(undo)
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Perft du générateur de coups")
+    parser.add_argument('--depth', type=int, default=5, help="profondeur (défaut: 5)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--position', choices=sorted(PERFT_POSITIONS), default='initial',
+                        help="position de référence")
+    source.add_argument('--fen', help="position en FEN PDN")
+    parser.add_argument('--divide', action='store_true', help="détail par coup de la racine")
+    args = parser.parse_args(argv)
+
+    fen = args.fen or PERFT_POSITIONS[args.position]
+    board = board_from_fen(fen)
+    print(f"Position: {fen}")
+
+    for depth in range(1, args.depth + 1):
+        start = time.perf_counter()
+        if args.divide and depth == args.depth:
+            divide = perft_divide(board, depth)
+            for move, count in divide:
+                print(f"  {move}: {count}")
+            nodes = sum(count for _, count in divide)
+        else:
+            nodes = perft(board, depth)
+        elapsed = time.perf_counter() - start
+        rate = nodes / elapsed if elapsed > 0 else float('inf')
+        print(f"perft({depth}) = {nodes:>10}   {elapsed:8.3f}s   {rate:12,.0f} nœuds/s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
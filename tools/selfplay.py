@@ -0,0 +1,252 @@
+"""
+Auto-jeu sans affichage: N parties entre deux configurations d'IA
+
+Les parties sont réparties sur un pool de processus; chaque partie est
+écrite dans le fichier de sortie (une ligne JSON par partie) dès qu'elle se
+termine. Les ouvertures peuvent être tirées au hasard (graine par partie:
+les parties sont reproductibles), et un plafond de coups évite les parties
+sans fin.
+
+Configurations de joueur: "HARD", "MEDIUM,nodes=20000", "HARD,time=0.5,tt=32",
+"HARD,book=book.bin" (coups de la bibliothèque tirés au hasard selon leurs poids),
+"HARD,tb=tables/" (tables de finales, voir ai.tablebase)
+
+Usage:
+    python -m tools.selfplay --white HARD --black MEDIUM --games 100 --output games.jsonl
+    python -m tools.selfplay --white HARD --black HARD,nodes=5000 --random-plies 4 --alternate
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+from ai.ai_player import AIPlayer, Difficulty
+from ai.search import SearchStats
+from interfaces.game_listener import IGameListener
+from models.board import Board
+from models.game import Game
+from models.game_state import GameState
+from models.move import Move
+from models.notation import board_to_fen, move_to_pdn
+from storage.archive import ArchiveWriter, GameRecord
+
+
+@dataclass(frozen=True)
+class PlayerConfig:
+    """Configuration d'un joueur IA (transmissible aux processus du pool)"""
+    difficulty: Difficulty
+    time_limit: float | None = None
+    node_limit: int | None = None
+    tt_size_mb: float = 16
+    book: str | None = None
+    tablebase: str | None = None
+
+    @classmethod
+    def parse(cls, spec: str) -> "PlayerConfig":
+        """Lit une configuration "NIVEAU[,time=s][,nodes=n][,tt=mb][,book=fichier][,tb=répertoire]" """
+        name, *options = spec.split(',')
+        try:
+            config = {'difficulty': Difficulty[name.strip().upper()]}
+        except KeyError:
+            raise ValueError(f"Niveau inconnu: {name!r}") from None
+        keys = {'time': ('time_limit', float), 'nodes': ('node_limit', int), 'tt': ('tt_size_mb', float),
+                'book': ('book', str), 'tb': ('tablebase', str)}
+        for option in options:
+            key, _, value = option.partition('=')
+            if key.strip() not in keys:
+                raise ValueError(f"Option de joueur inconnue: {option!r}")
+            field_name, convert = keys[key.strip()]
+            config[field_name] = convert(value)
+        return cls(**config)
+
+    @property
+    def label(self) -> str:
+        parts = [self.difficulty.name]
+        if self.time_limit is not None:
+            parts.append(f"time={self.time_limit}")
+        if self.node_limit is not None:
+            parts.append(f"nodes={self.node_limit}")
+        if self.tt_size_mb != 16:
+            parts.append(f"tt={self.tt_size_mb}")
+        if self.book is not None:
+            parts.append(f"book={self.book}")
+        if self.tablebase is not None:
+            parts.append(f"tb={self.tablebase}")
+        return ','.join(parts)
+
+    def create(self, seed: int | None = None) -> AIPlayer:
+        """Crée le joueur (seed: graine du tirage dans la bibliothèque)"""
+        return AIPlayer(self.difficulty, self.tt_size_mb, self.time_limit, self.node_limit,
+                        book_path=self.book, book_random=True, book_seed=seed,
+                        tablebase_path=self.tablebase)
+
+
+def play_selfplay_game(
+    index: int,
+    white: PlayerConfig,
+    black: PlayerConfig,
+    seed: int,
+    random_plies: int = 0,
+    max_moves: int = 200
+) -> dict:
+    """
+    Joue une partie sans aucun affichage
+
+    random_plies: Demi-coups d'ouverture tirés au hasard (graine `seed`)
+    max_moves: Plafond de demi-coups (ouverture comprise), partie nulle au-delà
+
+    Returns:
+        Le résultat de la partie (sérialisable en JSON)
+    """
+    return _play_game(index, white, black, seed, random_plies, max_moves)[0]
+
+
+def _play_game(
+    index: int,
+    white: PlayerConfig,
+    black: PlayerConfig,
+    seed: int,
+    random_plies: int,
+    max_moves: int
+) -> Tuple[dict, GameRecord]:
+    """Joue une partie: (résultat JSON, partie complète pour l'archive)"""
+    rng = random.Random(seed)
+    board = Board.initial_board()
+    game_state = GameState(board)
+    moves: List[Move] = []
+
+    # Ouverture aléatoire
+    while len(moves) < random_plies and not game_state.is_game_over():
+        move = rng.choice(game_state.generate_legal_moves())
+        moves.append(move)
+        game_state.apply_move(move)
+    opening = board_to_fen(board)
+
+    # La partie elle-même: aucun affichage, seul l'enregistreur observe
+    recorder = _GameRecorder(moves)
+    white_player, black_player = white.create(rng.getrandbits(32)), black.create(rng.getrandbits(32))
+    game = Game(white_player, black_player, [recorder], board, max(max_moves - len(moves), 0))
+    result = game.play()
+    white_player.close()
+    black_player.close()
+
+    summary = {
+        'game': index,
+        'seed': seed,
+        'white': white.label,
+        'black': black.label,
+        'opening': opening,
+        'result': result.winner.name if result.winner is not None else 'DRAW',
+        'reason': result.reason,
+        'plies': len(moves),
+        'moves': [move_to_pdn(move) for move in moves],
+        'nodes': recorder.nodes,
+    }
+    return summary, GameRecord(white.label, black.label, result.winner, result.reason, moves)
+
+
+class _GameRecorder(IGameListener):
+    """Enregistre les coups et les nœuds explorés par chaque camp"""
+
+    def __init__(self, moves: List[Move]):
+        self.moves = moves
+        self.nodes = {'WHITE': 0, 'BLACK': 0}
+
+    def on_search_stats(self, game: Game, stats: SearchStats) -> None:
+        self.nodes[game.board.current_player.name] += stats.nodes_explored + stats.quiescence_nodes
+
+    def on_move_played(self, game: Game, move: Move) -> None:
+        self.moves.append(move)
+
+
+def _play_task(task: tuple) -> Tuple[dict, GameRecord]:
+    return _play_game(*task)
+
+
+def run_selfplay(
+    games: int,
+    first: PlayerConfig,
+    second: PlayerConfig,
+    output: str,
+    workers: int | None = None,
+    seed: int = 0,
+    random_plies: int = 0,
+    max_moves: int = 200,
+    alternate: bool = False,
+    archive: str | None = None
+) -> Dict[str, int]:
+    """
+    Joue `games` parties et écrit chaque résultat dans `output` (JSONL)
+
+    alternate: Échanger les couleurs une partie sur deux
+    archive: Archive binaire (storage.archive) où ajouter aussi chaque partie
+    workers: Nombre de processus (défaut: tous les cœurs, 1 = dans ce processus)
+
+    Returns:
+        Décompte des résultats par configuration ('draw' pour les nulles)
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = []
+    for index in range(games):
+        white, black = (second, first) if alternate and index % 2 else (first, second)
+        tasks.append((index, white, black, seed + index, random_plies, max_moves))
+
+    tally = {first.label: 0, second.label: 0, 'draw': 0}
+    if first.label == second.label:
+        tally = {'WHITE': 0, 'BLACK': 0, 'draw': 0}
+
+    writer = ArchiveWriter(archive) if archive else None
+    with open(output, 'w', encoding='utf-8') as stream:
+        for game, record in _results(tasks, workers):
+            stream.write(json.dumps(game) + '\n')
+            stream.flush()
+            if writer is not None:
+                writer.append(record)
+            if game['result'] == 'DRAW':
+                tally['draw'] += 1
+            elif first.label == second.label:
+                tally[game['result']] += 1
+            else:
+                tally[game[game['result'].lower()]] += 1
+    if writer is not None:
+        writer.close()
+    return tally
+
+
+def _results(tasks: List[tuple], workers: int) -> Iterator[Tuple[dict, GameRecord]]:
+    """Résultats des parties au fur et à mesure qu'elles se terminent"""
+    if workers == 1:
+        yield from map(_play_task, tasks)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(_play_task, tasks)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Auto-jeu sans affichage entre deux IA")
+    parser.add_argument('--white', type=PlayerConfig.parse, required=True, help="configuration du premier joueur")
+    parser.add_argument('--black', type=PlayerConfig.parse, required=True, help="configuration du second joueur")
+    parser.add_argument('--games', type=int, default=10, help="nombre de parties (défaut: 10)")
+    parser.add_argument('--workers', type=int, help="processus (défaut: tous les cœurs)")
+    parser.add_argument('--random-plies', type=int, default=0, help="demi-coups d'ouverture aléatoires")
+    parser.add_argument('--max-moves', type=int, default=200, help="plafond de demi-coups (défaut: 200)")
+    parser.add_argument('--seed', type=int, default=0, help="graine de la première partie")
+    parser.add_argument('--alternate', action='store_true', help="échanger les couleurs une partie sur deux")
+    parser.add_argument('--output', default='selfplay.jsonl', help="fichier JSONL des parties")
+    parser.add_argument('--archive', help="archive binaire où ajouter aussi les parties")
+    parser.add_argument('--quiet', action='store_true', help="n'affiche pas le décompte final")
+    args = parser.parse_args(argv)
+
+    tally = run_selfplay(args.games, args.white, args.black, args.output, args.workers,
+                         args.seed, args.random_plies, args.max_moves, args.alternate, args.archive)
+    if not args.quiet:
+        print(' | '.join(f"{name}: {count}" for name, count in tally.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())